@@ -8,14 +8,12 @@ def BuildPython () -> bool:
 	if not Python.CanBuildPython():
 		return False
 
-	IO.ClearDirectory(Paths.PythonBuildArchivePath)
-	IO.ClearDirectory(Paths.PythonBuildLoosePath)
-
 	Python.BuildPython(Paths.PythonBuildLoosePath,
 					   Mod.GetCurrentMod().PythonBuildArchiveFilePath,
 					   Mod.GetCurrentMod().PythonSourceRootPath,
 					   Mod.GetCurrentMod().PythonSourceTargetPath,
-					   Mod.GetCurrentMod().PythonSourceExcludedFiles)
+					   Mod.GetCurrentMod().PythonSourceExcludedFiles,
+					   manifestFilePath = Paths.PythonBuildManifestFilePath)
 
 	if not os.path.exists(Mod.GetCurrentMod().PythonMergeRoot):
 		os.makedirs(Mod.GetCurrentMod().PythonMergeRoot)
@@ -23,3 +21,18 @@ def BuildPython () -> bool:
 	shutil.copy(Mod.GetCurrentMod().PythonBuildArchiveFilePath, Mod.GetCurrentMod().PythonMergeRoot)
 
 	return True
+
+def BuildPythonEverything () -> bool:
+	if not Python.CanBuildPython():
+		return False
+
+	if os.path.exists(Paths.PythonBuildManifestFilePath):
+		os.remove(Paths.PythonBuildManifestFilePath)
+
+	if os.path.exists(Paths.PythonBuildLoosePath):
+		IO.ClearDirectory(Paths.PythonBuildLoosePath)
+
+	if os.path.exists(Paths.PythonBuildArchivePath):
+		IO.ClearDirectory(Paths.PythonBuildArchivePath)
+
+	return BuildPython()
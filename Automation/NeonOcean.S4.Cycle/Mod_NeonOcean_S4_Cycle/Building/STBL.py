@@ -1,15 +1,10 @@
-import json
 import os
 import shutil
-import sys
 import typing
 from distutils import dir_util
 
-from Mod_NeonOcean_S4_Cycle import Mod
-from Mod_NeonOcean_S4_Cycle.Tools import Exceptions, STBL
-
-ManifestBuiltModifiedTimeKey = "BuiltModifiedTime"  # type: str
-ManifestBuiltFileNamesKey = "BuiltFileNames"  # type: str
+from Mod_NeonOcean_S4_Cycle import Mod, Paths
+from Mod_NeonOcean_S4_Cycle.Tools import BuildCache, STBL
 
 def BuildSTBLChanges () -> bool:
 	canBuildSTBL = STBL.CanBuildSTBL()  # type: bool
@@ -17,91 +12,27 @@ def BuildSTBLChanges () -> bool:
 	if not canBuildSTBL:
 		return False
 
-	for package in Mod.GetCurrentMod().Packages:  # type: Mod.Package
-		if not os.path.exists(package.STBLPath):
-			continue
-
-		for stblXMLFileName in os.listdir(package.STBLPath):  # type: str
-			stblXMLFilePath = os.path.join(package.STBLPath, stblXMLFileName)  # type: str
-
-			if os.path.isfile(stblXMLFilePath) and os.path.splitext(stblXMLFileName)[1].casefold() == ".xml":
-				manifestFilePath = os.path.splitext(stblXMLFilePath)[0] + "_Manifest.json"  # type: str
-
-				modifiedTime = os.path.getmtime(stblXMLFilePath)  # type: float
-				builtModifiedTime = None  # type: typing.Optional[int]
-				builtFileNames = list()  # type: typing.List[str]
-
-				try:
-					if os.path.exists(manifestFilePath):
-						with open(manifestFilePath) as manifestFile:
-							manifest = json.JSONDecoder().decode(manifestFile.read())  # type: typing.Dict[str, typing.Any]
-
-						if not isinstance(manifest, dict):
-							raise Exceptions.IncorrectTypeException(manifest, "Root", (dict,))
-
-						if ManifestBuiltModifiedTimeKey in manifest:
-							builtModifiedTime = manifest[ManifestBuiltModifiedTimeKey]
-
-						if not isinstance(builtModifiedTime, float) and not isinstance(builtModifiedTime, int):
-							incorrectValue = builtModifiedTime  # type: typing.Any
-							builtModifiedTime = None
-							raise Exceptions.IncorrectTypeException(incorrectValue, "Root[%s]" % ManifestBuiltModifiedTimeKey, (dict,))
-
-						if ManifestBuiltFileNamesKey in manifest:
-							builtFileNames = manifest[ManifestBuiltFileNamesKey]
-
-						if not isinstance(builtFileNames, list):
-							incorrectValue = builtFileNames  # type: typing.Any
-							builtFileNames = list()
-							raise Exceptions.IncorrectTypeException(incorrectValue, "Root[%s]" % ManifestBuiltFileNamesKey, (dict,))
-
-						for builtFileNameIndex in range(len(builtFileNames)):  # type: int
-							builtFileName = builtFileNames[builtFileNameIndex]  # type: str
-
-							if not isinstance(builtFileName, str):
-								builtFileNames = list()
-								raise Exceptions.IncorrectTypeException(builtFileName, "Root[%s][%s]" % (ManifestBuiltFileNamesKey, builtFileNameIndex), (dict,))
-
-				except Exception as e:
-					print("Failed to read STBL manifest file at '" + manifestFilePath + "'\n" + str(e), file = sys.stderr)
+	buildCache = BuildCache.BuildCache(Paths.BuildCacheFilePath)  # type: BuildCache.BuildCache
+	toolVersion = STBL.GetBuildSTBLApplicationName()  # type: str
 
-				missingBuiltFile = False  # type: bool
-
-				for builtFileName in builtFileNames:
-					builtFilePath = os.path.join(os.path.join(package.SourceLoosePath, "STBL"), builtFileName)  # type: str
-
-					if not os.path.exists(builtFilePath):
-						missingBuiltFile = True
-						break
-
-				if missingBuiltFile or modifiedTime != builtModifiedTime:
-					buildTempDirectory = stblXMLFilePath + "_Temp_Build"  # type: str
-
-					if not os.path.exists(buildTempDirectory):
-						os.makedirs(buildTempDirectory)
-
-					try:
-						STBL.BuildSTBL(buildTempDirectory, stblXMLFilePath)
-
-						manifest = dict()  # type: typing.Dict[str, typing.Any]
-
-						manifest[ManifestBuiltModifiedTimeKey] = modifiedTime
-						builtFileNames = list()
+	for package in Mod.GetCurrentMod().Packages:  # type: Mod.Package
+		for stblXMLFilePath in _GetSTBLXMLFilePaths(package):  # type: str
+			targetKey = _GetSTBLTargetKey(package, stblXMLFilePath)  # type: str
+			inputHashes = { os.path.basename(stblXMLFilePath): BuildCache.GetFileHash(stblXMLFilePath) }  # type: typing.Dict[str, str]
 
-						for builtFileName in os.listdir(buildTempDirectory):
-							builtFilePath = os.path.join(buildTempDirectory, builtFileName)
+			missingBuiltFile = False  # type: bool
 
-							if os.path.isfile(builtFilePath):
-								builtFileNames.append(builtFileName)
+			for builtFileName in buildCache.GetOutputs(targetKey):  # type: str
+				builtFilePath = os.path.join(os.path.join(package.SourceLoosePath, "STBL"), builtFileName)  # type: str
 
-						manifest[ManifestBuiltFileNamesKey] = builtFileNames
+				if not os.path.exists(builtFilePath):
+					missingBuiltFile = True
+					break
 
-						with open(manifestFilePath, "w+") as manifestFile:
-							manifestFile.write(json.JSONEncoder(indent = "\t").encode(manifest))
+			if not missingBuiltFile and len(buildCache.GetChangedInputs(targetKey, inputHashes, toolVersion)) == 0:
+				continue
 
-						dir_util.copy_tree(buildTempDirectory, os.path.join(package.SourceLoosePath, "STBL"))
-					finally:
-						shutil.rmtree(buildTempDirectory)
+			_BuildSTBLInternal(package, stblXMLFilePath, buildCache, inputHashes, toolVersion)
 
 	return True
 
@@ -111,42 +42,54 @@ def BuildSTBLEverything () -> bool:
 	if not canBuildSTBL:
 		return False
 
+	buildCache = BuildCache.BuildCache(Paths.BuildCacheFilePath)  # type: BuildCache.BuildCache
+	toolVersion = STBL.GetBuildSTBLApplicationName()  # type: str
+
 	for package in Mod.GetCurrentMod().Packages:  # type: Mod.Package
-		if not os.path.exists(package.STBLPath):
-			continue
+		for stblXMLFilePath in _GetSTBLXMLFilePaths(package):  # type: str
+			inputHashes = { os.path.basename(stblXMLFilePath): BuildCache.GetFileHash(stblXMLFilePath) }  # type: typing.Dict[str, str]
+			_BuildSTBLInternal(package, stblXMLFilePath, buildCache, inputHashes, toolVersion)
 
-		for stblXMLFileName in os.listdir(package.STBLPath):  # type: str
-			stblXMLFilePath = os.path.join(package.STBLPath, stblXMLFileName)  # type: str
+	return True
 
-			if os.path.isfile(stblXMLFilePath) and os.path.splitext(stblXMLFileName)[1].casefold() == ".xml":
-				modifiedTime = os.path.getmtime(stblXMLFilePath)  # type: float
-				manifestFilePath = os.path.splitext(stblXMLFilePath)[0] + "_Manifest.json"  # type: str
+def _GetSTBLTargetKey (package: Mod.Package, stblXMLFilePath: str) -> str:
+	return "STBL/" + package.Name + "/" + os.path.basename(stblXMLFilePath)
 
-				buildTempDirectory = stblXMLFilePath + "_Temp_Build"  # type: str
+def _GetSTBLXMLFilePaths (package: Mod.Package) -> typing.List[str]:
+	stblXMLFilePaths = list()  # type: typing.List[str]
 
-				if not os.path.exists(buildTempDirectory):
-					os.makedirs(buildTempDirectory)
-				try:
-					STBL.BuildSTBL(buildTempDirectory, stblXMLFilePath)
+	if not os.path.exists(package.STBLPath):
+		return stblXMLFilePaths
 
-					manifest = dict()  # type: typing.Dict[str, typing.Any]
+	for stblXMLFileName in sorted(os.listdir(package.STBLPath)):  # type: str
+		stblXMLFilePath = os.path.join(package.STBLPath, stblXMLFileName)  # type: str
 
-					manifest[ManifestBuiltModifiedTimeKey] = modifiedTime
-					builtFileNames = list()
+		if os.path.isfile(stblXMLFilePath) and os.path.splitext(stblXMLFileName)[1].casefold() == ".xml":
+			stblXMLFilePaths.append(stblXMLFilePath)
 
-					for builtFileName in os.listdir(buildTempDirectory):
-						builtFilePath = os.path.join(buildTempDirectory, builtFileName)
+	return stblXMLFilePaths
 
-						if os.path.isfile(builtFilePath):
-							builtFileNames.append(builtFileName)
+def _BuildSTBLInternal (package: Mod.Package, stblXMLFilePath: str, buildCache: BuildCache.BuildCache, inputHashes: typing.Dict[str, str], toolVersion: str) -> None:
+	targetKey = _GetSTBLTargetKey(package, stblXMLFilePath)  # type: str
+	buildTempDirectory = stblXMLFilePath + "_Temp_Build"  # type: str
 
-					manifest[ManifestBuiltFileNamesKey] = builtFileNames
+	if not os.path.exists(buildTempDirectory):
+		os.makedirs(buildTempDirectory)
 
-					with open(manifestFilePath, "w+") as manifestFile:
-						manifestFile.write(json.JSONEncoder(indent = "\t").encode(manifest))
+	try:
+		STBL.BuildSTBL(buildTempDirectory, stblXMLFilePath)
 
-					dir_util.copy_tree(buildTempDirectory, os.path.join(package.SourceLoosePath, "STBL"))
-				finally:
-					shutil.rmtree(buildTempDirectory)
+		builtFileNames = list()  # type: typing.List[str]
 
-	return True
+		for builtFileName in sorted(os.listdir(buildTempDirectory)):  # type: str
+			builtFilePath = os.path.join(buildTempDirectory, builtFileName)  # type: str
+
+			if os.path.isfile(builtFilePath):
+				builtFileNames.append(builtFileName)
+
+		dir_util.copy_tree(buildTempDirectory, os.path.join(package.SourceLoosePath, "STBL"))
+
+		buildCache.SetTarget(targetKey, inputHashes, toolVersion, outputs = builtFileNames)
+		buildCache.Save()
+	finally:
+		shutil.rmtree(buildTempDirectory)
@@ -121,7 +121,7 @@ _modBuildModes = {
 
 	"Rebuild": [
 		# Misc.BuildMisc,
-		Python.BuildPython,
+		Python.BuildPythonEverything,
 		STBL.BuildSTBLEverything,
 		Package.BuildPackageEverything,
 		Information.BuildInformation,
@@ -75,7 +75,6 @@ class Package:
 		self.PackagePath = os.path.join(modPath, "Packages", self.Name)  # type: str
 		self.BuildPath = os.path.join(self.PackagePath, "Build")  # type: str
 		self.BuildFilePath = os.path.join(self.BuildPath, self.FileName)  # type: str
-		self.BuildManifestFilePath = os.path.join(self.BuildPath, self.Name + "_Manifest.json")  # type: str
 		self.MergeRoot = os.path.join(modBuildPath, mergeRoot)  # type: str
 		self.SourcePath = os.path.join(self.PackagePath, "Sources")  # type: str
 		self.SourceLoosePath = os.path.join(self.SourcePath, "Loose")  # type: str
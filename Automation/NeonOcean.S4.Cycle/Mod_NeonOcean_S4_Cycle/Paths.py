@@ -25,6 +25,7 @@ S4ModsPath = os.path.join(S4UserDataPath, "Mods")  # type: str
 AutomationPath = os.path.dirname(os.path.dirname(os.path.dirname(os.path.normpath(__file__))))  # type: str
 RootPath = os.path.dirname(AutomationPath)  # type: str
 BuildPath = os.path.join(RootPath, "Build")  # type: str
+BuildCacheFilePath = os.path.join(RootPath, "Build_Cache.json")  # type: str
 LoosePath = os.path.join(RootPath, "Loose")  # type: str
 InformationPath = os.path.join(RootPath, "Information")  # type: str
 InformationBuildPath = os.path.join(InformationPath, "Build")  # type: str
@@ -41,3 +42,4 @@ PythonPath = os.path.join(RootPath, "Python")  # type: str
 PythonBuildPath = os.path.join(PythonPath, "Build")  # type: str
 PythonBuildLoosePath = os.path.join(PythonBuildPath, "Loose")  # type: str
 PythonBuildArchivePath = os.path.join(PythonBuildPath, "Archive")  # type: str
+PythonBuildManifestFilePath = os.path.join(PythonBuildPath, "Manifest.json")  # type: str
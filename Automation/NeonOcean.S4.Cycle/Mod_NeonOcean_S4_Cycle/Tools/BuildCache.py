@@ -0,0 +1,149 @@
+import hashlib
+import os
+import sys
+import typing
+from json import decoder, encoder
+
+_cacheFormatVersion = 1  # type: int
+
+_fileHashes = dict()  # type: typing.Dict[str, typing.Tuple[int, int, str]]  # The hashes already calculated during this run, alongside the size and modified time the file had at the time.
+
+class BuildCache:
+	def __init__ (self, filePath: str):
+		"""
+		A record of the content hashes of the files used to create each build target. A target only needs to be rebuilt if the hash of one of its inputs
+		or the version of the tool used to build it has changed, file modified times are never compared between runs.
+		:param filePath: The path of the json file the cache is kept in.
+		"""
+
+		self.FilePath = filePath  # type: str
+
+		self._targets = dict()  # type: typing.Dict[str, typing.Dict[str, typing.Any]]
+
+		self.Load()
+
+	def Load (self) -> None:
+		self._targets = dict()
+
+		if not os.path.exists(self.FilePath):
+			return
+
+		try:
+			with open(self.FilePath) as cacheFile:
+				cache = decoder.JSONDecoder().decode(cacheFile.read())
+		except Exception as e:
+			print("Failed to read build cache file at '" + self.FilePath + "'\n" + str(e), file = sys.stderr)
+			return
+
+		if not isinstance(cache, dict) or cache.get("Version", None) != _cacheFormatVersion or not isinstance(cache.get("Targets", None), dict):
+			return
+
+		self._targets = cache["Targets"]
+
+	def Save (self) -> None:
+		if not os.path.exists(os.path.dirname(self.FilePath)):
+			os.makedirs(os.path.dirname(self.FilePath))
+
+		cache = {
+			"Version": _cacheFormatVersion,
+			"Targets": self._targets
+		}
+
+		with open(self.FilePath, "w+") as cacheFile:
+			cacheFile.write(encoder.JSONEncoder(indent = "\t", sort_keys = True).encode(cache))
+
+	def GetChangedInputs (self, targetKey: str, inputHashes: typing.Dict[str, str], toolVersion: str) -> typing.Set[str]:
+		"""
+		Get the names of every input that has been added, removed, or changed since this target was last built. Every input name will be returned if the
+		target has never been built or was built with a different tool version.
+		"""
+
+		target = self._targets.get(targetKey, None)  # type: typing.Optional[typing.Dict[str, typing.Any]]
+
+		if target is None or target.get("Tool", None) != toolVersion or not isinstance(target.get("Inputs", None), dict):
+			return set(inputHashes.keys())
+
+		builtInputHashes = target["Inputs"]  # type: typing.Dict[str, str]
+		changedInputs = set()  # type: typing.Set[str]
+
+		for inputName, inputHash in inputHashes.items():  # type: str, str
+			if builtInputHashes.get(inputName, None) != inputHash:
+				changedInputs.add(inputName)
+
+		for builtInputName in builtInputHashes.keys():  # type: str
+			if builtInputName not in inputHashes:
+				changedInputs.add(builtInputName)
+
+		return changedInputs
+
+	def GetOutputs (self, targetKey: str) -> typing.List[str]:
+		"""
+		Get the outputs recorded when this target was last built.
+		"""
+
+		target = self._targets.get(targetKey, None)  # type: typing.Optional[typing.Dict[str, typing.Any]]
+
+		if target is None or not isinstance(target.get("Outputs", None), list):
+			return list()
+
+		return list(target["Outputs"])
+
+	def SetTarget (self, targetKey: str, inputHashes: typing.Dict[str, str], toolVersion: str, outputs: typing.Optional[typing.List[str]] = None) -> None:
+		"""
+		Record that this target has been built from these inputs.
+		"""
+
+		self._targets[targetKey] = {
+			"Inputs": dict(inputHashes),
+			"Tool": toolVersion,
+			"Outputs": list(outputs) if outputs is not None else list()
+		}
+
+	def RemoveTarget (self, targetKey: str) -> None:
+		self._targets.pop(targetKey, None)
+
+def GetFileHash (filePath: str) -> str:
+	"""
+	Get the SHA-256 hash of a file's contents. Hashes are remembered for the rest of this run, unless the file's size or modified time changes.
+	"""
+
+	fileStat = os.stat(filePath)  # type: os.stat_result
+	knownHash = _fileHashes.get(filePath, None)  # type: typing.Optional[typing.Tuple[int, int, str]]
+
+	if knownHash is not None and knownHash[0] == fileStat.st_size and knownHash[1] == fileStat.st_mtime_ns:
+		return knownHash[2]
+
+	fileHash = hashlib.sha256()
+
+	with open(filePath, "rb") as file:
+		for fileBlock in iter(lambda: file.read(1048576), b""):  # type: bytes
+			fileHash.update(fileBlock)
+
+	fileHashDigest = fileHash.hexdigest()  # type: str
+	_fileHashes[filePath] = (fileStat.st_size, fileStat.st_mtime_ns, fileHashDigest)
+
+	return fileHashDigest
+
+def GetDirectoryHashes (directoryPath: str, excludedExtensions: typing.Optional[typing.List[str]] = None) -> typing.Dict[str, str]:
+	"""
+	Get the hash of every file in this directory, keyed by the file's path relative to the directory. Relative paths always use forward slashes so
+	that the cache can be shared between platforms.
+	"""
+
+	excludedExtensionsLower = [excludedExtension.lower() for excludedExtension in excludedExtensions] if excludedExtensions is not None else list()  # type: typing.List[str]
+	directoryHashes = dict()  # type: typing.Dict[str, str]
+
+	if not os.path.exists(directoryPath):
+		return directoryHashes
+
+	for directoryRoot, directoryNames, fileNames in os.walk(directoryPath):  # type: str, typing.List[str], typing.List[str]
+		for fileName in fileNames:  # type: str
+			if os.path.splitext(fileName)[1].lower() in excludedExtensionsLower:
+				continue
+
+			filePath = os.path.join(directoryRoot, fileName)  # type: str
+			relativeFilePath = os.path.relpath(filePath, directoryPath).replace(os.path.sep, "/")  # type: str
+
+			directoryHashes[relativeFilePath] = GetFileHash(filePath)
+
+	return directoryHashes
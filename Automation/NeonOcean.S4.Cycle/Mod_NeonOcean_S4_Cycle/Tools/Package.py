@@ -18,6 +18,21 @@ def CanBuildPackage () -> bool:
 
 	return False
 
+def GetBuildPackageApplicationName () -> typing.Optional[str]:
+	"""
+	Get the name and version of the application that will be used to build, this will be None if no such application can be found.
+	"""
+
+	from Automation import Applications
+
+	for applicationName in BuildPackageApplications.keys():  # type: str
+		application = Applications.GetApplication(applicationName)  # type: Applications.Application
+
+		if application.ExecutablePath is not None:
+			return applicationName
+
+	return None
+
 def BuildPackage (buildFilePath: str, baseFilePath: typing.Optional[str] = None, addingFilePaths: typing.Optional[typing.List[str]] = None) -> None:
 	from Automation import Applications
 
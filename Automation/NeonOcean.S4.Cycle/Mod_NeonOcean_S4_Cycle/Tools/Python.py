@@ -1,27 +1,85 @@
+import ast
+import hashlib
 import os
 import py_compile
-import shutil
+import time
 import typing
 import zipfile
+from concurrent import futures
+from importlib import util
+from json import decoder, encoder
+
+_compiledInvalidationMode = py_compile.PycInvalidationMode.UNCHECKED_HASH  # type: py_compile.PycInvalidationMode  # The sources are not shipped with the mod, so there is nothing to check compiled files against.
+_archiveEntryDateTime = (1980, 1, 1, 0, 0, 0)  # type: typing.Tuple[int, int, int, int, int, int]  # The earliest time a zip file can store, used for every entry so the archive only changes if its contents do.
 
 def CanBuildPython () -> bool:
 	return True
 
-def BuildPython (buildLoosePath: str, buildArchivePath: str, sourceRootPath: str, sourceTargetPath: str, excludedFiles: typing.List[str]) -> bool:
-	if os.path.exists(buildLoosePath):
-		shutil.rmtree(buildLoosePath)
+def BuildPython (buildLoosePath: str, buildArchivePath: str, sourceRootPath: str, sourceTargetPath: str, excludedFiles: typing.List[str],
+				 manifestFilePath: typing.Optional[str] = None, workerCount: typing.Optional[int] = None) -> bool:
+
+	"""
+	Compile the python source files and archive them. If a manifest file path is given, only the files whose contents have changed since the last build
+	will be compiled, otherwise every file will be.
+	:param manifestFilePath: The path of the file the hash of each compiled source file is kept in.
+	:param workerCount: The maximum number of processes used to compile files. This will be picked automatically if it is None.
+	"""
+
+	buildStartTime = time.perf_counter()  # type: float
+
+	if not os.path.exists(buildLoosePath):
+		os.makedirs(buildLoosePath)
+
+	interpreterMagic = util.MAGIC_NUMBER.hex() + ":" + _compiledInvalidationMode.name  # type: str  # Files compiled by another interpreter or with another invalidation mode need to be compiled again.
+
+	manifest = _ReadManifest(manifestFilePath, interpreterMagic) if manifestFilePath is not None else dict()  # type: typing.Dict[str, str]
+	currentManifest = dict()  # type: typing.Dict[str, str]
+
+	compilingFiles = list()  # type: typing.List[typing.Tuple[str, str]]
+	expectedCompiledFiles = set()  # type: typing.Set[str]
+
+	for sourceFilePath in _GetUncompiledFiles(sourceTargetPath, excludedFiles):  # type: str
+		relativeSourceFilePath = os.path.relpath(sourceFilePath, sourceRootPath)  # type: str
+		compiledFilePath = os.path.join(buildLoosePath, relativeSourceFilePath) + "c"  # type: str
+
+		sourceHash = _GetSourceHash(sourceFilePath, interpreterMagic)  # type: str
+		currentManifest[relativeSourceFilePath] = sourceHash
+		expectedCompiledFiles.add(os.path.normcase(compiledFilePath))
+
+		if manifest.get(relativeSourceFilePath, None) != sourceHash or not os.path.exists(compiledFilePath):
+			compilingFiles.append((sourceFilePath, compiledFilePath))
 
-	os.makedirs(buildLoosePath)
+	hashingEndTime = time.perf_counter()  # type: float
 
-	for i in _GetUncompiledFiles(sourceTargetPath, excludedFiles):
-		destination = i.replace(sourceRootPath, buildLoosePath) + "c"  # type: str
+	removedFileCount = _RemoveUnexpectedFiles(buildLoosePath, expectedCompiledFiles)  # type: int
 
-		if not os.path.exists(os.path.dirname(destination)):
-			os.makedirs(os.path.dirname(destination))
+	for sourceFilePath, compiledFilePath in compilingFiles:  # type: str, str
+		if not os.path.exists(os.path.dirname(compiledFilePath)):
+			os.makedirs(os.path.dirname(compiledFilePath))
 
-		py_compile.compile(i, cfile = destination)
+	if len(compilingFiles) > 1:
+		with futures.ProcessPoolExecutor(max_workers = workerCount) as compilingExecutor:
+			compilingFutures = [compilingExecutor.submit(_CompileFile, sourceFilePath, compiledFilePath) for sourceFilePath, compiledFilePath in compilingFiles]  # type: typing.List[futures.Future]
 
-	_ZipDirectory(buildLoosePath, buildArchivePath)
+			for compilingFuture in compilingFutures:  # type: futures.Future
+				compilingFuture.result()
+	else:
+		for sourceFilePath, compiledFilePath in compilingFiles:  # type: str, str
+			_CompileFile(sourceFilePath, compiledFilePath)
+
+	compilingEndTime = time.perf_counter()  # type: float
+
+	if len(compilingFiles) != 0 or removedFileCount != 0 or not os.path.exists(buildArchivePath):
+		_WriteArchive(buildLoosePath, buildArchivePath, _GetImportOrder(sourceRootPath, sorted(currentManifest.keys())))
+
+	if manifestFilePath is not None:
+		_WriteManifest(manifestFilePath, interpreterMagic, currentManifest)
+
+	buildEndTime = time.perf_counter()  # type: float
+
+	print("Compiled %s of %s python files in %.2f seconds. (Hashing: %.2fs, Compiling: %.2fs, Archiving: %.2fs)" %
+		  (len(compilingFiles), len(currentManifest), buildEndTime - buildStartTime,
+		   hashingEndTime - buildStartTime, compilingEndTime - hashingEndTime, buildEndTime - compilingEndTime))
 
 	return True
 
@@ -41,18 +99,206 @@ def _GetUncompiledFiles (path: str, excludedFiles: typing.List[str]) -> typing.L
 
 	return uncompiledFiles
 
-def _ZipDirectory (root: str, destination: str) -> None:
+def _GetSourceHash (sourceFilePath: str, interpreterMagic: str) -> str:
+	sourceHash = hashlib.sha256(interpreterMagic.encode("ascii"))
+
+	with open(sourceFilePath, "rb") as sourceFile:
+		sourceHash.update(sourceFile.read())
+
+	return sourceHash.hexdigest()
+
+def _CompileFile (sourceFilePath: str, compiledFilePath: str) -> None:
+	# This needs to stay at the module level, the compiling processes need to be able to find it. Unchecked hashes also keep the source's modification
+	# time out of the compiled file.
+	py_compile.compile(sourceFilePath, cfile = compiledFilePath, doraise = True, invalidation_mode = _compiledInvalidationMode)
+
+def _RemoveUnexpectedFiles (buildLoosePath: str, expectedCompiledFiles: typing.Set[str]) -> int:
+	# Files compiled from sources that have since been removed or excluded would otherwise end up in the archive.
+
+	removedFileCount = 0  # type: int
+
+	for directoryRoot, directoryNames, fileNames in os.walk(buildLoosePath, topdown = False):  # type: str, typing.List[str], typing.List[str]
+		for fileName in fileNames:  # type: str
+			filePath = os.path.join(directoryRoot, fileName)  # type: str
+
+			if os.path.normcase(filePath) not in expectedCompiledFiles:
+				os.remove(filePath)
+				removedFileCount += 1
+
+		if directoryRoot != buildLoosePath and len(os.listdir(directoryRoot)) == 0:
+			os.rmdir(directoryRoot)
+
+	return removedFileCount
+
+def _ReadManifest (manifestFilePath: str, interpreterMagic: str) -> typing.Dict[str, str]:
+	if not os.path.exists(manifestFilePath):
+		return dict()
+
+	try:
+		with open(manifestFilePath) as manifestFile:
+			manifest = decoder.JSONDecoder().decode(manifestFile.read())
+	except Exception:
+		return dict()
+
+	if not isinstance(manifest, dict) or manifest.get("Magic", None) != interpreterMagic or not isinstance(manifest.get("Files", None), dict):
+		return dict()
+
+	return manifest["Files"]
+
+def _WriteManifest (manifestFilePath: str, interpreterMagic: str, files: typing.Dict[str, str]) -> None:
+	if not os.path.exists(os.path.dirname(manifestFilePath)):
+		os.makedirs(os.path.dirname(manifestFilePath))
+
+	manifest = {
+		"Magic": interpreterMagic,
+		"Files": files
+	}
+
+	with open(manifestFilePath, "w+") as manifestFile:
+		manifestFile.write(encoder.JSONEncoder(indent = "\t", sort_keys = True).encode(manifest))
+
+def _GetModuleName (relativeSourceFilePath: str) -> str:
+	moduleName = os.path.splitext(relativeSourceFilePath)[0].replace(os.path.sep, ".")  # type: str
+
+	if moduleName.endswith(".__init__"):
+		moduleName = moduleName[:-len(".__init__")]
+
+	return moduleName
+
+def _GetModuleImports (sourceFilePath: str, moduleName: str, isPackage: bool) -> typing.List[str]:
+	# Every module name this module's import statements may load, in the order they appear. Names that are not modules are filtered out later.
+
+	with open(sourceFilePath, "rb") as sourceFile:
+		try:
+			sourceTree = ast.parse(sourceFile.read(), filename = sourceFilePath)  # type: ast.Module
+		except SyntaxError:
+			return list()
+
+	packageName = moduleName if isPackage else moduleName.rpartition(".")[0]  # type: str
+	importedNames = list()  # type: typing.List[str]
+
+	for node in _GetModuleLevelImports(sourceTree.body):  # type: ast.AST
+		if isinstance(node, ast.Import):
+			for importedAlias in node.names:  # type: ast.alias
+				importedNames.append(importedAlias.name)
+		elif isinstance(node, ast.ImportFrom):
+			if node.level != 0:
+				importedBase = packageName.rsplit(".", node.level - 1)[0] if node.level > 1 else packageName  # type: str
+
+				if node.module is not None:
+					importedBase += "." + node.module
+			else:
+				importedBase = node.module
+
+			importedNames.append(importedBase)
+
+			for importedAlias in node.names:  # type: ast.alias
+				importedNames.append(importedBase + "." + importedAlias.name)
+
+	return importedNames
+
+def _GetModuleLevelImports (statements: typing.List[ast.stmt]) -> typing.List[ast.stmt]:
+	# The import statements that run when the module is first imported, in source order. Imports inside functions only run when the function is called.
+
+	imports = list()  # type: typing.List[ast.stmt]
+
+	for statement in statements:  # type: ast.stmt
+		if isinstance(statement, (ast.Import, ast.ImportFrom)):
+			imports.append(statement)
+		elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+			continue
+		else:
+			for fieldName in ("body", "orelse", "finalbody"):  # type: str
+				imports.extend(_GetModuleLevelImports(getattr(statement, fieldName, list())))
+
+			for handler in getattr(statement, "handlers", list()):  # type: ast.ExceptHandler
+				imports.extend(_GetModuleLevelImports(handler.body))
+
+	return imports
+
+def _GetImportOrder (sourceRootPath: str, relativeSourceFilePaths: typing.List[str]) -> typing.List[str]:
+	# Put the source files in the order the interpreter would first import them, when starting with the top level packages. Import statements are read
+	# statically, as the game's modules cannot be imported outside of the game.
+
+	modules = dict()  # type: typing.Dict[str, str]
+
+	for relativeSourceFilePath in relativeSourceFilePaths:  # type: str
+		modules[_GetModuleName(relativeSourceFilePath)] = relativeSourceFilePath
+
+	importOrder = list()  # type: typing.List[str]
+	visitedModules = set()  # type: typing.Set[str]
+
+	def visitModule (moduleName: str) -> None:
+		if moduleName in visitedModules or moduleName not in modules:
+			return
+
+		visitedModules.add(moduleName)
+
+		parentModuleName = moduleName.rpartition(".")[0]  # type: str
+
+		if parentModuleName != "":
+			visitModule(parentModuleName)
+
+		relativeSourceFilePath = modules[moduleName]  # type: str
+		importOrder.append(relativeSourceFilePath)
+
+		isPackage = os.path.splitext(os.path.basename(relativeSourceFilePath))[0] == "__init__"  # type: bool
+
+		for importedName in _GetModuleImports(os.path.join(sourceRootPath, relativeSourceFilePath), moduleName, isPackage):  # type: str
+			importedNameParts = importedName.split(".")  # type: typing.List[str]
+
+			for importedNamePartIndex in range(1, len(importedNameParts) + 1):  # type: int
+				visitModule(".".join(importedNameParts[:importedNamePartIndex]))
+
+	for moduleName in sorted(modules.keys(), key = lambda name: (name.count("."), name)):  # type: str
+		visitModule(moduleName)
+
+	return importOrder
+
+def _WriteArchive (root: str, destination: str, importOrder: typing.List[str]) -> None:
+	# Entries are written in import order with fixed dates and attributes, building the same files twice will produce the exact same archive. Directory
+	# entries come first, followed by the compiled modules, then anything else found in the root directory.
+
 	if not os.path.exists(os.path.dirname(destination)):
 		os.makedirs(os.path.dirname(destination))
 
-	archive = zipfile.ZipFile(destination, "w")  # type: zipfile.ZipFile
+	directoryPaths = list()  # type: typing.List[str]
+	filePaths = list()  # type: typing.List[str]
 
 	for directoryRoot, directoryNames, fileNames in os.walk(root):  # type: str, typing.List[str], typing.List[str]
 		if directoryRoot != root:
-			archive.write(directoryRoot, arcname = directoryRoot.replace(root + os.path.sep, ""))
+			directoryPaths.append(os.path.relpath(directoryRoot, root))
+
+		for fileName in fileNames:  # type: str
+			filePaths.append(os.path.relpath(os.path.join(directoryRoot, fileName), root))
+
+	orderedFilePaths = list()  # type: typing.List[str]
+	remainingFilePaths = set(filePaths)  # type: typing.Set[str]
+
+	for relativeSourceFilePath in importOrder:  # type: str
+		relativeCompiledFilePath = relativeSourceFilePath + "c"  # type: str
+
+		if relativeCompiledFilePath in remainingFilePaths:
+			orderedFilePaths.append(relativeCompiledFilePath)
+			remainingFilePaths.remove(relativeCompiledFilePath)
+
+	orderedFilePaths.extend(sorted(remainingFilePaths))
+
+	archive = zipfile.ZipFile(destination, "w")  # type: zipfile.ZipFile
+
+	for directoryPath in sorted(directoryPaths):  # type: str
+		directoryInfo = zipfile.ZipInfo(directoryPath.replace(os.path.sep, "/") + "/", date_time = _archiveEntryDateTime)  # type: zipfile.ZipInfo
+		directoryInfo.external_attr = (0o40755 << 16) | 0x10
+		archive.writestr(directoryInfo, b"")
+
+	for filePath in orderedFilePaths:  # type: str
+		with open(os.path.join(root, filePath), "rb") as file:
+			fileData = file.read()  # type: bytes
+
+		fileInfo = zipfile.ZipInfo(filePath.replace(os.path.sep, "/"), date_time = _archiveEntryDateTime)  # type: zipfile.ZipInfo
+		fileInfo.external_attr = 0o100644 << 16
+		fileInfo.compress_type = zipfile.ZIP_STORED  # Entries are stored so the game can read modules without inflating them.
 
-		for i in fileNames:
-			path = os.path.join(directoryRoot, i)  # type: str
-			archive.write(path, arcname = path.replace(root + os.path.sep, ""))
+		archive.writestr(fileInfo, fileData)
 
 	archive.close()
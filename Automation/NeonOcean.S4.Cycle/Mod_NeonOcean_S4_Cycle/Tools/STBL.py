@@ -18,6 +18,21 @@ def CanBuildSTBL () -> bool:
 
 	return False
 
+def GetBuildSTBLApplicationName () -> typing.Optional[str]:
+	"""
+	Get the name and version of the application that will be used to build, this will be None if no such application can be found.
+	"""
+
+	from Automation import Applications
+
+	for applicationName in BuildSTBLApplications.keys():  # type: str
+		application = Applications.GetApplication(applicationName)  # type: Applications.Application
+
+		if application.ExecutablePath is not None:
+			return applicationName
+
+	return None
+
 def BuildSTBL (buildDirectoryPath: str, sourceFilePath: str) -> None:
 	from Automation import Applications
 
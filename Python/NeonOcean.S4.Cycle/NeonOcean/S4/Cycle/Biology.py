@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from NeonOcean.S4.Main.Tools import Exceptions
+import typing
+
+from NeonOcean.S4.Cycle import This
+from NeonOcean.S4.Main import Debug, Director, LoadingShared
+from NeonOcean.S4.Main.Tools import Exceptions, Patcher
 from sims import sim_info
+from traits import trait_tracker
 
 CanBeImpregnatedTraitID = 136875  # type: int
 CanNotBeImpregnatedTraitID = 137716  # type: int
@@ -9,52 +14,147 @@ CanNotBeImpregnatedTraitID = 137716  # type: int
 CanImpregnateTraitID = 136874  # type: int
 CanNotImpregnateTraitID = 137717  # type: int
 
+CanBeImpregnatedCapability = 1  # type: int
+CanImpregnateCapability = 2  # type: int
+
+_traitChangeMethodNames = (
+	"add_trait",
+	"remove_trait",
+	"load_sim_info",
+)  # type: typing.Tuple[str, ...]
+
+_traitTrackerChangeMethodNames = (
+	"_add_trait",
+	"_remove_trait",
+)  # type: typing.Tuple[str, ...]  # Traits can be added or removed through the trait tracker without going through the sim info's methods.
+
+_simCapabilities = dict()  # type: typing.Dict[int, typing.Tuple[typing.Any, int]]  # The gender each sim had when their capabilities were calculated, and the capabilities, keyed by sim id.
+
+class _Announcer(Director.Announcer):
+	Host = This.Mod
+
+	@classmethod
+	def ZoneOnToreDown (cls, *args, **kwargs) -> None:
+		ClearCapabilitiesCache()
+
 def SimCanBeImpregnated (simInfo: sim_info.SimInfo) -> bool:
 	if not isinstance(simInfo, sim_info.SimInfo):
 		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
 
-	hasAllowTrait = False  # type: bool
-	hasDisallowTrait = False  # type: bool
+	return _GetSimCapabilities(simInfo) & CanBeImpregnatedCapability != 0
 
-	for simTrait in simInfo.get_traits():
-		if hasattr(simTrait, "guid64"):
+def SimCanImpregnate (simInfo: sim_info.SimInfo) -> bool:
+	if not isinstance(simInfo, sim_info.SimInfo):
+		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
 
-			if simTrait.guid64 == CanBeImpregnatedTraitID:
-				hasAllowTrait = True
+	return _GetSimCapabilities(simInfo) & CanImpregnateCapability != 0
 
-			if simTrait.guid64 == CanNotBeImpregnatedTraitID:
-				hasDisallowTrait = True
+def GetSimCapabilities (simInfo: sim_info.SimInfo) -> int:
+	"""
+	Get a bitmask of the sim's reproductive capabilities, made of the 'CanBeImpregnatedCapability' and 'CanImpregnateCapability' flags. Capabilities are
+	remembered until the sim's traits or gender change.
+	"""
 
-	if not hasAllowTrait and not hasDisallowTrait:
-		# noinspection PyPropertyAccess
-		return simInfo.gender == sim_info.Gender.FEMALE
+	if not isinstance(simInfo, sim_info.SimInfo):
+		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
 
-	if hasAllowTrait:
-		return True
-	else:
-		return False
+	return _GetSimCapabilities(simInfo)
+
+def GetPopulationCapabilities (simInfos: typing.Iterable[sim_info.SimInfo]) -> typing.Dict[int, int]:
+	"""
+	Get the reproductive capability bitmask of every one of these sims, keyed by sim id.
+	"""
+
+	populationCapabilities = dict()  # type: typing.Dict[int, int]
+
+	for simInfo in simInfos:  # type: sim_info.SimInfo
+		if not isinstance(simInfo, sim_info.SimInfo):
+			raise Exceptions.IncorrectTypeException(simInfo, "simInfos[...]", (sim_info.SimInfo,))
+
+		populationCapabilities[simInfo.sim_id] = _GetSimCapabilities(simInfo)
+
+	return populationCapabilities
+
+def InvalidateSimCapabilities (simInfo: sim_info.SimInfo) -> None:
+	"""
+	Forget the sim's reproductive capabilities, they will be recalculated the next time they are needed.
+	"""
 
-def SimCanImpregnate (simInfo: sim_info.SimInfo) -> bool:
 	if not isinstance(simInfo, sim_info.SimInfo):
 		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
 
-	hasAllowTrait = False  # type: bool
-	hasDisallowTrait = False  # type: bool
+	_simCapabilities.pop(simInfo.sim_id, None)
+
+def ClearCapabilitiesCache () -> None:
+	_simCapabilities.clear()
+
+def _GetSimCapabilities (simInfo: sim_info.SimInfo) -> int:
+	# noinspection PyPropertyAccess
+	simGender = simInfo.gender
+	cachedCapabilities = _simCapabilities.get(simInfo.sim_id, None)  # type: typing.Optional[typing.Tuple[typing.Any, int]]
+
+	if cachedCapabilities is not None and cachedCapabilities[0] == simGender:
+		return cachedCapabilities[1]
+
+	capabilities = _CalculateSimCapabilities(simInfo, simGender)  # type: int
+	_simCapabilities[simInfo.sim_id] = (simGender, capabilities)
+
+	return capabilities
+
+def _CalculateSimCapabilities (simInfo: sim_info.SimInfo, simGender) -> int:
+	simTraitIDs = set()  # type: typing.Set[int]
 
 	for simTrait in simInfo.get_traits():
-		if hasattr(simTrait, "guid64"):
+		simTraitID = getattr(simTrait, "guid64", None)  # type: typing.Optional[int]
+
+		if simTraitID is not None:
+			simTraitIDs.add(simTraitID)
+
+	capabilities = 0  # type: int
+
+	if CanBeImpregnatedTraitID in simTraitIDs:
+		capabilities |= CanBeImpregnatedCapability
+	elif CanNotBeImpregnatedTraitID not in simTraitIDs and simGender == sim_info.Gender.FEMALE:
+		capabilities |= CanBeImpregnatedCapability
+
+	if CanImpregnateTraitID in simTraitIDs:
+		capabilities |= CanImpregnateCapability
+	elif CanNotImpregnateTraitID not in simTraitIDs and simGender == sim_info.Gender.MALE:
+		capabilities |= CanImpregnateCapability
+
+	return capabilities
+
+def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
+	if cause != LoadingShared.LoadingCauses.Reloading:
+		for methodName in _traitChangeMethodNames:  # type: str
+			if not hasattr(sim_info.SimInfo, methodName):
+				Debug.Log("Could not find the sim info method '%s', sims' reproductive capabilities will not be recalculated when it is called." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+				continue
+
+			Patcher.Patch(sim_info.SimInfo, methodName, _TraitChangedPatch, patchType = Patcher.PatchTypes.After)
+
+		for methodName in _traitTrackerChangeMethodNames:  # type: str
+			if not hasattr(trait_tracker.TraitTracker, methodName):
+				Debug.Log("Could not find the trait tracker method '%s', sims' reproductive capabilities will not be recalculated when it is called." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+				continue
+
+			Patcher.Patch(trait_tracker.TraitTracker, methodName, _TraitTrackerChangedPatch, patchType = Patcher.PatchTypes.After)
+
+# noinspection PyUnusedLocal
+def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
+	ClearCapabilitiesCache()
 
-			if simTrait.guid64 == CanImpregnateTraitID:
-				hasAllowTrait = True
+# noinspection PyUnusedLocal
+def _TraitChangedPatch (self: sim_info.SimInfo, *args, **kwargs) -> None:
+	_simCapabilities.pop(self.sim_id, None)
 
-			if simTrait.guid64 == CanNotImpregnateTraitID:
-				hasDisallowTrait = True
+# noinspection PyUnusedLocal
+def _TraitTrackerChangedPatch (self: trait_tracker.TraitTracker, *args, **kwargs) -> None:
+	trackerSimInfo = getattr(self, "_sim_info", None)  # type: typing.Optional[sim_info.SimInfo]
 
-	if not hasAllowTrait and not hasDisallowTrait:
-		# noinspection PyPropertyAccess
-		return simInfo.gender == sim_info.Gender.MALE
+	if trackerSimInfo is None:
+		# We cannot tell who this tracker belongs to, so every sim's capabilities will need to be recalculated.
+		ClearCapabilitiesCache()
+		return
 
-	if hasAllowTrait:
-		return True
-	else:
-		return False
+	_simCapabilities.pop(trackerSimInfo.sim_id, None)
@@ -1,9 +1,11 @@
+import time
 import typing
 
 import game_services
 import services
-from NeonOcean.S4.Cycle import Debug as CycleDebug, Reproduction, ReproductionShared, This, Dot
+from NeonOcean.S4.Cycle import Debug as CycleDebug, Reproduction, ReproductionShared, SimulationTrace, This, Dot
 from NeonOcean.S4.Cycle.Console import Command
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Females import CycleTracker, PregnancyTracker, Shared as FemalesShared
 from NeonOcean.S4.Main import Debug, Language, LoadingShared
 from NeonOcean.S4.Main.UI import Dialogs
@@ -18,6 +20,14 @@ MakePregnantCommand: Command.ConsoleCommand
 EndPregnancyCommand: Command.ConsoleCommand
 ShowSetPregnancyProgressDialogCommand: Command.ConsoleCommand
 FixDotCycleCommand: Command.ConsoleCommand
+ShowImportTimesCommand: Command.ConsoleCommand
+ShowEventStatisticsCommand: Command.ConsoleCommand
+StartEventStatisticsCommand: Command.ConsoleCommand
+StopEventStatisticsCommand: Command.ConsoleCommand
+StartSimulationTraceCommand: Command.ConsoleCommand
+StopSimulationTraceCommand: Command.ConsoleCommand
+ReplaySimulationTraceCommand: Command.ConsoleCommand
+DiffSimulationTracesCommand: Command.ConsoleCommand
 
 SetCycleProgressDialogText = Language.String(This.Mod.Namespace + ".Set_Cycle_Progress_Dialog.Text")  # type: Language.String
 SetCycleProgressDialogTitle = Language.String(This.Mod.Namespace + ".Set_Cycle_Progress_Dialog.Title")  # type: Language.String
@@ -30,7 +40,8 @@ SetPregnancyProgressDialogOkButton = Language.String(This.Mod.Namespace + ".Set_
 SetPregnancyProgressDialogCancelButton = Language.String(This.Mod.Namespace + ".Set_Pregnancy_Progress_Dialog.Cancel_Button", fallbackText = "Cancel_Button")  # type: Language.String
 
 def _Setup () -> None:
-	global ShowReproductiveInfoCommand, ShowSetCycleProgressDialogCommand, MakePregnantCommand, EndPregnancyCommand, ShowSetPregnancyProgressDialogCommand, FixDotCycleCommand
+	global ShowReproductiveInfoCommand, ShowSetCycleProgressDialogCommand, MakePregnantCommand, EndPregnancyCommand, ShowSetPregnancyProgressDialogCommand, FixDotCycleCommand, ShowImportTimesCommand, ShowEventStatisticsCommand, \
+		StartEventStatisticsCommand, StopEventStatisticsCommand, StartSimulationTraceCommand, StopSimulationTraceCommand, ReplaySimulationTraceCommand, DiffSimulationTracesCommand
 
 	commandPrefix = This.Mod.Namespace.lower() + ".debug"  # type: str
 
@@ -40,6 +51,14 @@ def _Setup () -> None:
 	EndPregnancyCommand = Command.ConsoleCommand(_EndPregnancy, commandPrefix + ".end_pregnancy", showHelp = False)
 	ShowSetPregnancyProgressDialogCommand = Command.ConsoleCommand(_ShowSetPregnancyProgressDialog, commandPrefix + ".show_set_pregnancy_progress_dialog", showHelp = False)
 	FixDotCycleCommand = Command.ConsoleCommand(_FixDotCycle, commandPrefix + ".fix_dot_cycle", showHelp = False)
+	ShowImportTimesCommand = Command.ConsoleCommand(_ShowImportTimes, commandPrefix + ".show_import_times", showHelp = False)
+	ShowEventStatisticsCommand = Command.ConsoleCommand(_ShowEventStatistics, commandPrefix + ".show_event_statistics", showHelp = False)
+	StartEventStatisticsCommand = Command.ConsoleCommand(_StartEventStatistics, commandPrefix + ".start_event_statistics", showHelp = False)
+	StopEventStatisticsCommand = Command.ConsoleCommand(_StopEventStatistics, commandPrefix + ".stop_event_statistics", showHelp = False)
+	StartSimulationTraceCommand = Command.ConsoleCommand(_StartSimulationTrace, commandPrefix + ".start_simulation_trace", showHelp = False)
+	StopSimulationTraceCommand = Command.ConsoleCommand(_StopSimulationTrace, commandPrefix + ".stop_simulation_trace", showHelp = False)
+	ReplaySimulationTraceCommand = Command.ConsoleCommand(_ReplaySimulationTrace, commandPrefix + ".replay_simulation_trace", showHelp = False)
+	DiffSimulationTracesCommand = Command.ConsoleCommand(_DiffSimulationTraces, commandPrefix + ".diff_simulation_traces", showHelp = False)
 
 def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
 	if cause:
@@ -51,6 +70,14 @@ def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
 	EndPregnancyCommand.RegisterCommand()
 	ShowSetPregnancyProgressDialogCommand.RegisterCommand()
 	FixDotCycleCommand.RegisterCommand()
+	ShowImportTimesCommand.RegisterCommand()
+	ShowEventStatisticsCommand.RegisterCommand()
+	StartEventStatisticsCommand.RegisterCommand()
+	StopEventStatisticsCommand.RegisterCommand()
+	StartSimulationTraceCommand.RegisterCommand()
+	StopSimulationTraceCommand.RegisterCommand()
+	ReplaySimulationTraceCommand.RegisterCommand()
+	DiffSimulationTracesCommand.RegisterCommand()
 
 def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
 	if cause:
@@ -62,6 +89,14 @@ def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
 	EndPregnancyCommand.UnregisterCommand()
 	ShowSetPregnancyProgressDialogCommand.UnregisterCommand()
 	FixDotCycleCommand.UnregisterCommand()
+	ShowImportTimesCommand.UnregisterCommand()
+	ShowEventStatisticsCommand.UnregisterCommand()
+	StartEventStatisticsCommand.UnregisterCommand()
+	StopEventStatisticsCommand.UnregisterCommand()
+	StartSimulationTraceCommand.UnregisterCommand()
+	StopSimulationTraceCommand.UnregisterCommand()
+	ReplaySimulationTraceCommand.UnregisterCommand()
+	DiffSimulationTracesCommand.UnregisterCommand()
 
 def _ShowReproductiveInfo (targetSimHandler: argument_helpers.RequiredTargetParam, _connection = None) -> None:
 	try:
@@ -275,4 +310,114 @@ def _FixDotCycle (targetSimHandler: argument_helpers.RequiredTargetParam, _conne
 		Debug.Log("Failed to fix a sim's dot cycle.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
 		raise e
 
+def _ShowImportTimes (_connection = None) -> None:
+	try:
+		CycleDebug.ShowImportTimesNotification()
+	except Exception as e:
+		Debug.Log("Failed to show module import times.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _ShowEventStatistics (_connection = None) -> None:
+	try:
+		CycleDebug.ShowEventStatisticsNotification()
+	except Exception as e:
+		Debug.Log("Failed to show reproductive event statistics.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _StartEventStatistics (_connection = None) -> None:
+	try:
+		EventsDispatch.StartCollectingStatistics()
+		Debug.Log("Started collecting reproductive event statistics by request.", This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+	except Exception as e:
+		Debug.Log("Failed to start collecting reproductive event statistics.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _StopEventStatistics (_connection = None) -> None:
+	try:
+		EventsDispatch.StopCollectingStatistics()
+		Debug.Log("Stopped collecting reproductive event statistics by request.", This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+	except Exception as e:
+		Debug.Log("Failed to stop collecting reproductive event statistics.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _StartSimulationTrace (targetSimHandler: argument_helpers.RequiredTargetParam, _connection = None) -> None:
+	try:
+		if game_services.service_manager is None:
+			return
+
+		targetSimInfo = targetSimHandler.get_target(services.sim_info_manager())
+
+		if not isinstance(targetSimInfo, sim_info.SimInfo):
+			raise ValueError("Failed to get the target sim, %s is not a valid sim id." % targetSimHandler.target_id)
+
+		targetSimSystem = Reproduction.GetSimSystem(targetSimInfo)  # type: typing.Optional[ReproductionShared.ReproductiveSystem]
+
+		if targetSimSystem is None:
+			return
+
+		SimulationTrace.StartRecording(targetSimSystem)
+	except Exception as e:
+		Debug.Log("Failed to start a simulation trace.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _StopSimulationTrace (targetSimHandler: argument_helpers.RequiredTargetParam, _connection = None) -> None:
+	try:
+		if game_services.service_manager is None:
+			return
+
+		targetSimInfo = targetSimHandler.get_target(services.sim_info_manager())
+
+		if not isinstance(targetSimInfo, sim_info.SimInfo):
+			raise ValueError("Failed to get the target sim, %s is not a valid sim id." % targetSimHandler.target_id)
+
+		targetSimSystem = Reproduction.GetSimSystem(targetSimInfo, automaticallyUpdate = False)  # type: typing.Optional[ReproductionShared.ReproductiveSystem]
+
+		if targetSimSystem is None:
+			return
+
+		trace = SimulationTrace.StopRecording(targetSimSystem)  # type: typing.Optional[SimulationTrace.SimulationTrace]
+
+		if trace is None:
+			return
+
+		traceFilePath = SimulationTrace.GetTraceFilePath("%s_%s" % (targetSimInfo.sim_id, int(time.time())))  # type: str
+		trace.Save(traceFilePath)
+
+		CycleDebug.ShowSimulationTraceSavedNotification(traceFilePath)
+	except Exception as e:
+		Debug.Log("Failed to stop a simulation trace.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _ReplaySimulationTrace (targetSimHandler: argument_helpers.RequiredTargetParam, traceName: str, _connection = None) -> None:
+	try:
+		if game_services.service_manager is None:
+			return
+
+		targetSimInfo = targetSimHandler.get_target(services.sim_info_manager())
+
+		if not isinstance(targetSimInfo, sim_info.SimInfo):
+			raise ValueError("Failed to get the target sim, %s is not a valid sim id." % targetSimHandler.target_id)
+
+		traceFilePath = SimulationTrace.GetTraceFilePath(traceName)  # type: str
+
+		expectedTrace = SimulationTrace.SimulationTrace.Load(traceFilePath)  # type: SimulationTrace.SimulationTrace
+		actualTrace = SimulationTrace.ReplayTrace(expectedTrace, targetSimInfo)  # type: SimulationTrace.SimulationTrace
+
+		actualTrace.Save(traceFilePath[:-len(".trace")] + "_Replay.trace")
+
+		CycleDebug.ShowSimulationTraceDifferenceNotification(SimulationTrace.DiffTraces(expectedTrace, actualTrace))
+	except Exception as e:
+		Debug.Log("Failed to replay a simulation trace.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
+def _DiffSimulationTraces (expectedTraceName: str, actualTraceName: str, _connection = None) -> None:
+	try:
+		expectedTrace = SimulationTrace.SimulationTrace.Load(SimulationTrace.GetTraceFilePath(expectedTraceName))  # type: SimulationTrace.SimulationTrace
+		actualTrace = SimulationTrace.SimulationTrace.Load(SimulationTrace.GetTraceFilePath(actualTraceName))  # type: SimulationTrace.SimulationTrace
+
+		CycleDebug.ShowSimulationTraceDifferenceNotification(SimulationTrace.DiffTraces(expectedTrace, actualTrace))
+	except Exception as e:
+		Debug.Log("Failed to compare two simulation traces.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+		raise e
+
 _Setup()
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import typing
 
-from NeonOcean.S4.Cycle import Reproduction, ReproductionShared, This
-from NeonOcean.S4.Main import Debug, Language
+from NeonOcean.S4.Cycle import Reproduction, ReproductionShared, SimulationTrace, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
+from NeonOcean.S4.Cycle.Tools import ImportProfiler
+from NeonOcean.S4.Main import Debug, Language, LoadingShared
 from NeonOcean.S4.Main.Tools import Exceptions
 from NeonOcean.S4.Main.UI import Notifications
 from sims import sim_info
@@ -27,3 +29,63 @@ def ShowReproductiveInfoNotifications (targetSimInfo: sim_info.SimInfo) -> None:
 	Notifications.ShowNotification(queue = False, **notificationArguments)
 
 	Debug.Log("Collected and reported debug info from a sim's reproductive system by request.\n\n%s" % notificationText, This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+
+def ShowImportTimesNotification () -> None:
+	notificationText = ImportProfiler.GetImportTimesText(maximumModules = 20)  # type: str
+
+	notificationArguments = {
+		"title": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString("")),
+		"text": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString(notificationText)),
+	}
+
+	Notifications.ShowNotification(queue = False, **notificationArguments)
+
+	Debug.Log("Collected and reported module import times by request.\n\n%s" % ImportProfiler.GetImportTimesText(), This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+
+def ShowEventStatisticsNotification () -> None:
+	notificationText = EventsDispatch.GetEventStatisticsText()  # type: str
+
+	if not EventsDispatch.IsCollectingStatistics():
+		notificationText = "Event statistics are not being collected.\n\n" + notificationText
+
+	notificationArguments = {
+		"title": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString("")),
+		"text": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString(notificationText)),
+	}
+
+	Notifications.ShowNotification(queue = False, **notificationArguments)
+
+	Debug.Log("Collected and reported reproductive event statistics by request.\n\n%s" % notificationText, This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+
+def ShowSimulationTraceSavedNotification (traceFilePath: str) -> None:
+	notificationText = "Saved the simulation trace to '%s'." % traceFilePath  # type: str
+
+	notificationArguments = {
+		"title": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString("")),
+		"text": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString(notificationText)),
+	}
+
+	Notifications.ShowNotification(queue = False, **notificationArguments)
+
+	Debug.Log(notificationText, This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+
+def ShowSimulationTraceDifferenceNotification (traceDifference: SimulationTrace.TraceDifference) -> None:
+	notificationText = SimulationTrace.GetTraceDifferenceText(traceDifference)  # type: str
+
+	notificationArguments = {
+		"title": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString("")),
+		"text": Language.MakeLocalizationStringCallable(Language.CreateLocalizationString(notificationText)),
+	}
+
+	Notifications.ShowNotification(queue = False, **notificationArguments)
+
+	Debug.Log("Compared two simulation traces by request.\n\n%s" % notificationText, This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+
+def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
+	if cause == LoadingShared.LoadingCauses.Reloading or not ImportProfiler.IsProfiling():
+		return
+
+	# Every module has been imported by the time the mod starts, anything imported later isn't part of the mod's loading time.
+	ImportProfiler.StopImportProfiling()
+
+	Debug.Log("Finished importing the mod's modules.\n\n%s" % ImportProfiler.GetImportTimesText(), This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import typing
 import random
 
-from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, Settings
+from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared
 from NeonOcean.S4.Cycle.Effects import Base as EffectsBase, Shared as EffectsShared, Types as EffectsTypes
 from NeonOcean.S4.Cycle.Females import CycleTracker, Shared as FemalesShared, OvumTracker, SpermTracker
 from NeonOcean.S4.Cycle.Tools import Distribution
@@ -150,7 +150,7 @@ class EmergencyContraceptivePillEffect(EffectsBase.EffectBase):
 
 	# noinspection PyUnusedLocal
 	def _CycleTrackerCycleReleaseOvumTestingCallback (self, owner: CycleTracker.CycleTracker, eventArguments: CycleEvents.CycleReleaseOvumTestingArguments) -> None:
-		if Settings.QuickMode.Get():
+		if ReproductionShared.GetSimulationSettingsSnapshot().QuickMode:
 			return  # We handle ova in a different way for quick mode.
 
 		if self.Strength <= 0:
@@ -179,7 +179,7 @@ class EmergencyContraceptivePillEffect(EffectsBase.EffectBase):
 
 	# noinspection PyUnusedLocal
 	def _OvumTrackerOvumReleasedCallback(self, owner: OvumTracker.OvumTracker, eventArguments: CycleEvents.OvumReleasedArguments) -> None:
-		if not Settings.QuickMode.Get():
+		if not ReproductionShared.GetSimulationSettingsSnapshot().QuickMode:
 			return
 
 		if self.Strength <= 0:
@@ -4,13 +4,13 @@ import copy
 import typing
 
 from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Buffs import Menstrual as BuffsMenstrual, Shared as BuffsShared
 from NeonOcean.S4.Cycle.Effects import Base as EffectsBase, Shared as EffectsShared, Types as EffectsTypes
 from NeonOcean.S4.Cycle.Females import CycleTracker, Shared as FemalesShared
 from NeonOcean.S4.Cycle.Females.Cycle import Menstrual as CycleMenstrual, Shared as CycleShared
 from NeonOcean.S4.Cycle.Tools import Probability
-from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable, Types
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Savable
 
 if typing.TYPE_CHECKING:
 	from NeonOcean.S4.Cycle.Tools import Distribution
@@ -132,16 +132,9 @@ class MenstrualEffect(EffectsBase.EffectBase):
 		if not isinstance(fromLoad, bool):
 			raise Exceptions.IncorrectTypeException(fromLoad, "fromLoad", (bool,))
 
-		eventArguments = CycleEvents.MenstrualEffectBuffAddedArguments(addedBuff)  # type: CycleEvents.MenstrualEffectBuffAddedArguments
-
 		self.ApplyBuffEffects(addedBuff)
 
-		for buffAddedCallback in self.BuffAddedEvent:
-			try:
-				buffAddedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call buff added callback '" + Types.GetFullName(buffAddedCallback) + "'.\n" + self.AffectingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = buffAddedCallback)
+		EventsDispatch.DispatchLazily("MenstrualEffect.BuffAddedEvent", self.BuffAddedEvent, self, self.AffectingSystem, CycleEvents.MenstrualEffectBuffAddedArguments, addedBuff)
 
 	def NotifyBuffRemoved (self, removedBuff: BuffsMenstrual.MenstrualBuffBase) -> None:
 		"""
@@ -151,24 +144,12 @@ class MenstrualEffect(EffectsBase.EffectBase):
 		if not isinstance(removedBuff, BuffsMenstrual.MenstrualBuffBase):
 			raise Exceptions.IncorrectTypeException(removedBuff, "removedBuff", (BuffsMenstrual.MenstrualBuffBase,))
 
-		eventArguments = CycleEvents.MenstrualEffectBuffRemovedArguments(removedBuff)  # type: CycleEvents.MenstrualEffectBuffRemovedArguments
-
-		for buffRemovedCallback in self.BuffRemovedEvent:
-			try:
-				buffRemovedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call buff removed callback '" + Types.GetFullName(buffRemovedCallback) + "'.\n" + self.AffectingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = buffRemovedCallback)
+		EventsDispatch.DispatchLazily("MenstrualEffect.BuffRemovedEvent", self.BuffRemovedEvent, self, self.AffectingSystem, CycleEvents.MenstrualEffectBuffRemovedArguments, removedBuff)
 
 	def DoBuffSelectionTesting (self) -> CycleEvents.MenstrualEffectBuffSelectionTestingArguments:
 		eventArguments = CycleEvents.MenstrualEffectBuffSelectionTestingArguments(self.AffectingSystem.CurrentSeed, self.AffectingSystem.SimInfo)  # type: CycleEvents.MenstrualEffectBuffSelectionTestingArguments
 
-		for buffSelectionTestingCallback in self.BuffSelectionTestingEvent:
-			try:
-				buffSelectionTestingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call buff selection testing callback '" + Types.GetFullName(buffSelectionTestingCallback) + "'.\n" + self.AffectingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = buffSelectionTestingCallback)
+		EventsDispatch.Dispatch("MenstrualEffect.BuffSelectionTestingEvent", self.BuffSelectionTestingEvent, self, eventArguments, debugSource = self.AffectingSystem)
 
 		return eventArguments
 
@@ -261,6 +242,13 @@ class MenstrualEffect(EffectsBase.EffectBase):
 			self.ApplyBuffAbstainedEffects()
 			return
 
+		if self.AffectingSystem.Replaying:
+			# The buff cannot be added, but the cool down it would apply once added is still needed for the replay to match.
+			if selectedBuffType.ApplyCoolDown:
+				self.ApplyBuffRarityCoolDown(selectedBuffType.Rarity)
+
+			return
+
 		self.AffectingSystem.SimInfo.Buffs.add_buff_from_op(selectedBuffType, BuffsShared.ReproductiveSystemBuffReason.GetLocalizationString())
 
 	# noinspection PyUnusedLocal
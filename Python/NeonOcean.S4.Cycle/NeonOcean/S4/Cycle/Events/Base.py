@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing
 
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Main.Tools import Events, Exceptions
 
 class ReproductiveArguments(Events.EventArguments):
@@ -86,8 +87,8 @@ class GenerationArguments (SeededAndTargetedArguments):
 
 		super().__init__(seed = seed, targetedObject = targetedObject, *args, **kwargs)
 
-		self.PreGenerationEvent = Events.EventHandler()
-		self.PostGenerationEvent = Events.EventHandler()
+		self._preGenerationEvent = None  # type: typing.Optional[Events.EventHandler]  # The handlers are only created once they are asked for, most generations never use them.
+		self._postGenerationEvent = None  # type: typing.Optional[Events.EventHandler]
 
 	@property
 	def PreGenerationEvent (self) -> Events.EventHandler:
@@ -97,6 +98,9 @@ class GenerationArguments (SeededAndTargetedArguments):
 		The event arguments parameter should be a 'EventArguments' object, the standard event arguments object for the event system.
 		"""
 
+		if self._preGenerationEvent is None:
+			self._preGenerationEvent = Events.EventHandler()
+
 		return self._preGenerationEvent
 
 	@PreGenerationEvent.setter
@@ -113,6 +117,9 @@ class GenerationArguments (SeededAndTargetedArguments):
 		The event arguments parameter should be a 'EventArguments' object, the standard event arguments object for the event system.
 		"""
 
+		if self._postGenerationEvent is None:
+			self._postGenerationEvent = Events.EventHandler()
+
 		return self._postGenerationEvent
 
 	@PostGenerationEvent.setter
@@ -122,4 +129,22 @@ class GenerationArguments (SeededAndTargetedArguments):
 
 		self._postGenerationEvent = value
 
+	def InvokePreGenerationEvent (self) -> None:
+		"""
+		Trigger the pre generation event, nothing will happen if nothing has subscribed to it.
+		"""
+
+		if self._preGenerationEvent is None:
+			return
+
+		EventsDispatch.DispatchEmpty(self.__class__.__name__ + ".PreGenerationEvent", self._preGenerationEvent, self, reportExceptions = False)
+
+	def InvokePostGenerationEvent (self) -> None:
+		"""
+		Trigger the post generation event, nothing will happen if nothing has subscribed to it.
+		"""
+
+		if self._postGenerationEvent is None:
+			return
 
+		EventsDispatch.DispatchEmpty(self.__class__.__name__ + ".PostGenerationEvent", self._postGenerationEvent, self, reportExceptions = False)
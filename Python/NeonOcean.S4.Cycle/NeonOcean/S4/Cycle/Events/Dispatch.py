@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import time
+import typing
+
+from NeonOcean.S4.Cycle import This
+from NeonOcean.S4.Main import Debug
+from NeonOcean.S4.Main.Tools import Events, Python, Types
+
+EmptyArgumentsPoolSize = 16  # type: int
+
+_collectingStatistics = False  # type: bool
+_eventStatistics = dict()  # type: typing.Dict[str, EventStatistics]
+_emptyArgumentsPool = list()  # type: typing.List[Events.EventArguments]
+
+class EventStatistics:
+	def __init__ (self, eventName: str):
+		"""
+		A record of how often an event has been dispatched and how long its callbacks took.
+		:param eventName: The name of the event these statistics are for.
+		:type eventName: str
+		"""
+
+		self.EventName = eventName  # type: str
+
+		self.Dispatches = 0  # type: int
+		self.SkippedDispatches = 0  # type: int  # Dispatches that were skipped because nothing was subscribed to the event.
+		self.CallbackCalls = 0  # type: int
+		self.CallbackTime = 0.0  # type: float
+
+def HasSubscribers (eventHandler: Events.EventHandler) -> bool:
+	"""
+	Get whether or not anything is subscribed to this event handler.
+	"""
+
+	for _ in eventHandler:
+		return True
+
+	return False
+
+def Dispatch (
+		eventName: str,
+		eventHandler: Events.EventHandler,
+		owner: typing.Any,
+		eventArguments: Events.EventArguments,
+		debugSource: typing.Any = None,
+		reportExceptions: bool = True) -> None:
+
+	"""
+	Call every callback subscribed to this event handler. How often the event was dispatched and how long its callbacks took will only be recorded while
+	statistics are being collected.
+	:param eventName: The name the event's statistics are recorded under.
+	:type eventName: str
+	:param eventHandler: The handler holding the event's callbacks.
+	:type eventHandler: Events.EventHandler
+	:param owner: The object the event belongs to, this is passed to every callback as the first argument.
+	:type owner: typing.Any
+	:param eventArguments: The event arguments passed to every callback.
+	:type eventArguments: Events.EventArguments
+	:param debugSource: An object with a 'DebugInformation' attribute, this information will only be retrieved if a callback fails.
+	:type debugSource: typing.Any
+	:param reportExceptions: Whether exceptions raised by callbacks should be logged and ignored. When this is false exceptions will be left to propagate,
+	matching the behaviour of the event handler's 'Invoke' method.
+	:type reportExceptions: bool
+	"""
+
+	if not _collectingStatistics:
+		for eventCallback in eventHandler:
+			_CallCallback(eventName, eventCallback, owner, eventArguments, debugSource, reportExceptions)
+
+		return
+
+	eventStatistics = _GetEventStatistics(eventName)  # type: EventStatistics
+	eventStatistics.Dispatches += 1
+
+	dispatchStartTime = time.perf_counter()  # type: float
+
+	try:
+		for eventCallback in eventHandler:
+			eventStatistics.CallbackCalls += 1
+			_CallCallback(eventName, eventCallback, owner, eventArguments, debugSource, reportExceptions)
+	finally:
+		eventStatistics.CallbackTime += time.perf_counter() - dispatchStartTime
+
+def DispatchLazily (
+		eventName: str,
+		eventHandler: Events.EventHandler,
+		owner: typing.Any,
+		debugSource: typing.Any,
+		argumentsType: typing.Callable[..., Events.EventArguments],
+		*arguments,
+		**keywordArguments) -> typing.Optional[Events.EventArguments]:
+
+	"""
+	Dispatch an event whose arguments are not needed afterwards. The event arguments will only be created, from the arguments type and the remaining
+	arguments, if something is subscribed to the event.
+	:return: The event arguments that were dispatched, or None if nothing was subscribed.
+	:rtype: Events.EventArguments | None
+	"""
+
+	if not HasSubscribers(eventHandler):
+		if _collectingStatistics:
+			_GetEventStatistics(eventName).SkippedDispatches += 1
+
+		return None
+
+	eventArguments = argumentsType(*arguments, **keywordArguments)  # type: Events.EventArguments
+	Dispatch(eventName, eventHandler, owner, eventArguments, debugSource = debugSource)
+
+	return eventArguments
+
+def DispatchEmpty (
+		eventName: str,
+		eventHandler: Events.EventHandler,
+		owner: typing.Any,
+		debugSource: typing.Any = None,
+		reportExceptions: bool = True) -> None:
+
+	"""
+	Dispatch an event that takes the standard, empty, event arguments. The arguments object is borrowed from a pool and returned afterwards, so
+	callbacks should not keep a reference to it.
+	"""
+
+	if not HasSubscribers(eventHandler):
+		if _collectingStatistics:
+			_GetEventStatistics(eventName).SkippedDispatches += 1
+
+		return
+
+	eventArguments = _emptyArgumentsPool.pop() if len(_emptyArgumentsPool) != 0 else Events.EventArguments()  # type: Events.EventArguments
+
+	try:
+		Dispatch(eventName, eventHandler, owner, eventArguments, debugSource = debugSource, reportExceptions = reportExceptions)
+	finally:
+		if len(_emptyArgumentsPool) < EmptyArgumentsPoolSize:
+			_emptyArgumentsPool.append(eventArguments)
+
+def IsCollectingStatistics () -> bool:
+	"""
+	Get whether or not event statistics are being collected. Statistics are not collected unless they have been started, as timing every dispatch has a
+	cost of its own.
+	"""
+
+	return _collectingStatistics
+
+def StartCollectingStatistics () -> None:
+	global _collectingStatistics
+
+	_collectingStatistics = True
+
+def StopCollectingStatistics () -> None:
+	global _collectingStatistics
+
+	_collectingStatistics = False
+
+def GetEventStatistics () -> typing.List[EventStatistics]:
+	"""
+	Get the statistics of every event dispatched this session.
+	"""
+
+	return list(_eventStatistics.values())
+
+def GetEventStatisticsText () -> str:
+	"""
+	Get a table of the statistics of every event dispatched this session, events with the most callback time first.
+	"""
+
+	eventStatistics = sorted(_eventStatistics.values(), key = lambda statistics: statistics.CallbackTime, reverse = True)  # type: typing.List[EventStatistics]
+
+	eventStatisticsLines = ["Dispatches | Skipped | Callbacks | Time [us] | Event"]  # type: typing.List[str]
+
+	for statistics in eventStatistics:  # type: EventStatistics
+		eventStatisticsLines.append("%10d | %7d | %9d | %9d | %s" % (statistics.Dispatches, statistics.SkippedDispatches, statistics.CallbackCalls, statistics.CallbackTime * 1000000, statistics.EventName))
+
+	return "\n".join(eventStatisticsLines)
+
+def ResetEventStatistics () -> None:
+	_eventStatistics.clear()
+
+def _CallCallback (
+		eventName: str,
+		eventCallback: typing.Callable,
+		owner: typing.Any,
+		eventArguments: Events.EventArguments,
+		debugSource: typing.Any,
+		reportExceptions: bool) -> None:
+
+	if not reportExceptions:
+		eventCallback(owner, eventArguments)
+		return
+
+	try:
+		eventCallback(owner, eventArguments)
+	except:
+		debugInformation = getattr(debugSource, "DebugInformation", "") if debugSource is not None else ""  # type: str
+
+		Debug.Log("Failed to call a callback for the event '%s' at '%s'.\n%s" % (eventName, Types.GetFullName(eventCallback), debugInformation),
+				  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = eventCallback)
+
+def _GetEventStatistics (eventName: str) -> EventStatistics:
+	eventStatistics = _eventStatistics.get(eventName, None)  # type: typing.Optional[EventStatistics]
+
+	if eventStatistics is None:
+		eventStatistics = EventStatistics(eventName)
+		_eventStatistics[eventName] = eventStatistics
+
+	return eventStatistics
@@ -239,7 +239,7 @@ class CycleGeneratingArguments(EventsBase.GenerationArguments):
 
 		self._cycleGuide = cycleGuide  # type: CycleGuides.CycleGuide
 
-		self._ovumReleaseAmountProbability = copy.copy(self.CycleGuide.OvumReleaseAmount)  # type: Probability.Probability
+		self._ovumReleaseAmountProbability = None  # type: typing.Optional[Probability.Probability]
 
 	@property
 	def CycleGuide (self) -> CycleGuides.CycleGuide:
@@ -252,9 +252,13 @@ class CycleGeneratingArguments(EventsBase.GenerationArguments):
 	@property
 	def OvumReleaseAmountProbability (self) -> Probability.Probability:
 		"""
-		The probabilities for the amount of egg cells to be released during the cycle.
+		The probabilities for the amount of egg cells to be released during the cycle. This is a copy of the cycle guide's probabilities, made the first
+		time it is requested, so that it can be changed.
 		"""
 
+		if self._ovumReleaseAmountProbability is None:
+			self._ovumReleaseAmountProbability = copy.copy(self.CycleGuide.OvumReleaseAmount)
+
 		return self._ovumReleaseAmountProbability
 
 	def GetUniqueIdentifier (self) -> uuid.UUID:
@@ -276,6 +280,11 @@ class CycleGeneratingArguments(EventsBase.GenerationArguments):
 		return self.Seed + self.UniqueSeedSeed
 
 	def GetOvumReleaseAmount (self) -> int:
+		if self._ovumReleaseAmountProbability is None:
+			# Nothing has asked to change the probabilities, so the guide's parsed release amounts can be used instead of copying the guide's probability object.
+			ovumReleaseAmountTable = CycleOvumRelease.GetOvumReleaseAmountTable(self.CycleGuide.OvumReleaseAmount)  # type: CycleOvumRelease.OvumReleaseAmountTable
+			return ovumReleaseAmountTable.ChooseOvumReleaseAmount(seed = self.Seed + self.OvumReleaseAmountSeed)
+
 		ovumReleaseAmountString = self.OvumReleaseAmountProbability.ChooseOption(seed = self.Seed + self.OvumReleaseAmountSeed).Identifier  # type: str
 
 		try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import bisect
 import typing
 import enum_lib
 import uuid
@@ -8,7 +9,7 @@ import uuid
 from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
 from NeonOcean.S4.Cycle.Females.Cycle import Shared as CycleShared, OvumRelease as CycleOvumRelease
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable, Version
+from NeonOcean.S4.Main.Tools import Classes, Exceptions, Python, Savable, Version
 
 class CycleBase(abc.ABC, Savable.SavableExtension):
 	HostNamespace = This.Mod.Namespace
@@ -47,9 +48,42 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 		def EndTime (self) -> float:
 			return self.EndTimeGetter()
 
+	class _PhaseTimeline:
+		def __init__ (self,
+					  phaseLengths: typing.Dict[enum_lib.Enum, float],
+					  phaseStartTimes: typing.Dict[enum_lib.Enum, float],
+					  phaseEndTimes: typing.Dict[enum_lib.Enum, float]):
+
+			"""
+			The lengths, start times and end times of a cycle's phases, frozen so that they can be read without recalculating them each time.
+			"""
+
+			self.PhaseLengths = phaseLengths  # type: typing.Dict[enum_lib.Enum, float]
+			self.PhaseStartTimes = phaseStartTimes  # type: typing.Dict[enum_lib.Enum, float]
+			self.PhaseEndTimes = phaseEndTimes  # type: typing.Dict[enum_lib.Enum, float]
+
+			sortedPhaseStartTimes = sorted(phaseStartTimes.items(), key = lambda phaseStartTime: phaseStartTime[1])  # type: typing.List[typing.Tuple[enum_lib.Enum, float]]
+
+			self.SortedPhaseTypes = tuple(phaseType for phaseType, phaseStartTime in sortedPhaseStartTimes)  # type: typing.Tuple[enum_lib.Enum, ...]
+			self.SortedPhaseStartTimes = tuple(phaseStartTime for phaseType, phaseStartTime in sortedPhaseStartTimes)  # type: typing.Tuple[float, ...]
+
+		def GetNextPhaseIndex (self, time: float) -> typing.Optional[int]:
+			"""
+			Get the index, in the sorted phase tuples, of the first phase to start after this time. This will return none if no phase starts after it.
+			"""
+
+			nextPhaseIndex = bisect.bisect_right(self.SortedPhaseStartTimes, time)  # type: int
+
+			if nextPhaseIndex >= len(self.SortedPhaseStartTimes):
+				return None
+
+			return nextPhaseIndex
+
 	def __init__ (self):
 		super().__init__()
 
+		self._phaseTimeline = None  # type: typing.Optional[CycleBase._PhaseTimeline]
+
 		self._uniqueIdentifier = None  # type: typing.Optional[uuid.UUID]
 		self._uniqueSeed = None  # type: typing.Optional[int]
 
@@ -64,56 +98,17 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 		# noinspection PyProtectedMember
 		self._phases = {}  # type: typing.Dict[enum_lib.Enum, CycleBase._Phase]
 
-		encodeUUID = lambda value: str(value) if value is not None else None
-		decodeUUID = lambda valueString: uuid.UUID(valueString) if valueString is not None else None
-
-		# noinspection PyUnusedLocal
-		def uniqueSeedUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
-			if isinstance(data.get(self._uniqueSeedSavingKey, None), list):
-				data.pop(self._uniqueSeedSavingKey)
-
-		def uniqueIdentifierVerifier (value: typing.Optional[uuid.UUID]) -> None:
-			if not isinstance(value, uuid.UUID) and value is not None:
-				raise Exceptions.IncorrectTypeException(value, self._uniqueIdentifierSavingKey, (uuid.UUID, None))
-
-		def uniqueSeedVerifier (value: typing.Optional[int]) -> None:
-			if not isinstance(value, int) and value is not None:
-				raise Exceptions.IncorrectTypeException(value, self._uniqueSeedSavingKey, (int, None))
-
-		# noinspection PyUnusedLocal
-		def ovumReleasesUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
-			if self._ovumReleasesOldSavingKey in data and not self._ovumReleasesSavingKey in data:
-				data[self._ovumReleasesSavingKey] = data[self._ovumReleasesOldSavingKey]
-
-			if not self._ovumReleasesSavingKey in data:
-				return
-
-			ovumReleasesData = data[self._ovumReleasesSavingKey]  # type: typing.List[typing.Union[float, int, dict]]
-
-			if not isinstance(ovumReleasesData, list):
-				return
-
-			for ovumReleaseDataIndex in range(len(ovumReleasesData)):  # type: int
-				ovumReleaseData = ovumReleasesData[ovumReleaseDataIndex]  # type: typing.Union[float, int, dict]
-
-				if isinstance(ovumReleaseData, (float, int)):
-					ovumRelease = CycleOvumRelease.OvumRelease()
-					ovumRelease.BaseReleaseMinute = ovumReleaseData
-					ovumReleasesData[ovumReleaseDataIndex] = {
-						"Data": ovumRelease.SaveToDictionary()[1]
-					}
-
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueIdentifierSavingKey, "_uniqueIdentifier", None, encoder = encodeUUID, decoder = decodeUUID, typeVerifier = uniqueIdentifierVerifier))
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueSeedSavingKey, "_uniqueSeed", None, updater = uniqueSeedUpdater, typeVerifier = uniqueSeedVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueIdentifierSavingKey, "_uniqueIdentifier", None, encoder = ReproductionShared.EncodeUUID, decoder = ReproductionShared.DecodeUUID, typeVerifier = _uniqueIdentifierVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueSeedSavingKey, "_uniqueSeed", None, updater = _uniqueSeedUpdater, typeVerifier = _uniqueSeedVerifier))
 
 		self.RegisterSavableAttribute(Savable.ListedSavableAttributeHandler(
 			self._ovumReleasesSavingKey,
 			"OvumReleases",
-			lambda: CycleOvumRelease.OvumRelease(),
-			lambda: list(),
+			CycleOvumRelease.OvumRelease,
+			list,
 			requiredSuccess = False,
 			requiredEntrySuccess = False,
-			updater = ovumReleasesUpdater))
+			updater = _OvumReleasesUpdater))
 
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("Age", "Age", self.Age))
 
@@ -315,33 +310,31 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 		Get whether or not a phase has already completed.
 		"""
 
-		requestedPhase = self._phases[phase]
-
-		if requestedPhase.Active:
+		if self._phases[phase].Active:
 			return False
 
-		return requestedPhase.EndTime < self.Age
+		return self._GetPhaseTimeline().PhaseEndTimes[phase] < self.Age
 
 	def GetPhaseLength (self, phase: enum_lib.Enum) -> float:
 		"""
 		Get the amount of time in reproductive minutes a phase lasts for.
 		"""
 
-		return self._phases[phase].Length
+		return self._GetPhaseTimeline().PhaseLengths[phase]
 
 	def GetPhaseStartTime (self, phase: enum_lib.Enum) -> float:
 		"""
 		Get the start time in reproductive minutes of the input phase.
 		"""
 
-		return self._phases[phase].StartTime
+		return self._GetPhaseTimeline().PhaseStartTimes[phase]
 
 	def GetPhaseEndTime (self, phase: enum_lib.Enum) -> float:
 		"""
 		Get the end time in reproductive minutes of the input phase.
 		"""
 
-		return self._phases[phase].EndTime
+		return self._GetPhaseTimeline().PhaseEndTimes[phase]
 
 	def GetAllActivePhases (self) -> typing.Set[enum_lib.Enum]:
 		"""
@@ -361,49 +354,34 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 		Get a set of all cycle phases that have yet to begin.
 		"""
 
-		upcomingPhases = set()  # type: typing.Set[enum_lib.Enum]
+		phaseTimeline = self._GetPhaseTimeline()  # type: CycleBase._PhaseTimeline
+		nextPhaseIndex = phaseTimeline.GetNextPhaseIndex(self.Age)  # type: typing.Optional[int]
 
-		for phaseType, phase in self._phases.items():
-			if phase.StartTime > self.Age:
-				upcomingPhases.add(phaseType)
+		if nextPhaseIndex is None:
+			return set()
 
-		return upcomingPhases
+		return set(phaseTimeline.SortedPhaseTypes[nextPhaseIndex:])
 
 	def GetAllPhaseLengths (self) -> typing.Dict[enum_lib.Enum, float]:
 		"""
 		Get the length in reproductive minutes of each phase.
 		"""
 
-		phaseLengths = dict()  # type: typing.Dict[enum_lib.Enum, float]
-
-		for phaseType, phase in self._phases.items():
-			phaseLengths[phaseType] = phase.Length
-
-		return phaseLengths
+		return dict(self._GetPhaseTimeline().PhaseLengths)
 
 	def GetAllPhaseStartTimes (self) -> typing.Dict[enum_lib.Enum, float]:
 		"""
 		Get the start time in reproductive minutes of each phase.
 		"""
 
-		phaseStartTimes = dict()  # type: typing.Dict[enum_lib.Enum, float]
-
-		for phaseType, phase in self._phases.items():
-			phaseStartTimes[phaseType] = phase.StartTime
-
-		return phaseStartTimes
+		return dict(self._GetPhaseTimeline().PhaseStartTimes)
 
 	def GetAllPhaseEndTimes (self) -> typing.Dict[enum_lib.Enum, float]:
 		"""
 		Get the end time in reproductive minutes of each phase.
 		"""
 
-		phaseEndTimes = dict()  # type: typing.Dict[enum_lib.Enum, float]
-
-		for phaseType, phase in self._phases.items():
-			phaseEndTimes[phaseType] = phase.EndTime
-
-		return phaseEndTimes
+		return dict(self._GetPhaseTimeline().PhaseEndTimes)
 
 	def GetPhaseCompletionPercentage (self, phase: enum_lib.Enum) -> typing.Optional[float]:
 		"""
@@ -447,44 +425,26 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 		Get the amount of time in reproductive minutes until the next phase starts. This may return none if no more phases will start before the cycle ends.
 		"""
 
-		allPhaseStartTimes = self.GetAllPhaseStartTimes()  # type: typing.Dict[enum_lib.Enum, float]
+		phaseTimeline = self._GetPhaseTimeline()  # type: CycleBase._PhaseTimeline
+		nextPhaseIndex = phaseTimeline.GetNextPhaseIndex(self.Age)  # type: typing.Optional[int]
 
-		timeUntilNextPhase = None  # type: typing.Optional[float]
-		for phaseType, phaseStartTime in allPhaseStartTimes:  # type: enum_lib.Enum, float
-			timeUntilPhaseStart = phaseStartTime - self.Age  # type: float
-
-			if timeUntilPhaseStart <= 0:
-				continue
-
-			if timeUntilPhaseStart > timeUntilNextPhase:
-				continue
-
-			timeUntilNextPhase = timeUntilPhaseStart
+		if nextPhaseIndex is None:
+			return None
 
-		return timeUntilNextPhase
+		return phaseTimeline.SortedPhaseStartTimes[nextPhaseIndex] - self.Age
 
 	def GetNextPhase (self) -> typing.Optional[enum_lib.Enum]:
 		"""
 		Get the phase that will start next. This may return none if no more phases will start before the cycle ends.
 		"""
 
-		allPhaseStartTimes = self.GetAllPhaseStartTimes()  # type: typing.Dict[enum_lib.Enum, float]
-
-		nextPhase = None  # type: typing.Optional[enum_lib.Enum]
-		timeUntilNextPhase = None  # type: typing.Optional[float]
-		for phaseType, phaseStartTime in allPhaseStartTimes:  # type: enum_lib.Enum, float
-			timeUntilPhaseStart = phaseStartTime - self.Age  # type: float
-
-			if timeUntilPhaseStart <= 0:
-				continue
-
-			if timeUntilPhaseStart > timeUntilNextPhase:
-				continue
+		phaseTimeline = self._GetPhaseTimeline()  # type: CycleBase._PhaseTimeline
+		nextPhaseIndex = phaseTimeline.GetNextPhaseIndex(self.Age)  # type: typing.Optional[int]
 
-			nextPhase = phaseType
-			timeUntilNextPhase = timeUntilPhaseStart
+		if nextPhaseIndex is None:
+			return None
 
-		return nextPhase
+		return phaseTimeline.SortedPhaseTypes[nextPhaseIndex]
 
 	def End (self, completedReason: CycleShared.CompletionReasons = CycleShared.CompletionReasons.Unknown) -> None:
 		"""
@@ -513,9 +473,9 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 		if not isinstance(generationArguments, CycleEvents.CycleGeneratingArguments):
 			raise Exceptions.IncorrectTypeException(generationArguments, "generationArguments", (CycleEvents.CycleGeneratingArguments,))
 
-		generationArguments.PreGenerationEvent.Invoke(generationArguments, Events.EventArguments())
+		generationArguments.InvokePreGenerationEvent()
 		self._GenerateInternal(generationArguments)
-		generationArguments.PostGenerationEvent.Invoke(generationArguments, Events.EventArguments())
+		generationArguments.InvokePostGenerationEvent()
 
 	def Simulate (self, simulation: ReproductionShared.Simulation, ticks: int, reproductiveTimeMultiplier: typing.Union[float, int]) -> None:
 		"""
@@ -577,6 +537,29 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 
 		return cycleDebugFormatting % (self.TypeIdentifier, length, age, len(self.OvumReleases))
 
+	def _GetPhaseTimeline (self) -> CycleBase._PhaseTimeline:
+		if self._phaseTimeline is None:
+			phaseLengths = dict()  # type: typing.Dict[enum_lib.Enum, float]
+			phaseStartTimes = dict()  # type: typing.Dict[enum_lib.Enum, float]
+			phaseEndTimes = dict()  # type: typing.Dict[enum_lib.Enum, float]
+
+			for phaseType, phase in self._phases.items():
+				phaseLengths[phaseType] = phase.Length
+				phaseStartTimes[phaseType] = phase.StartTime
+				phaseEndTimes[phaseType] = phase.EndTime
+
+			self._phaseTimeline = self._PhaseTimeline(phaseLengths, phaseStartTimes, phaseEndTimes)
+
+		return self._phaseTimeline
+
+	def _InvalidatePhaseTimeline (self) -> None:
+		"""
+		Forget the timing of this cycle's phases, they will be recalculated the next time they are needed. Cycle types must call this whenever something
+		that a phase's length, start time or end time depends on changes.
+		"""
+
+		self._phaseTimeline = None
+
 	def _GenerateInternal (self, generationArguments: CycleEvents.CycleGeneratingArguments) -> None:
 		self._uniqueIdentifier = generationArguments.GetUniqueIdentifier()
 		self._uniqueSeed = generationArguments.GetUniqueSeed()
@@ -622,25 +605,57 @@ class CycleBase(abc.ABC, Savable.SavableExtension):
 			self.End(completedReason = CycleShared.CompletionReasons.Finished)
 
 	def _PlanSimulationInternal (self, simulation: ReproductionShared.Simulation, reproductiveTimeMultiplier: typing.Union[float, int]) -> None:
-		ticksToCompletion = ReproductionShared.ReproductiveMinutesToTicks(self.TimeRemaining, reproductiveTimeMultiplier)  # type: int
+		# Points are found the same way the simulate method finds events, by converting the absolute times to ticks and taking the difference. Converting
+		# the time remaining directly can round to a different tick and make the simulation step over the event.
 
-		if simulation.RemainingTicks >= ticksToCompletion:
-			simulation.Schedule.AddPoint(ticksToCompletion)
+		ageTick = ReproductionShared.ReproductiveMinutesToTicks(self.Age, reproductiveTimeMultiplier)  # type: int
+		remainingTicks = simulation.RemainingTicks  # type: int
+
+		plannedPoints = list()  # type: typing.List[int]
+
+		ticksToCompletion = ReproductionShared.ReproductiveMinutesToTicks(self.Lifetime, reproductiveTimeMultiplier) - ageTick  # type: int
+
+		if 0 < ticksToCompletion <= remainingTicks:
+			plannedPoints.append(ticksToCompletion)
 
 		for ovumRelease in self.OvumReleases:  # type: CycleOvumRelease.OvumRelease
 			if ovumRelease.Released:
 				continue
 
-			ovumReleaseTime = ovumRelease.ReleaseMinute  # type: float
-			minutesToOvumRelease = ovumReleaseTime - self.Age  # type: float
+			ticksToOvumRelease = ReproductionShared.ReproductiveMinutesToTicks(ovumRelease.ReleaseMinute, reproductiveTimeMultiplier) - ageTick  # type: int
 
-			if minutesToOvumRelease <= 0:
-				continue
+			if 0 < ticksToOvumRelease <= remainingTicks:
+				plannedPoints.append(ticksToOvumRelease)
 
-			ticksToOvumRelease = ReproductionShared.ReproductiveMinutesToTicks(minutesToOvumRelease, reproductiveTimeMultiplier)  # type: int
+		if len(plannedPoints) != 0:
+			simulation.Schedule.AddPoints(plannedPoints)
 
-			if ticksToOvumRelease <= 0:
-				continue
+# noinspection PyProtectedMember
+_uniqueIdentifierVerifier = ReproductionShared.CreateUniqueIdentifierVerifier(CycleBase._uniqueIdentifierSavingKey)  # type: typing.Callable
+# noinspection PyProtectedMember
+_uniqueSeedVerifier = ReproductionShared.CreateUniqueSeedVerifier(CycleBase._uniqueSeedSavingKey)  # type: typing.Callable
+# noinspection PyProtectedMember
+_uniqueSeedUpdater = ReproductionShared.CreateUniqueSeedUpdater(CycleBase._uniqueSeedSavingKey)  # type: typing.Callable
+
+# noinspection PyUnusedLocal, PyProtectedMember
+def _OvumReleasesUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
+	if CycleBase._ovumReleasesOldSavingKey in data and not CycleBase._ovumReleasesSavingKey in data:
+		data[CycleBase._ovumReleasesSavingKey] = data[CycleBase._ovumReleasesOldSavingKey]
+
+	if not CycleBase._ovumReleasesSavingKey in data:
+		return
+
+	ovumReleasesData = data[CycleBase._ovumReleasesSavingKey]  # type: typing.List[typing.Union[float, int, dict]]
+
+	if not isinstance(ovumReleasesData, list):
+		return
+
+	for ovumReleaseDataIndex in range(len(ovumReleasesData)):  # type: int
+		ovumReleaseData = ovumReleasesData[ovumReleaseDataIndex]  # type: typing.Union[float, int, dict]
 
-			if simulation.RemainingTicks >= ticksToOvumRelease:
-				simulation.Schedule.AddPoint(ticksToOvumRelease)
+		if isinstance(ovumReleaseData, (float, int)):
+			ovumRelease = CycleOvumRelease.OvumRelease()
+			ovumRelease.BaseReleaseMinute = ovumReleaseData
+			ovumReleasesData[ovumReleaseDataIndex] = {
+				"Data": ovumRelease.SaveToDictionary()[1]
+			}
@@ -76,6 +76,7 @@ class MenstrualCycle(CycleBase.CycleBase):
 			raise ValueError("FollicularLength values must be greater than or equal to 0.")
 
 		self._follicularLength = value
+		self._InvalidatePhaseTimeline()
 
 	@property
 	def FollicularStartMinute (self) -> float:
@@ -119,6 +120,7 @@ class MenstrualCycle(CycleBase.CycleBase):
 			raise ValueError("OvulationLength values must be greater than or equal to 0.")
 
 		self._ovulationLength = value
+		self._InvalidatePhaseTimeline()
 
 	@property
 	def OvulationStartMinute (self) -> float:
@@ -161,6 +163,7 @@ class MenstrualCycle(CycleBase.CycleBase):
 			raise ValueError("LutealLength values must be greater than or equal to 0.")
 
 		self._lutealLength = value
+		self._InvalidatePhaseTimeline()
 
 	@property
 	def LutealStartMinute (self) -> float:
@@ -204,6 +207,7 @@ class MenstrualCycle(CycleBase.CycleBase):
 			raise ValueError("MenstruationLength values must be greater than or equal to 0.")
 
 		self._menstruationLength = value
+		self._InvalidatePhaseTimeline()
 
 	@property
 	def MenstruationStartMinute (self) -> float:
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import typing
 
-from NeonOcean.S4.Main.Tools import Savable, Exceptions, Version
+from NeonOcean.S4.Cycle import This
+from NeonOcean.S4.Cycle.Tools import Probability
+from NeonOcean.S4.Main import Debug
+from NeonOcean.S4.Main.Tools import Savable, Exceptions, Python, Version
+
+_ovumReleaseAmountTables = dict()  # type: typing.Dict[int, typing.Tuple[Probability.Probability, OvumReleaseAmountTable]]  # Keyed by the python id of the probability objects, the probability object is kept to stop the id from being reused.
 
 class OvumRelease(Savable.SavableExtension):
 	_baseReleaseMinuteSavingKey = "BaseReleaseMinute"  # type: str
@@ -25,49 +30,14 @@ class OvumRelease(Savable.SavableExtension):
 
 		self._releaseMinuteGuarantors = list()  # type: typing.List[str]
 
-		# noinspection PyUnusedLocal
-		def releaseMinuteUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
-			if self._baseReleaseMinuteOldSavingKey in data and not self._baseReleaseMinuteSavingKey in data:
-				data[self._baseReleaseMinuteSavingKey] = data[self._baseReleaseMinuteOldSavingKey]
-
-		def releaseGuarantorsTypeVerifier (value: typing.List[str]) -> None:
-			if not isinstance(value, list):
-				raise Exceptions.IncorrectTypeException(value, "ReleaseGuarantors", (list, ))
-
-			for guarantorIndex in range(len(value)):  # type: int
-				guarantor = value[guarantorIndex]  # type: str
-
-				if not isinstance(guarantor, str):
-					raise Exceptions.IncorrectTypeException(value, "ReleaseGuarantors[%s]" % guarantorIndex, (str, ))
-
-		def blockGuarantorsTypeVerifier (value: typing.List[str]) -> None:
-			if not isinstance(value, list):
-				raise Exceptions.IncorrectTypeException(value, "BlockGuarantors", (list, ))
-
-			for guarantorIndex in range(len(value)):  # type: int
-				guarantor = value[guarantorIndex]  # type: str
-
-				if not isinstance(guarantor, str):
-					raise Exceptions.IncorrectTypeException(value, "BlockGuarantors[%s]" % guarantorIndex, (str, ))
-
-		def releaseMinuteGuarantorsTypeVerifier (value: typing.List[str]) -> None:
-			if not isinstance(value, list):
-				raise Exceptions.IncorrectTypeException(value, "ReleaseMinuteGuarantors", (list, ))
-
-			for guarantorIndex in range(len(value)):  # type: int
-				guarantor = value[guarantorIndex]  # type: str
-
-				if not isinstance(guarantor, str):
-					raise Exceptions.IncorrectTypeException(value, "ReleaseMinuteGuarantors[%s]" % guarantorIndex, (str, ))
-
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("BaseReleaseMinute", "BaseReleaseMinute", self.ReleaseMinute, requiredAttribute = True, updater = releaseMinuteUpdater))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("BaseReleaseMinute", "BaseReleaseMinute", self.ReleaseMinute, requiredAttribute = True, updater = _ReleaseMinuteUpdater))
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("ReleaseDelay", "ReleaseDelay", self.ReleaseDelay, requiredAttribute = True))
 
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("Released", "Released", self.Released))
 
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("ReleaseGuarantors", "_releaseGuarantors", list(), typeVerifier = releaseGuarantorsTypeVerifier))
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("BlockGuarantors", "_blockGuarantors", list(), typeVerifier = blockGuarantorsTypeVerifier))
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("ReleaseMinuteGuarantors", "_releaseMinuteGuarantors", list(), typeVerifier = releaseMinuteGuarantorsTypeVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("ReleaseGuarantors", "_releaseGuarantors", list(), typeVerifier = _ReleaseGuarantorsTypeVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("BlockGuarantors", "_blockGuarantors", list(), typeVerifier = _BlockGuarantorsTypeVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("ReleaseMinuteGuarantors", "_releaseMinuteGuarantors", list(), typeVerifier = _ReleaseMinuteGuarantorsTypeVerifier))
 
 	@property
 	def ReleaseMinute (self) -> float:
@@ -204,4 +174,95 @@ class OvumRelease(Savable.SavableExtension):
 		if not isinstance(guarantorIdentifier, str):
 			raise Exceptions.IncorrectTypeException(guarantorIdentifier, "guarantorIdentifier", (str, ))
 
-		return guarantorIdentifier in self._releaseMinuteGuarantors
\ No newline at end of file
+		return guarantorIdentifier in self._releaseMinuteGuarantors
+
+class OvumReleaseAmountTable:
+	def __init__ (self, ovumReleaseAmountProbability: Probability.Probability):
+		"""
+		The ovum release amounts of a cycle guide's release amount probability, parsed ahead of time. Choosing an amount from this table will give the
+		same result as choosing an option from the probability object with the same seed.
+		:param ovumReleaseAmountProbability: The probability object whose options' identifiers are the amount of egg cells to be released.
+		:type ovumReleaseAmountProbability: Probability.Probability
+		"""
+
+		if not isinstance(ovumReleaseAmountProbability, Probability.Probability):
+			raise Exceptions.IncorrectTypeException(ovumReleaseAmountProbability, "ovumReleaseAmountProbability", (Probability.Probability,))
+
+		ovumReleaseAmounts = list()  # type: typing.List[int]
+		ovumReleaseAmountWeights = list()  # type: typing.List[float]
+
+		for ovumReleaseAmountOption in ovumReleaseAmountProbability.Options:  # type: Probability.Option
+			try:
+				ovumReleaseAmount = int(ovumReleaseAmountOption.Identifier)  # type: int
+			except ValueError:
+				Debug.Log("Failed to parse %s to a valid ovum count (an int)." % ovumReleaseAmountOption.Identifier, This.Mod.Namespace, Debug.LogLevels.Error, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()))
+				ovumReleaseAmount = 1
+
+			ovumReleaseAmounts.append(ovumReleaseAmount)
+			ovumReleaseAmountWeights.append(ovumReleaseAmountOption.Weight)
+
+		self._ovumReleaseAmounts = tuple(ovumReleaseAmounts)  # type: typing.Tuple[int, ...]
+		self._ovumReleaseAmountWeights = tuple(ovumReleaseAmountWeights)  # type: typing.Tuple[float, ...]
+
+	@property
+	def OvumReleaseAmounts (self) -> typing.Tuple[int, ...]:
+		"""
+		Every amount of egg cells that can be released, in the order of the probability object's options.
+		"""
+
+		return self._ovumReleaseAmounts
+
+	@property
+	def OvumReleaseAmountWeights (self) -> typing.Tuple[float, ...]:
+		"""
+		The weight of each ovum release amount.
+		"""
+
+		return self._ovumReleaseAmountWeights
+
+	def ChooseOvumReleaseAmount (self, seed: typing.Hashable = None) -> int:
+		"""
+		Randomly select an amount of egg cells to be released.
+		"""
+
+		return self._ovumReleaseAmounts[Probability.ChooseWeightedIndex(self._ovumReleaseAmountWeights, seed)]
+
+def GetOvumReleaseAmountTable (ovumReleaseAmountProbability: Probability.Probability) -> OvumReleaseAmountTable:
+	"""
+	Get the ovum release amount table for this probability object, the table will only be built the first time it is requested. This should only be
+	used with probability objects that will not change, such as the ones in cycle guides.
+	"""
+
+	cachedTable = _ovumReleaseAmountTables.get(id(ovumReleaseAmountProbability), None)  # type: typing.Optional[typing.Tuple[Probability.Probability, OvumReleaseAmountTable]]
+
+	if cachedTable is not None and cachedTable[0] is ovumReleaseAmountProbability:
+		return cachedTable[1]
+
+	ovumReleaseAmountTable = OvumReleaseAmountTable(ovumReleaseAmountProbability)  # type: OvumReleaseAmountTable
+	_ovumReleaseAmountTables[id(ovumReleaseAmountProbability)] = (ovumReleaseAmountProbability, ovumReleaseAmountTable)
+
+	return ovumReleaseAmountTable
+
+# noinspection PyUnusedLocal, PyProtectedMember
+def _ReleaseMinuteUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
+	if OvumRelease._baseReleaseMinuteOldSavingKey in data and not OvumRelease._baseReleaseMinuteSavingKey in data:
+		data[OvumRelease._baseReleaseMinuteSavingKey] = data[OvumRelease._baseReleaseMinuteOldSavingKey]
+
+def _ReleaseGuarantorsTypeVerifier (value: typing.List[str]) -> None:
+	_VerifyGuarantors(value, "ReleaseGuarantors")
+
+def _BlockGuarantorsTypeVerifier (value: typing.List[str]) -> None:
+	_VerifyGuarantors(value, "BlockGuarantors")
+
+def _ReleaseMinuteGuarantorsTypeVerifier (value: typing.List[str]) -> None:
+	_VerifyGuarantors(value, "ReleaseMinuteGuarantors")
+
+def _VerifyGuarantors (value: typing.List[str], attributeName: str) -> None:
+	if not isinstance(value, list):
+		raise Exceptions.IncorrectTypeException(value, attributeName, (list, ))
+
+	for guarantorIndex in range(len(value)):  # type: int
+		guarantor = value[guarantorIndex]  # type: str
+
+		if not isinstance(guarantor, str):
+			raise Exceptions.IncorrectTypeException(value, "%s[%s]" % (attributeName, guarantorIndex), (str, ))
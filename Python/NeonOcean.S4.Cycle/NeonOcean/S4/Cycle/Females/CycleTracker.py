@@ -4,10 +4,11 @@ import random
 import typing
 
 from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Females import Ovum, Shared as FemalesShared
 from NeonOcean.S4.Cycle.Females.Cycle import Base as CycleBase, Shared as CycleShared, Types as CycleTypes, OvumRelease as CycleOvumRelease
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Parse, Python, Savable, Types
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Parse, Python, Savable
 from sims import sim_info_types, sim_info
 
 class CycleTrackerSimulationMemory:
@@ -308,14 +309,7 @@ class CycleTracker(ReproductionShared.TrackerBase):
 
 			self.TrackingSystem.Simulation.NeedToPlan = True
 
-		cycleChangedEventArguments = CycleEvents.CycleAbortTestingArguments()  # type: CycleEvents.CycleAbortTestingArguments
-
-		for cycleChangedCallback in self.CycleChangedEvent:
-			try:
-				cycleChangedCallback(self, cycleChangedEventArguments)
-			except:
-				Debug.Log("Failed to call cycle changed callback '" + Types.GetFullName(cycleChangedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = cycleChangedCallback)
+		EventsDispatch.DispatchLazily("CycleTracker.CycleChangedEvent", self.CycleChangedEvent, self, self.TrackingSystem, CycleEvents.CycleAbortTestingArguments)
 
 	@property
 	def CycleObjectsGenerated (self) -> int:
@@ -325,6 +319,16 @@ class CycleTracker(ReproductionShared.TrackerBase):
 
 		return self._cycleObjectsGenerated
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return FemalesShared.FemaleTrackerDependencies
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -344,14 +348,11 @@ class CycleTracker(ReproductionShared.TrackerBase):
 			self.CycleStartTestingSeed = self.TrackingSystem.CurrentSeed
 
 		eventArguments = CycleEvents.CycleStartTestingArguments(self.CycleStartTestingSeed, self.TimeSinceLastCycle)  # type: CycleEvents.CycleStartTestingArguments
-		self.CycleStartTestingEvent.Invoke(self, eventArguments)
 
-		for cycleStartTestingCallback in self.CycleStartTestingEvent:
-			try:
-				cycleStartTestingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call cycle start testing callback '" + Types.GetFullName(cycleStartTestingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = cycleStartTestingCallback)
+		# The callbacks are called twice, first letting any exception propagate as the event handler's invoke method would, then again with exceptions
+		# logged and ignored.
+		EventsDispatch.Dispatch("CycleTracker.CycleStartTestingEvent", self.CycleStartTestingEvent, self, eventArguments, reportExceptions = False)
+		EventsDispatch.Dispatch("CycleTracker.CycleStartTestingEvent", self.CycleStartTestingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		return eventArguments
 
@@ -364,12 +365,7 @@ class CycleTracker(ReproductionShared.TrackerBase):
 
 		eventArguments = CycleEvents.CycleAbortTestingArguments()  # type: CycleEvents.CycleAbortTestingArguments
 
-		for cycleAbortTestingCallback in self.CycleAbortTestingEvent:
-			try:
-				cycleAbortTestingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call cycle abort testing callback '" + Types.GetFullName(cycleAbortTestingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = cycleAbortTestingCallback)
+		EventsDispatch.Dispatch("CycleTracker.CycleAbortTestingEvent", self.CycleAbortTestingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		return eventArguments
 
@@ -384,12 +380,7 @@ class CycleTracker(ReproductionShared.TrackerBase):
 
 		eventArguments = CycleEvents.CycleReleaseOvumTestingArguments(ovumRelease)  # type: CycleEvents.CycleReleaseOvumTestingArguments
 
-		for cycleReleaseOvumTestingCallback in self.CycleReleaseOvumTestingEvent:
-			try:
-				cycleReleaseOvumTestingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call cycle release ovum testing callback '" + Types.GetFullName(cycleReleaseOvumTestingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = cycleReleaseOvumTestingCallback)
+		EventsDispatch.Dispatch("CycleTracker.CycleReleaseOvumTestingEvent", self.CycleReleaseOvumTestingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		return eventArguments
 
@@ -426,12 +417,7 @@ class CycleTracker(ReproductionShared.TrackerBase):
 		eventArgumentsType = cycle.GetGenerationArgumentsType(self.TrackingSystem)  # type: typing.Type[CycleEvents.CycleGeneratingArguments]
 		eventArguments = eventArgumentsType(generationSeed, cycle, cycleGuide)
 
-		for cycleGeneratingCallback in self.CycleGeneratingEvent:
-			try:
-				cycleGeneratingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call cycle generating callback '" + Types.GetFullName(cycleGeneratingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = cycleGeneratingCallback)
+		EventsDispatch.Dispatch("CycleTracker.CycleGeneratingEvent", self.CycleGeneratingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		cycle.Generate(eventArguments)
 
@@ -535,7 +521,8 @@ class CycleTracker(ReproductionShared.TrackerBase):
 			self.TimeSinceLastCycle += simulatingMinutes
 
 		if self.CurrentCycle is not None:
-			cycleTicksRemaining = ReproductionShared.ReproductiveMinutesToTicks(self.CurrentCycle.TimeRemaining, reproductiveTimeMultiplier)  # type: typing.Union[float, int]
+			cycleTicksRemaining = ReproductionShared.ReproductiveMinutesToTicks(self.CurrentCycle.Lifetime, reproductiveTimeMultiplier) - \
+								  ReproductionShared.ReproductiveMinutesToTicks(self.CurrentCycle.Age, reproductiveTimeMultiplier)  # type: int
 
 			if cycleTicksRemaining < ticks:
 				Debug.Log("Simulation stepped over the end of a cycle by %s ticks, this may cause lost time for the tracking sim.\n%s" % (str(ticks - cycleTicksRemaining), self.DebugInformation),
@@ -613,18 +600,11 @@ class CycleTracker(ReproductionShared.TrackerBase):
 			ReproductionShared.SimulationPhase(0, self._CycleSimulationPhase)
 		)
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return FemalesShared.GetCycleTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return FemalesShared.GetCycleTrackerReproductiveTimeMultiplier(multipliers)
 
 	def _CurrentCycleCompletedCallback (self, completionReason: CycleShared.CompletionReasons) -> None:
-		eventArguments = CycleEvents.CycleCompletedArguments(completionReason)  # type: CycleEvents.CycleCompletedArguments
-
-		for cycleCompletedCallback in self.CycleCompletedEvent:
-			try:
-				cycleCompletedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call cycle completed callback '" + Types.GetFullName(cycleCompletedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = cycleCompletedCallback)
+		EventsDispatch.DispatchLazily("CycleTracker.CycleCompletedEvent", self.CycleCompletedEvent, self, self.TrackingSystem, CycleEvents.CycleCompletedArguments, completionReason)
 
 		self.CurrentCycle = None
 
@@ -4,10 +4,10 @@ import random
 import typing
 import uuid
 
-from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, Settings, This
+from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
 from NeonOcean.S4.Cycle.Tools import SimPointer
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Events, Exceptions, Python, Sims as ToolsSims, Savable, Version
+from NeonOcean.S4.Main.Tools import Exceptions, Python, Sims as ToolsSims, Savable
 from sims import sim_info
 
 class Ovum(Savable.SavableExtension):
@@ -39,34 +39,8 @@ class Ovum(Savable.SavableExtension):
 
 		self._blockedSperm = list()  # type: typing.List[str]
 
-		encodeUUID = lambda value: str(value) if value is not None else None
-		decodeUUID = lambda valueString: uuid.UUID(valueString) if valueString is not None else None
-
-		# noinspection PyUnusedLocal
-		def uniqueSeedUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
-			if isinstance(data.get(self._uniqueSeedSavingKey, None), list):
-				data[self._uniqueSeedSavingKey] = None
-
-		def uniqueIdentifierVerifier (value: typing.Optional[uuid.UUID]) -> None:
-			if not isinstance(value, uuid.UUID) and value is not None:
-				raise Exceptions.IncorrectTypeException(value, self._uniqueIdentifierSavingKey, (uuid.UUID, None))
-
-		def uniqueSeedVerifier (value: typing.Optional[int]) -> None:
-			if not isinstance(value, int) and value is not None:
-				raise Exceptions.IncorrectTypeException(value, self._uniqueSeedSavingKey, (int, None))
-
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueIdentifierSavingKey, "_uniqueIdentifier", None, encoder = encodeUUID, decoder = decodeUUID, typeVerifier = uniqueIdentifierVerifier))
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueSeedSavingKey, "_uniqueSeed", None, updater = uniqueSeedUpdater, typeVerifier = uniqueSeedVerifier))
-
-		def blockedSpermTypeVerifier (value: typing.List[str]) -> None:
-			if not isinstance(value, list):
-				raise Exceptions.IncorrectTypeException(value, "BlockedSperm", (list, ))
-
-			for blockedSpermIndex in range(len(value)):  # type: int
-				blockedSperm = value[blockedSpermIndex]  # type: str
-
-				if not isinstance(blockedSperm, str):
-					raise Exceptions.IncorrectTypeException(value, "BlockedSperm[%s]" % blockedSpermIndex, (str, ))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueIdentifierSavingKey, "_uniqueIdentifier", None, encoder = ReproductionShared.EncodeUUID, decoder = ReproductionShared.DecodeUUID, typeVerifier = _uniqueIdentifierVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueSeedSavingKey, "_uniqueSeed", None, updater = _uniqueSeedUpdater, typeVerifier = _uniqueSeedVerifier))
 
 		self.RegisterSavableAttribute(Savable.StaticSavableAttributeHandler("SourcePointer", "SourcePointer", requiredSuccess = False))
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("NormalLifetime", "NormalLifetime", self.NormalLifetime))
@@ -77,7 +51,7 @@ class Ovum(Savable.SavableExtension):
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("Fertilized", "Fertilized", self.Fertilized))
 		self.RegisterSavableAttribute(Savable.StaticSavableAttributeHandler("FertilizerPointer", "FertilizerPointer", requiredSuccess = False))
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("Fertilized", "Fertilized", self.Fertilized))
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("BlockedSperm", "_blockedSperm", list(), typeVerifier = blockedSpermTypeVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("BlockedSperm", "_blockedSperm", list(), typeVerifier = _BlockedSpermTypeVerifier))
 
 	@property
 	def UniqueIdentifier (self) -> uuid.UUID:
@@ -441,9 +415,9 @@ class Ovum(Savable.SavableExtension):
 		if not isinstance(generationArguments, CycleEvents.OvumGeneratingArguments):
 			raise Exceptions.IncorrectTypeException(generationArguments, "generationArguments", (CycleEvents.OvumGeneratingArguments,))
 
-		generationArguments.PreGenerationEvent.Invoke(generationArguments, Events.EventArguments())
+		generationArguments.InvokePreGenerationEvent()
 		self._GenerateInternal(generationArguments)
-		generationArguments.PostGenerationEvent.Invoke(generationArguments, Events.EventArguments())
+		generationArguments.InvokePostGenerationEvent()
 
 	def BlockSperm (self, *spermIdentifiers) -> None:
 		"""
@@ -547,7 +521,7 @@ class Ovum(Savable.SavableExtension):
 	# noinspection PyUnusedLocal
 	def _SimulateInternal (self, simulation: ReproductionShared.Simulation, ticks: int, reproductiveTimeMultiplier: float) -> None:
 		simulatingMinutes = ReproductionShared.TicksToReproductiveMinutes(ticks, reproductiveTimeMultiplier)  # type: float
-		quickMode = Settings.QuickMode.Get()  # type: bool
+		quickMode = simulation.SettingsSnapshot.QuickMode  # type: bool
 
 		if not self.Fertilized:
 			decaying = False  # type: bool
@@ -579,7 +553,7 @@ class Ovum(Savable.SavableExtension):
 		self.Age += simulatingMinutes
 
 	def _PlanSimulationInternal (self, simulation: ReproductionShared.Simulation, reproductiveTimeMultiplier: float) -> None:
-		quickMode = Settings.QuickMode.Get()  # type: bool
+		quickMode = simulation.SettingsSnapshot.QuickMode  # type: bool
 
 		if not self.Fertilized:
 			decayTick = ReproductionShared.ReproductiveMinutesToTicks(self.TimeRemaining, reproductiveTimeMultiplier)  # type: int
@@ -625,3 +599,20 @@ def GenerateGenericOvum (source: typing.Optional[sim_info.SimInfo] = None, ovumG
 	generatingOvum.Generate(generationArguments)
 
 	return generatingOvum
+
+# noinspection PyProtectedMember
+_uniqueIdentifierVerifier = ReproductionShared.CreateUniqueIdentifierVerifier(Ovum._uniqueIdentifierSavingKey)  # type: typing.Callable
+# noinspection PyProtectedMember
+_uniqueSeedVerifier = ReproductionShared.CreateUniqueSeedVerifier(Ovum._uniqueSeedSavingKey)  # type: typing.Callable
+# noinspection PyProtectedMember
+_uniqueSeedUpdater = ReproductionShared.CreateUniqueSeedUpdater(Ovum._uniqueSeedSavingKey)  # type: typing.Callable
+
+def _BlockedSpermTypeVerifier (value: typing.List[str]) -> None:
+	if not isinstance(value, list):
+		raise Exceptions.IncorrectTypeException(value, "BlockedSperm", (list, ))
+
+	for blockedSpermIndex in range(len(value)):  # type: int
+		blockedSperm = value[blockedSpermIndex]  # type: str
+
+		if not isinstance(blockedSperm, str):
+			raise Exceptions.IncorrectTypeException(value, "BlockedSperm[%s]" % blockedSpermIndex, (str, ))
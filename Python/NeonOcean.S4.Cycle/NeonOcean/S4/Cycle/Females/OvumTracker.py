@@ -5,15 +5,16 @@ import textwrap
 import typing
 
 from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Females import Ovum, Shared as FemalesShared
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable, Types
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable
 from sims import sim_info
 
 
 class OvumTrackerSimulationMemory:
 	def __init__ (self):
-		self.OvumFertilizationTesting = dict()  # type: typing.Dict[str, CycleEvents.OvumFertilizationTestingArguments]
+		self.OvumFertilizationTesting = dict()  # type: typing.Dict[int, CycleEvents.OvumFertilizationTestingArguments]  # Keyed by the ova's simulation handles.
 
 class OvumTracker(ReproductionShared.TrackerBase):
 	def __init__ (self, trackingSystem: ReproductionShared.ReproductiveSystem):
@@ -168,6 +169,16 @@ class OvumTracker(ReproductionShared.TrackerBase):
 
 		return self._ovumObjectsGenerated
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return FemalesShared.FemaleTrackerDependencies
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -191,12 +202,7 @@ class OvumTracker(ReproductionShared.TrackerBase):
 		eventsSeed = ovum.FertilizationSeed + 71299844
 		eventArguments = CycleEvents.OvumFertilizationTestingArguments(eventsSeed, ovum)  # type: CycleEvents.OvumFertilizationTestingArguments
 
-		for ovumFertilizationTestingCallback in self.OvumFertilizationTestingEvent:
-			try:
-				ovumFertilizationTestingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call an ovum fertilization testing callback '" + Types.GetFullName(ovumFertilizationTestingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = ovumFertilizationTestingCallback)
+		EventsDispatch.Dispatch("OvumTracker.OvumFertilizationTestingEvent", self.OvumFertilizationTestingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		return eventArguments
 
@@ -215,12 +221,7 @@ class OvumTracker(ReproductionShared.TrackerBase):
 		eventsSeed = ovum.FertilizationSeed + -865356260
 		eventArguments = CycleEvents.OvumImplantationTestingArguments(eventsSeed, ovum)  # type: CycleEvents.OvumImplantationTestingArguments
 
-		for ovumImplantationTestingCallback in self.OvumImplantationTestingEvent:
-			try:
-				ovumImplantationTestingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call an ovum implantation testing callback '" + Types.GetFullName(ovumImplantationTestingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = ovumImplantationTestingCallback)
+		EventsDispatch.Dispatch("OvumTracker.OvumImplantationTestingEvent", self.OvumImplantationTestingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		return eventArguments
 
@@ -241,14 +242,7 @@ class OvumTracker(ReproductionShared.TrackerBase):
 			if self.TrackingSystem.Simulating:
 				self.TrackingSystem.Simulation.NeedToPlan = True
 
-			releaseEventArguments = CycleEvents.OvumReleasedArguments(releasingOvum)
-
-			for ovumReleasedCallback in self.OvumReleasedEvent:
-				try:
-					ovumReleasedCallback(self, releaseEventArguments)
-				except:
-					Debug.Log("Failed to call an ovum released callback '" + Types.GetFullName(ovumReleasedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-							  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = ovumReleasedCallback)
+			EventsDispatch.DispatchLazily("OvumTracker.OvumReleasedEvent", self.OvumReleasedEvent, self, self.TrackingSystem, CycleEvents.OvumReleasedArguments, releasingOvum)
 
 	def GenerateOvum (self) -> Ovum.Ovum:
 		"""
@@ -263,7 +257,7 @@ class OvumTracker(ReproductionShared.TrackerBase):
 		ovum = Ovum.Ovum()
 		ovumGuide = ovum.GetOvumGuide(self.TrackingSystem)  # type: CycleGuides.OvumGuide
 		ovumGeneratingArguments = CycleEvents.OvumGeneratingArguments(generationSeed, ovum, ovumGuide)
-		self.OvumGeneratingEvent.Invoke(self, ovumGeneratingArguments)
+		EventsDispatch.Dispatch("OvumTracker.OvumGeneratingEvent", self.OvumGeneratingEvent, self, ovumGeneratingArguments, debugSource = self.TrackingSystem, reportExceptions = False)
 		ovum.Generate(ovumGeneratingArguments)
 
 		self._ovumObjectsGenerated += 1
@@ -335,26 +329,14 @@ class OvumTracker(ReproductionShared.TrackerBase):
 		fertilizingEventSeed = fertilizingOvum.FertilizationSeed + 136275445
 		fertilizingEventArguments = CycleEvents.OvumFertilizingArguments(fertilizingEventSeed, fertilizingOvum)  # type: CycleEvents.OvumFertilizingArguments
 
-		for ovumFertilizingCallback in self.OvumFertilizingEvent:
-			try:
-				ovumFertilizingCallback(self, fertilizingEventArguments)
-			except:
-				Debug.Log("Failed to call ovum fertilizing callback '" + Types.GetFullName(ovumFertilizingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = ovumFertilizingCallback)
+		EventsDispatch.Dispatch("OvumTracker.OvumFertilizingEvent", self.OvumFertilizingEvent, self, fertilizingEventArguments, debugSource = self.TrackingSystem)
 
 		fertilizingOvum.FertilizeWithEvent(fertilizingEventArguments)
 
 		if self.TrackingSystem.Simulating:
 			self.TrackingSystem.Simulation.NeedToPlan = True
 
-		fertilizedEventArguments = CycleEvents.OvumFertilizedArguments(fertilizingEventArguments)  # type: CycleEvents.OvumFertilizedArguments
-
-		for ovumFertilizedCallback in self.OvumFertilizedEvent:
-			try:
-				ovumFertilizedCallback(self, fertilizedEventArguments)
-			except:
-				Debug.Log("Failed to call ovum fertilized callback '" + Types.GetFullName(ovumFertilizedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = ovumFertilizedCallback)
+		EventsDispatch.DispatchLazily("OvumTracker.OvumFertilizedEvent", self.OvumFertilizedEvent, self, self.TrackingSystem, CycleEvents.OvumFertilizedArguments, fertilizingEventArguments)
 
 	def ImplantIfPossible (self, implantingOvum: Ovum.Ovum, forceImplant: bool = False) -> bool:
 		"""
@@ -428,16 +410,19 @@ class OvumTracker(ReproductionShared.TrackerBase):
 		simulationMemoryExists = simulationMemoryKey in simulation.Memory  # type: bool
 		simulationMemory = simulation.Memory.get(simulationMemoryKey, OvumTrackerSimulationMemory())  # type: OvumTrackerSimulationMemory
 
+		simulationHandles = simulation.Handles  # type: ReproductionShared.HandleTable
+
 		for activeOvum in self.ActiveOva:  # type: Ovum.Ovum
 			if not activeOvum.Fertilized:
-				ovumFertilizationTesting = simulationMemory.OvumFertilizationTesting.get(str(activeOvum.UniqueIdentifier), None)  # type: typing.Optional[CycleEvents.OvumFertilizationTestingArguments]
+				ovumHandle = simulationHandles.GetHandle(activeOvum)  # type: int
+				ovumFertilizationTesting = simulationMemory.OvumFertilizationTesting.get(ovumHandle, None)  # type: typing.Optional[CycleEvents.OvumFertilizationTestingArguments]
 
 				if ovumFertilizationTesting is None:
 					Debug.Log("Expected the ovum fertilization testing' for an ovum with the identifier '" + str(activeOvum.UniqueIdentifier) + "' to be in the simulation memory, but it wasn't there.\n" + self.DebugInformation,
 							  This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = self.TrackingSystem)
 
 					ovumFertilizationTesting = self.DoOvumFertilizationTesting(activeOvum)  # type: CycleEvents.OvumFertilizationTestingArguments
-					simulationMemory.OvumFertilizationTesting[str(activeOvum.UniqueIdentifier)] = ovumFertilizationTesting
+					simulationMemory.OvumFertilizationTesting[ovumHandle] = ovumFertilizationTesting
 
 				if ovumFertilizationTesting.ShouldFertilize():
 					self.FertilizeOvum(activeOvum)
@@ -452,13 +437,14 @@ class OvumTracker(ReproductionShared.TrackerBase):
 		reproductiveTimeMultiplier = self.ReproductiveTimeMultiplier  # type: typing.Union[float, int]
 
 		trackerSimulationMemory = OvumTrackerSimulationMemory()  # type: OvumTrackerSimulationMemory
+		simulationHandles = simulation.Handles  # type: ReproductionShared.HandleTable
 
 		for activeOvum in self.ActiveOva:  # type: Ovum.Ovum
 			activeOvum.PlanSimulation(simulation, reproductiveTimeMultiplier)
 
 			if not activeOvum.Fertilized:
 				ovumFertilizationTesting = self.DoOvumFertilizationTesting(activeOvum)
-				trackerSimulationMemory.OvumFertilizationTesting[str(activeOvum.UniqueIdentifier)] = ovumFertilizationTesting
+				trackerSimulationMemory.OvumFertilizationTesting[simulationHandles.GetHandle(activeOvum)] = ovumFertilizationTesting
 
 		simulation.Memory[self.SimulationMemoryKey] = trackerSimulationMemory
 
@@ -469,8 +455,8 @@ class OvumTracker(ReproductionShared.TrackerBase):
 			ReproductionShared.SimulationPhase(20, self._OvumSimulationPhase)
 		)
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return FemalesShared.GetOvumTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return FemalesShared.GetOvumTrackerReproductiveTimeMultiplier(multipliers)
 
 	def _OnLoaded (self) -> None:
 		for activeOva in self._activeOva:
@@ -72,6 +72,8 @@ def _ClearPregnancy (self: pregnancy_tracker.PregnancyTracker, *args, **kwargs)
 # noinspection PyUnusedLocal
 def _SettingsOnUpdateCallback (owner, eventArguments: SettingsBase.UpdateEventArguments) -> None:
 	if eventArguments.Changed(Settings.PregnancySpeed.Key):
+		ReproductionShared.InvalidateReproductiveTimeMultipliers()
+
 		for simReproductiveSystem in Reproduction.GetAllSystems(automaticallyUpdate = False):
 			pregnancyTracker = simReproductiveSystem.GetTracker(FemalesShared.PregnancyTrackerIdentifier)  # type: typing.Optional[PregnancyTracker.PregnancyTracker]
 
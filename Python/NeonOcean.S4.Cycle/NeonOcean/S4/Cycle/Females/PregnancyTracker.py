@@ -5,10 +5,11 @@ import random
 
 import services
 from NeonOcean.S4.Cycle import Events as CycleEvents, References, ReproductionShared, This, Guides
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Females import Shared as FemalesShared
 from NeonOcean.S4.Cycle.Females.Cycle import Shared as CycleShared
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Types
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python
 from protocolbuffers import PersistenceBlobs_pb2
 from sims import sim_info, sim_info_types
 from sims4 import resources
@@ -85,6 +86,16 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 
 		return True
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return ReproductionShared.TrackerDependencies.Nothing
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -106,14 +117,8 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 			return
 
 		self.MonitoringPregnancy = True
-		eventArguments = CycleEvents.PregnancyStartedArguments()
 
-		for pregnancyStartedCallback in self.PregnancyStartedEvent:
-			try:
-				pregnancyStartedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call pregnancy started callback '" + Types.GetFullName(pregnancyStartedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = pregnancyStartedCallback)
+		EventsDispatch.DispatchLazily("PregnancyTracker.PregnancyStartedEvent", self.PregnancyStartedEvent, self, self.TrackingSystem, CycleEvents.PregnancyStartedArguments)
 
 		self.SetPregnancyVisualsIfAppropriate()
 
@@ -130,14 +135,8 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 			return
 
 		self.MonitoringPregnancy = False
-		eventArguments = CycleEvents.PregnancyEndedArguments()
 
-		for pregnancyEndedCallback in self.PregnancyEndedEvent:
-			try:
-				pregnancyEndedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call pregnancy ended callback '" + Types.GetFullName(pregnancyEndedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = pregnancyEndedCallback)
+		EventsDispatch.DispatchLazily("PregnancyTracker.PregnancyEndedEvent", self.PregnancyEndedEvent, self, self.TrackingSystem, CycleEvents.PregnancyEndedArguments)
 
 		self.ResetPregnancyVisualsIfAppropriate()
 
@@ -167,6 +166,9 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 		if not isinstance(addOffspring, bool):
 			raise Exceptions.IncorrectTypeException(addOffspring, "addOffspring", (bool,))
 
+		if self.TrackingSystem.Replaying:
+			return
+
 		if firstParent is None and secondParent is None:
 			firstParent = self.TrackingSystem.SimInfo
 			secondParent = self.TrackingSystem.SimInfo
@@ -242,7 +244,7 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 		if pregnancyProgress < 0 or pregnancyProgress > 1:
 			raise ValueError("The parameter 'pregnancyProgress' must be between or equal to 0 and 1.")
 
-		if not self.IsPregnant:
+		if not self.IsPregnant or self.TrackingSystem.Replaying:
 			return
 
 		gamePregnancyTracker = self.TrackingSystem.SimInfo.pregnancy_tracker
@@ -401,6 +403,9 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 		return 0
 
 	def _ApplyBellyModifierValue (self, applyingModifierValue: float) -> None:
+		if self.TrackingSystem.Replaying:
+			return
+
 		hasFeminineFrameTrait = self._HasFeminineFrameTrait()  # type: bool
 		hasMasculineFrameTrait = self._HasMasculineFrameTrait()  # type: bool
 
@@ -562,8 +567,8 @@ class PregnancyTracker(ReproductionShared.TrackerBase):
 			ReproductionShared.SimulationPhase(-30, self._PregnancyVisualsSimulationPhase)
 		)
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return FemalesShared.GetPregnancyTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return FemalesShared.GetPregnancyTrackerReproductiveTimeMultiplier(multipliers)
 
 	# noinspection PyUnusedLocal
 	def _TrackerAddedCallback (self, owner: ReproductionShared.ReproductiveSystem, eventArguments: CycleEvents.TrackerAddedArguments) -> None:
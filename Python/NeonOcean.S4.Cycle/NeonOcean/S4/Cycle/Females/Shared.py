@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import enum_lib
 import typing
-from NeonOcean.S4.Cycle import Biology, Settings
+from NeonOcean.S4.Cycle import Biology
 from NeonOcean.S4.Cycle import ReproductionShared
 from NeonOcean.S4.Main.Tools import Exceptions
 from sims import sim_info, sim_info_types
@@ -15,6 +15,12 @@ SpermTrackerIdentifier = "SpermTracker"  # type: str
 OvumQuickModeMinimumTimeMultiplier = 0.2  # type: float
 SpermQuickModeMinimumTimeMultiplier = 0.2  # type: float
 
+FemaleTrackerDependencies = \
+	ReproductionShared.TrackerDependencies.Traits | \
+	ReproductionShared.TrackerDependencies.Species | \
+	ReproductionShared.TrackerDependencies.Gender | \
+	ReproductionShared.TrackerDependencies.LOD  # type: ReproductionShared.TrackerDependencies  # The parts of the game's state the 'ShouldHaveFemaleTrackers' function depends on.
+
 class PregnancyTrimester(enum_lib.IntEnum):
 	First = 1  # type: PregnancyTrimester
 	Second = 2  # type: PregnancyTrimester
@@ -46,22 +52,25 @@ def GetFemaleTrackerIdentifiers () -> typing.Set[str]:
 		SpermTrackerIdentifier
 	}
 
-def GetCycleTrackerReproductiveTimeMultiplier () -> float:
-	return ReproductionShared.GetGeneralReproductiveTimeMultiplier()
+def GetCycleTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	return ReproductionShared.GetGeneralReproductiveTimeMultiplier(multipliers)
 
-def GetOvumTrackerReproductiveTimeMultiplier () -> float:
-	multiplier = ReproductionShared.GetGeneralReproductiveTimeMultiplier()
+def GetOvumTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	multiplier = ReproductionShared.GetGeneralReproductiveTimeMultiplier(multipliers)
 
 	if multiplier < OvumQuickModeMinimumTimeMultiplier:
 		multiplier = OvumQuickModeMinimumTimeMultiplier
 
 	return multiplier
 
-def GetPregnancyTrackerReproductiveTimeMultiplier () -> float:
-	return Settings.PregnancySpeed.Get()
+def GetPregnancyTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	if multipliers is None:
+		multipliers = ReproductionShared.GetReproductiveTimeMultipliers()
+
+	return multipliers.Pregnancy
 
-def GetSpermTrackerReproductiveTimeMultiplier () -> float:
-	multiplier = ReproductionShared.GetGeneralReproductiveTimeMultiplier()
+def GetSpermTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	multiplier = ReproductionShared.GetGeneralReproductiveTimeMultiplier(multipliers)
 
 	if multiplier < SpermQuickModeMinimumTimeMultiplier:
 		multiplier = SpermQuickModeMinimumTimeMultiplier
@@ -45,6 +45,16 @@ class SpermTracker(ReproductionShared.TrackerBase):
 
 		return list(self._activeSperm)
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return FemalesShared.FemaleTrackerDependencies
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -193,8 +203,8 @@ class SpermTracker(ReproductionShared.TrackerBase):
 			ReproductionShared.SimulationPhase(25, self._SpermSimulationPhase)
 		)
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return FemalesShared.GetSpermTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return FemalesShared.GetSpermTrackerReproductiveTimeMultiplier(multipliers)
 
 	def _OnLoaded (self) -> None:
 		for activeSperm in self._activeSperm:
@@ -240,22 +250,16 @@ class SpermTracker(ReproductionShared.TrackerBase):
 		if eventArguments.FertilizerChosen:
 			return
 
-		spermOptions = list()
-
-		for activeSperm in self._activeSperm:  # type: Sperm.Sperm
-			spermOptions.append(
-				Probability.Option(str(activeSperm.UniqueIdentifier), activeSperm.SpermCount)
-			)
+		if len(self._activeSperm) == 0:
+			return
 
-		chosenSpermOption = Probability.Probability(spermOptions).ChooseOption(eventArguments.Seed + -257141210)  # type: Probability.Option
-		chosenSperm = None  # type: typing.Optional[Sperm.Sperm]
+		spermWeights = list()  # type: typing.List[int]
 
 		for activeSperm in self._activeSperm:  # type: Sperm.Sperm
-			if chosenSpermOption.Identifier == str(activeSperm.UniqueIdentifier):
-				chosenSperm = activeSperm
-				break
+			spermWeights.append(activeSperm.SpermCount)
 
-		assert chosenSperm is not None
+		chosenSpermIndex = Probability.ChooseWeightedIndex(spermWeights, eventArguments.Seed + -257141210)  # type: int
+		chosenSperm = self._activeSperm[chosenSpermIndex]  # type: Sperm.Sperm
 
 		eventArguments.Fertilizer = chosenSperm.Source
 		eventArguments.FertilizingObject = chosenSperm
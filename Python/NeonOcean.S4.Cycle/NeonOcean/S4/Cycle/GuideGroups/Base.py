@@ -8,16 +8,27 @@ from NeonOcean.S4.Main.Tools import Exceptions, Types
 from sims import sim_info
 
 _guideGroups = list()  # type: typing.List[GuideGroup]
+_guideGroupMatches = dict()  # type: typing.Dict[typing.Tuple[typing.Any, typing.Any], typing.Optional[GuideGroup]]  # The group found for each species and age, only used if every group's matcher is species and age based.
 
 class GuideGroup:
-	def __init__ (self, matcher: typing.Callable[[sim_info.SimInfo], bool]):
+	def __init__ (self, matcher: typing.Callable[[sim_info.SimInfo], bool], speciesAgeMatcher: bool = False):
 		"""
 		A group of guides for a specific type of sim.
 		:param matcher: A callable that will be used to test if this guide group is appropriate for a sim. It should take the sim's info and return True or False.
 		:type matcher: typing.Callable[[sim_info.SimInfo], bool]
+		:param speciesAgeMatcher: Whether or not the matcher only looks at a sim's species and age. If every registered group's matcher does, the group
+		found for each species and age combination will be remembered.
+		:type speciesAgeMatcher: bool
 		"""
 
+		if not isinstance(speciesAgeMatcher, bool):
+			raise Exceptions.IncorrectTypeException(speciesAgeMatcher, "speciesAgeMatcher", (bool,))
+
 		self.Matcher = matcher  # type: typing.Callable[[sim_info.SimInfo], bool]
+		self.SpeciesAgeMatcher = speciesAgeMatcher  # type: bool
+
+		self._guideIndex = dict()  # type: typing.Dict[str, typing.Any]
+		self._indexedGuideCount = 0  # type: int
 
 		self.Guides = list()
 
@@ -35,6 +46,7 @@ class GuideGroup:
 			raise Exceptions.IncorrectTypeException(value, "value", (list,))
 
 		self._guides = value
+		self.RebuildGuideIndex()
 
 	def Matches (self, simInfo: sim_info.SimInfo) -> bool:
 		"""
@@ -49,22 +61,37 @@ class GuideGroup:
 		Get the first guide found with this identifier. If no such guide exists nothing will happen.
 		"""
 
-		for guide in self._guides:
-			if guide.GetIdentifier() == identifier:
-				return guide
+		if self._indexedGuideCount != len(self._guides):
+			self.RebuildGuideIndex()
 
-		return None
+		return self._guideIndex.get(identifier, None)
 
 	def HasGuide (self, identifier: str) -> bool:
 		"""
 		Get whether or not a guide with this identifier exists.
 		"""
 
+		if self._indexedGuideCount != len(self._guides):
+			self.RebuildGuideIndex()
+
+		return identifier in self._guideIndex
+
+	def RebuildGuideIndex (self) -> None:
+		"""
+		Rebuild the identifier index used to look up this group's guides. This is done automatically when guide tuning is loaded and when guides are
+		added or removed, but needs to be called if a guide in the list is replaced.
+		"""
+
+		guideIndex = dict()  # type: typing.Dict[str, typing.Any]
+
 		for guide in self._guides:
-			if guide.GetIdentifier() == identifier:
-				return True
+			guideIdentifier = guide.GetIdentifier()  # type: str
 
-		return False
+			if guideIdentifier not in guideIndex:
+				guideIndex[guideIdentifier] = guide
+
+		self._guideIndex = guideIndex
+		self._indexedGuideCount = len(self._guides)
 
 	def RemoveGuide (self, identifier: str) -> None:
 		"""
@@ -78,6 +105,7 @@ class GuideGroup:
 		while guideIndex < len(self.Guides):
 			if self.Guides[guideIndex].GetIdentifier() == identifier:
 				self.Guides.pop(guideIndex)
+				self.RebuildGuideIndex()
 				return
 
 			guideIndex += 1
@@ -94,6 +122,7 @@ def RegisterGuideGroup (guideGroup: GuideGroup) -> None:
 		return
 
 	_guideGroups.append(guideGroup)
+	_guideGroupMatches.clear()
 
 def FindGuideGroup (simInfo: sim_info.SimInfo) -> typing.Optional[GuideGroup]:
 	"""
@@ -103,12 +132,34 @@ def FindGuideGroup (simInfo: sim_info.SimInfo) -> typing.Optional[GuideGroup]:
 	if not isinstance(simInfo, sim_info.SimInfo):
 		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
 
+	matchesCacheable = True  # type: bool
+
+	for guideGroup in _guideGroups:  # type: GuideGroup
+		if not guideGroup.SpeciesAgeMatcher:
+			matchesCacheable = False
+			break
+
+	if matchesCacheable:
+		matchKey = (simInfo.species, simInfo.age)  # type: typing.Tuple[typing.Any, typing.Any]
+
+		if matchKey in _guideGroupMatches:
+			return _guideGroupMatches[matchKey]
+	else:
+		matchKey = None
+
 	for guideGroup in _guideGroups:  # type: GuideGroup
 		try:
 			if guideGroup.Matches(simInfo):
+				if matchesCacheable:
+					_guideGroupMatches[matchKey] = guideGroup
+
 				return guideGroup
 		except Exception as e:
 			Debug.Log("Encountered an unhandled exception when checking if a guide group matches a sim. Matcher: " + Types.GetFullName(guideGroup.Matcher), This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, exception = e)
+			matchesCacheable = False
+
+	if matchesCacheable:
+		_guideGroupMatches[matchKey] = None
 
 	return None
 
@@ -16,4 +16,4 @@ def _OnStartLate (cause: LoadingShared.LoadingCauses) -> None:
 
 	GuideGroupsBase.RegisterGuideGroup(HumanGuideGroup)
 
-HumanGuideGroup = GuideGroupsBase.GuideGroup(HumanGuideGroupMatcher)  # type: GuideGroupsBase.GuideGroup
\ No newline at end of file
+HumanGuideGroup = GuideGroupsBase.GuideGroup(HumanGuideGroupMatcher, speciesAgeMatcher = True)  # type: GuideGroupsBase.GuideGroup
\ No newline at end of file
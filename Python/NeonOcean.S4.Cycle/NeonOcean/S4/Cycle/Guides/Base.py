@@ -34,7 +34,16 @@ class GuideTuningHandler:
 	@classmethod
 	def _SetupSnippet (cls) -> None:
 		snippets.define_snippet(cls._snippetName, cls._GetSnippetTemplate())
-		MainSnippets.SetupSnippetScanning(cls._snippetName, cls._SnippetTuningCallback)
+		MainSnippets.SetupSnippetScanning(cls._snippetName, cls._SnippetScanningCallback)
+
+	@classmethod
+	def _SnippetScanningCallback (cls, guideSnippets: typing.List[snippets.SnippetInstanceMetaclass]) -> None:
+		from NeonOcean.S4.Cycle.GuideGroups import Base as GuideGroupsBase
+
+		cls._SnippetTuningCallback(guideSnippets)
+
+		for guideGroup in GuideGroupsBase.GetAllGuideGroups():  # type: GuideGroupsBase.GuideGroup
+			guideGroup.RebuildGuideIndex()
 
 	@classmethod
 	def _SnippetTuningCallback (cls, guideSnippets: typing.List[snippets.SnippetInstanceMetaclass]) -> None:
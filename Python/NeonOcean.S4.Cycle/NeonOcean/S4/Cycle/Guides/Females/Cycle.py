@@ -79,6 +79,7 @@ class HumanCycleMenstrualGuide(GuidesBase.GuideTuningHandler):
 	@classmethod
 	def _SnippetTuningCallback (cls, guideSnippets: typing.List[snippets.SnippetInstanceMetaclass]) -> None:
 		from NeonOcean.S4.Cycle import GuideGroups
+		from NeonOcean.S4.Cycle.Females.Cycle import OvumRelease as CycleOvumRelease
 
 		global DefaultCycleMenstrualGuide
 
@@ -87,6 +88,8 @@ class HumanCycleMenstrualGuide(GuidesBase.GuideTuningHandler):
 
 		DefaultCycleMenstrualGuide = cls.Guide
 
+		CycleOvumRelease.GetOvumReleaseAmountTable(cls.Guide.OvumReleaseAmount)
+
 def _Setup () -> None:
 	global DefaultCycleMenstrualGuide
 
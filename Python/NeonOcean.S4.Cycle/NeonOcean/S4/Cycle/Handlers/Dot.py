@@ -42,7 +42,7 @@ class DotHandler(HandlersBase.HandlerBase):
 		tracker.CycleChangedEvent += self._CycleTrackerCycleChangedCallback
 		tracker.CycleCompletedEvent += self._CycleTrackerCycleCompletedCallback
 
-		dotInformation = Dot.GetDotInformation(self.HandlingSystem.SimInfo)  # type: typing.Optional[Dot.DotInformation]
+		dotInformation = self._GetDotInformation()  # type: typing.Optional[Dot.DotInformation]
 
 		if dotInformation is not None:
 			if dotInformation.TimeSinceCycleStart is None:
@@ -70,6 +70,12 @@ class DotHandler(HandlersBase.HandlerBase):
 		tracker.PregnancyStartedEvent -= self._PregnancyTrackerPregnancyStartedCallback
 		tracker.PregnancyEndedEvent -= self._PregnancyTrackerPregnancyEndedCallback
 
+	def _GetDotInformation (self) -> typing.Optional[Dot.DotInformation]:
+		if self.HandlingSystem.Replaying:
+			return None  # Replaying systems must not change the real sim's Dot app information.
+
+		return Dot.GetDotInformation(self.HandlingSystem.SimInfo)
+
 	def _OnAdded (self) -> None:
 		self.HandlingSystem.TrackerAddedEvent += self._TrackerAddedCallback
 		self.HandlingSystem.TrackerRemovedEvent += self._TrackerRemovedCallback
@@ -94,7 +100,7 @@ class DotHandler(HandlersBase.HandlerBase):
 		if cycleTracker is None:
 			return
 
-		dotInformation = Dot.GetDotInformation(self.HandlingSystem.SimInfo)  # type: typing.Optional[Dot.DotInformation]
+		dotInformation = self._GetDotInformation()  # type: typing.Optional[Dot.DotInformation]
 
 		if dotInformation is not None:
 			if simulation.NonUpdateTicks > 0:
@@ -119,7 +125,7 @@ class DotHandler(HandlersBase.HandlerBase):
 
 	# noinspection PyUnusedLocal
 	def _CycleTrackerCycleChangedCallback (self, owner: CycleTracker.CycleTracker, eventArguments: CycleEvents.CycleChangedArguments) -> None:
-		dotInformation = Dot.GetDotInformation(self.HandlingSystem.SimInfo)  # type: typing.Optional[Dot.DotInformation]
+		dotInformation = self._GetDotInformation()  # type: typing.Optional[Dot.DotInformation]
 
 		if dotInformation is not None:
 			if dotInformation.TimeSinceCycleStart is None:
@@ -138,7 +144,7 @@ class DotHandler(HandlersBase.HandlerBase):
 	# noinspection PyUnusedLocal
 	def _CycleTrackerCycleCompletedCallback (self, owner: CycleTracker.CycleTracker, eventArguments: CycleEvents.CycleCompletedArguments) -> None:
 		if eventArguments.CompletionReason == CycleShared.CompletionReasons.Finished:
-			dotInformation = Dot.GetDotInformation(self.HandlingSystem.SimInfo)  # type: typing.Optional[Dot.DotInformation]
+			dotInformation = self._GetDotInformation()  # type: typing.Optional[Dot.DotInformation]
 
 			if dotInformation is not None:
 				currentSimulation = self.HandlingSystem.Simulation  # type: typing.Optional[ReproductionShared.Simulation]
@@ -150,7 +156,7 @@ class DotHandler(HandlersBase.HandlerBase):
 
 	# noinspection PyUnusedLocal
 	def _PregnancyTrackerPregnancyStartedCallback (self, owner: PregnancyTracker.PregnancyTracker, eventArguments: CycleEvents.PregnancyStartedArguments) -> None:
-		dotInformation = Dot.GetDotInformation(self.HandlingSystem.SimInfo)  # type: typing.Optional[Dot.DotInformation]
+		dotInformation = self._GetDotInformation()  # type: typing.Optional[Dot.DotInformation]
 
 		if dotInformation is not None:
 			if dotInformation.TimeSinceCycleStart is None:
@@ -158,7 +164,7 @@ class DotHandler(HandlersBase.HandlerBase):
 
 	# noinspection PyUnusedLocal
 	def _PregnancyTrackerPregnancyEndedCallback (self, owner: PregnancyTracker.PregnancyTracker, eventArguments: CycleEvents.PregnancyEndedArguments) -> None:
-		dotInformation = Dot.GetDotInformation(self.HandlingSystem.SimInfo)  # type: typing.Optional[Dot.DotInformation]
+		dotInformation = self._GetDotInformation()  # type: typing.Optional[Dot.DotInformation]
 
 		if dotInformation is not None:
 			dotInformation.TrackingMode = Dot.TrackingMode.Cycle
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import typing
+
 from NeonOcean.S4.Cycle import Biology, ReproductionShared
 from NeonOcean.S4.Main.Tools import Exceptions
 from sims import sim_info, sim_info_types
 
 SpermProductionTrackerIdentifier = "SpermProductionTracker"  # type: str
 
+MaleTrackerDependencies = \
+	ReproductionShared.TrackerDependencies.Traits | \
+	ReproductionShared.TrackerDependencies.Species | \
+	ReproductionShared.TrackerDependencies.Gender | \
+	ReproductionShared.TrackerDependencies.LOD  # type: ReproductionShared.TrackerDependencies  # The parts of the game's state the 'ShouldHaveMaleTrackers' function depends on.
+
 def ShouldHaveMaleTrackers (simInfo: sim_info.SimInfo) -> bool:
 	"""
 	Get whether or not this sim should have male reproductive trackers.
@@ -24,5 +32,5 @@ def ShouldHaveMaleTrackers (simInfo: sim_info.SimInfo) -> bool:
 
 	return Biology.SimCanImpregnate(simInfo)
 
-def GetSpermProductionTrackerReproductiveTimeMultiplier () -> float:
-	return ReproductionShared.GetGeneralReproductiveTimeMultiplier()
\ No newline at end of file
+def GetSpermProductionTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	return ReproductionShared.GetGeneralReproductiveTimeMultiplier(multipliers)
\ No newline at end of file
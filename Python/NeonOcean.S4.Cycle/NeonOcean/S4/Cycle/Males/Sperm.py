@@ -7,7 +7,7 @@ import uuid
 from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
 from NeonOcean.S4.Cycle.Tools import Distribution, SimPointer
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Events, Exceptions, Python, Sims as ToolsSims, Savable, Version
+from NeonOcean.S4.Main.Tools import Exceptions, Python, Sims as ToolsSims, Savable
 from sims import sim_info
 
 class Sperm(Savable.SavableExtension):
@@ -41,24 +41,8 @@ class Sperm(Savable.SavableExtension):
 
 		self.SpermCount = 0
 
-		encodeUUID = lambda value: str(value) if value is not None else None
-		decodeUUID = lambda valueString: uuid.UUID(valueString) if valueString is not None else None
-
-		# noinspection PyUnusedLocal
-		def uniqueSeedUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
-			if isinstance(data.get(self._uniqueSeedSavingKey, None), list):
-				data.pop(self._uniqueSeedSavingKey)
-
-		def uniqueIdentifierVerifier (value: typing.Optional[uuid.UUID]) -> None:
-			if not isinstance(value, uuid.UUID) and value is not None:
-				raise Exceptions.IncorrectTypeException(value, self._uniqueIdentifierSavingKey, (uuid.UUID, None))
-
-		def uniqueSeedVerifier (value: typing.Optional[int]) -> None:
-			if not isinstance(value, int) and value is not None:
-				raise Exceptions.IncorrectTypeException(value, self._uniqueSeedSavingKey, (int, None))
-
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueIdentifierSavingKey, "_uniqueIdentifier", None, encoder = encodeUUID, decoder = decodeUUID, typeVerifier = uniqueIdentifierVerifier))
-		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueSeedSavingKey, "_uniqueSeed", None, updater = uniqueSeedUpdater, typeVerifier = uniqueSeedVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueIdentifierSavingKey, "_uniqueIdentifier", None, encoder = ReproductionShared.EncodeUUID, decoder = ReproductionShared.DecodeUUID, typeVerifier = _uniqueIdentifierVerifier))
+		self.RegisterSavableAttribute(Savable.StandardAttributeHandler(self._uniqueSeedSavingKey, "_uniqueSeed", None, updater = _uniqueSeedUpdater, typeVerifier = _uniqueSeedVerifier))
 
 		self.RegisterSavableAttribute(Savable.StaticSavableAttributeHandler("SourcePointer", "SourcePointer"))
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("SpermCount", "SpermCount", self.SpermCount, requiredAttribute = True))
@@ -390,9 +374,9 @@ class Sperm(Savable.SavableExtension):
 		if not isinstance(generationArguments, CycleEvents.SpermGeneratingArguments):
 			raise Exceptions.IncorrectTypeException(generationArguments, "generationArguments", (CycleEvents.SpermGeneratingArguments,))
 
-		generationArguments.PreGenerationEvent.Invoke(generationArguments, Events.EventArguments())
+		generationArguments.InvokePreGenerationEvent()
 		self._GenerateInternal(generationArguments)
-		generationArguments.PostGenerationEvent.Invoke(generationArguments, Events.EventArguments())
+		generationArguments.InvokePostGenerationEvent()
 
 	def Simulate (self, simulation: ReproductionShared.Simulation, ticks: int, reproductiveTimeMultiplier: typing.Union[float, int]) -> None:
 		"""
@@ -517,4 +501,11 @@ def GenerateGenericSperm (source: typing.Optional[sim_info.SimInfo] = None, sper
 	generationArguments.Source = source
 	generatingSperm.Generate(generationArguments)
 
-	return generatingSperm
\ No newline at end of file
+	return generatingSperm
+
+# noinspection PyProtectedMember
+_uniqueIdentifierVerifier = ReproductionShared.CreateUniqueIdentifierVerifier(Sperm._uniqueIdentifierSavingKey)  # type: typing.Callable
+# noinspection PyProtectedMember
+_uniqueSeedVerifier = ReproductionShared.CreateUniqueSeedVerifier(Sperm._uniqueSeedSavingKey)  # type: typing.Callable
+# noinspection PyProtectedMember
+_uniqueSeedUpdater = ReproductionShared.CreateUniqueSeedUpdater(Sperm._uniqueSeedSavingKey)  # type: typing.Callable
\ No newline at end of file
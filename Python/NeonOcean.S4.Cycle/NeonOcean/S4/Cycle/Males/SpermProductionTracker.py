@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import random
+import typing
 
 from NeonOcean.S4.Cycle import Events as CycleEvents, Guides as CycleGuides, ReproductionShared, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Males import Shared as MalesShared, Sperm
-from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable, Types
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Savable
 from sims import sim_info
 
 class SpermProductionTracker(ReproductionShared.TrackerBase):
@@ -54,6 +55,16 @@ class SpermProductionTracker(ReproductionShared.TrackerBase):
 
 		return self._spermObjectsGenerated
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return MalesShared.MaleTrackerDependencies
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -76,12 +87,7 @@ class SpermProductionTracker(ReproductionShared.TrackerBase):
 		spermGuide = sperm.GetSpermGuide(self.TrackingSystem)  # type: CycleGuides.SpermGuide
 		eventArguments = CycleEvents.SpermGeneratingArguments(generationSeed, sperm, spermGuide)
 
-		for spermGeneratingCallback in self.SpermGeneratingEvent:
-			try:
-				spermGeneratingCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call sperm generating callback '" + Types.GetFullName(spermGeneratingCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = spermGeneratingCallback)
+		EventsDispatch.Dispatch("SpermProductionTracker.SpermGeneratingEvent", self.SpermGeneratingEvent, self, eventArguments, debugSource = self.TrackingSystem)
 
 		sperm.Generate(eventArguments)
 
@@ -89,8 +95,8 @@ class SpermProductionTracker(ReproductionShared.TrackerBase):
 
 		return sperm
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return MalesShared.GetSpermProductionTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return MalesShared.GetSpermProductionTrackerReproductiveTimeMultiplier(multipliers)
 
 	# noinspection PyUnusedLocal
 	def _SpermGeneratingCallback (self, owner: ReproductionShared.TrackerBase, eventArguments: CycleEvents.SpermGeneratingArguments) -> None:
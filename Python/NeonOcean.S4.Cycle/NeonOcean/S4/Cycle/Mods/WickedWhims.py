@@ -3,12 +3,13 @@ from __future__ import annotations
 import collections
 import sys
 import typing
+import weakref
 
 import services
 from NeonOcean.S4.Cycle import Insemination, SimSettings, This
 from NeonOcean.S4.Cycle.Interactions import CondomBox as InteractionsCondomBox
 from NeonOcean.S4.Cycle.Safety import BirthControlPills as SafetyBirthControlPills, Resources as SafetyResources
-from NeonOcean.S4.Main import Debug, Director, Language
+from NeonOcean.S4.Main import Debug, Director, Language, LoadingShared
 from NeonOcean.S4.Main.Interactions.Support import DisableInteraction
 from NeonOcean.S4.Main.Tools import Exceptions, Patcher, Python
 from event_testing import results
@@ -28,6 +29,17 @@ DisabledBecauseCycleInstalledToolTip = Language.String(This.Mod.Namespace + ".Mo
 WickedWhimsBirthControlPillsObjectID = 11109047836475721558  # type: int
 WickedWhimsCheckCyclesInfoInteractionID = 9855519195140041011  # type: int
 
+_disabledCyclePatches = None  # type: typing.Optional[typing.FrozenSet[str]]
+_disabledWickedWhimsPatches = None  # type: typing.Optional[typing.FrozenSet[str]]
+
+_cyclePatchDispatch = tuple()  # type: typing.Tuple[typing.Tuple[str, typing.Callable], ...]  # The Cycle patches that are to be done, built once WickedWhims has been detected.
+_wickedWhimsPatchDispatch = tuple()  # type: typing.Tuple[typing.Tuple[str, typing.Callable], ...]  # The WickedWhims patches that are to be done, built once WickedWhims has been detected.
+
+_turboSimWrapperModule = None  # type: typing.Optional[typing.Any]
+_birthControlHandlerModule = None  # type: typing.Optional[typing.Any]
+
+_sexSessions = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary  # The participant handles cached for each WickedWhims pregnancy helper, an entry will disappear along with its sex interaction.
+
 class _Announcer(Director.Announcer):
 	@classmethod
 	def InstanceManagerOnStart (cls, instanceManager: instance_manager.InstanceManager) -> None:
@@ -37,6 +49,35 @@ class _Announcer(Director.Announcer):
 		if ModInstalled() and WickedWhimsPatchEnabled("CheckCyclesInfo"):
 			_DoWickedWhimsCheckCyclesInfoPatch()
 
+	@classmethod
+	def ZoneOnToreDown (cls, *args, **kwargs) -> None:
+		_sexSessions.clear()
+
+class _SexSession:
+	def __init__ (self):
+		"""
+		The participants of a WickedWhims sex interaction, looked up once and then kept for as long as the interaction exists.
+		"""
+
+		self._simInfos = dict()  # type: typing.Dict[int, typing.Optional[sim_info.SimInfo]]
+		self._turboSims = dict()  # type: typing.Dict[int, typing.Any]
+
+	def GetSimInfo (self, simID: int) -> typing.Optional[sim_info.SimInfo]:
+		try:
+			return self._simInfos[simID]
+		except KeyError:
+			simInfo = services.sim_info_manager().get(simID)  # type: typing.Optional[sim_info.SimInfo]
+			self._simInfos[simID] = simInfo
+			return simInfo
+
+	def GetTurboSim (self, simInfo: sim_info.SimInfo) -> typing.Any:
+		try:
+			return self._turboSims[simInfo.sim_id]
+		except KeyError:
+			turboSim = _turboSimWrapperModule.TurboSim(simInfo)
+			self._turboSims[simInfo.sim_id] = turboSim
+			return turboSim
+
 def ModInstalled () -> bool:
 	# noinspection SpellCheckingInspection
 	if "wickedwhims" in sys.modules:
@@ -104,6 +145,9 @@ def CyclePatchEnabled (patchIdentifier: str) -> bool:
 	Get whether a patch with this identifier is allowed by WickedWhims.
 	"""
 
+	if _disabledCyclePatches is not None:
+		return patchIdentifier not in _disabledCyclePatches
+
 	return patchIdentifier not in GetWickedWhimsDisablingCyclePatches()
 
 def WickedWhimsPatchEnabled (patchIdentifier: str) -> bool:
@@ -111,42 +155,47 @@ def WickedWhimsPatchEnabled (patchIdentifier: str) -> bool:
 	Get whether a patch with this identifier is allowed by WickedWhims.
 	"""
 
+	if _disabledWickedWhimsPatches is not None:
+		return patchIdentifier not in _disabledWickedWhimsPatches
+
 	return patchIdentifier not in GetWickedWhimsDisablingWickedWhimsPatches()
 
 # noinspection PyUnusedLocal
 def _OnStart (cause) -> None:
 	if ModInstalled():
+		_BuildPatchDispatch()
 		_DoAppropriatePatches()
 
-def _DoAppropriatePatches () -> None:
+# noinspection PyUnusedLocal
+def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
+	_sexSessions.clear()
+
+def _BuildPatchDispatch () -> None:
+	global _disabledCyclePatches, _disabledWickedWhimsPatches, _cyclePatchDispatch, _wickedWhimsPatchDispatch
+
 	try:
-		disabledCyclePatches = GetWickedWhimsDisablingCyclePatches()  # type: typing.Iterable[str]
+		_disabledCyclePatches = frozenset(GetWickedWhimsDisablingCyclePatches())
 	except:
 		Debug.Log("Failed to get the Cycle patches that WickedWhims wants to be disabled.", This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
-		disabledCyclePatches = list()
+		_disabledCyclePatches = frozenset()
 
 	try:
-		disabledWickedWhimsPatches = GetWickedWhimsDisablingWickedWhimsPatches()  # type: typing.Iterable[str]
+		_disabledWickedWhimsPatches = frozenset(GetWickedWhimsDisablingWickedWhimsPatches())
 	except:
 		Debug.Log("Failed to get the WickedWhims patches that WickedWhims wants to be disabled.", This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
-		disabledWickedWhimsPatches = list()
+		_disabledWickedWhimsPatches = frozenset()
 
-	for cyclePatchIdentifier, cyclePatcher in CyclePatches.items():  # type: str, typing.Optional[typing.Callable]
-		if cyclePatcher is None:
-			continue
+	_cyclePatchDispatch = tuple((cyclePatchIdentifier, cyclePatcher) for cyclePatchIdentifier, cyclePatcher in CyclePatches.items()
+								if cyclePatcher is not None and cyclePatchIdentifier not in _disabledCyclePatches)
 
-		if cyclePatchIdentifier in disabledCyclePatches:
-			continue
+	_wickedWhimsPatchDispatch = tuple((wickedWhimsPatchIdentifier, wickedWhimsPatcher) for wickedWhimsPatchIdentifier, wickedWhimsPatcher in WickedWhimsPatches.items()
+									  if wickedWhimsPatcher is not None and wickedWhimsPatchIdentifier not in _disabledWickedWhimsPatches)
 
+def _DoAppropriatePatches () -> None:
+	for cyclePatchIdentifier, cyclePatcher in _cyclePatchDispatch:  # type: str, typing.Callable
 		cyclePatcher()
 
-	for wickedWhimsPatchIdentifier, wickedWhimsPatcher in WickedWhimsPatches.items():  # type: str, typing.Optional[typing.Callable]
-		if wickedWhimsPatcher is None:
-			continue
-
-		if wickedWhimsPatchIdentifier in disabledWickedWhimsPatches:
-			continue
-
+	for wickedWhimsPatchIdentifier, wickedWhimsPatcher in _wickedWhimsPatchDispatch:  # type: str, typing.Callable
 		wickedWhimsPatcher()
 
 def _DoCycleResetCondomMethodUseSettingPatch () -> None:
@@ -187,9 +236,19 @@ def _DoCycleRemovePillFromObjectPatch () -> None:
 		Debug.Log("Could not complete Cycle remove pill from object patch.", This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
 
 def _DoWickedWhimsImpregnationPatch () -> None:
+	global _turboSimWrapperModule, _birthControlHandlerModule
+
 	try:
 		# noinspection PyUnresolvedReferences
 		from wickedwhims.sex.integral.sex_handlers.active_sex.helpers import pregnancy as WickedWhimsPregnancy
+		# noinspection PyUnresolvedReferences
+		from turbolib2.wrappers.sim import sim as TurboSimWrapper
+		# noinspection PyUnresolvedReferences
+		from wickedwhims.sex.pregnancy.birth_control import birth_control_handler
+
+		_turboSimWrapperModule = TurboSimWrapper
+		_birthControlHandlerModule = birth_control_handler
+
 		Patcher.Patch(WickedWhimsPregnancy.SexInstancePregnancyHelper, "_try_impregnate_sim", _WickedWhimsTryImpregnateSimPatch, patchType = Patcher.PatchTypes.Custom)
 	except:
 		Debug.Log("Could not complete WickedWhims impregnation patch.", This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
@@ -305,29 +364,23 @@ def _CycleRemovePillFromObjectPatch (originalCallable: typing.Callable, pillsObj
 
 def _WickedWhimsTryImpregnateSimPatch (originalCallable: typing.Callable, self, sim_actor_id, turbo_sim, *args, **kwargs) -> bool:
 	try:
-		Debug.Log("Here Impreg", This.Mod.Namespace, Debug.LogLevels.Warning)  # TODO REMOVE
-		# noinspection PyUnresolvedReferences
-		from turbolib2.wrappers.sim import sim as TurboSimWrapper
-		# noinspection PyUnresolvedReferences
-		from wickedwhims.sex.pregnancy.birth_control import birth_control_handler
-
 		inseminatedSimInfo = turbo_sim.get_sim_info()  # type: typing.Optional[sim_info.SimInfo]
 
 		if inseminatedSimInfo is None:
 			return False
 
+		sexSession = _GetSexSession(self)  # type: _SexSession
+
 		for sourceSimID, spermArriving in self._get_possible_partners(sim_actor_id, turbo_sim):  # type: int, bool
 			if not spermArriving:
 				return False
 
-			sourceSimInfo = services.sim_info_manager().get(sourceSimID)  # type: typing.Optional[sim_info.SimInfo]
+			sourceSimInfo = sexSession.GetSimInfo(sourceSimID)  # type: typing.Optional[sim_info.SimInfo]
 
 			if sourceSimInfo is None:
 				continue
 
-			sourceSimWickedWhimsWrapper = TurboSimWrapper.TurboSim(sourceSimInfo)
-
-			if birth_control_handler.is_sim_on_birth_control(sourceSimWickedWhimsWrapper): # This should only really be testing if they are using condoms since we effectively disabled birth control pills
+			if _birthControlHandlerModule.is_sim_on_birth_control(sexSession.GetTurboSim(sourceSimInfo)):  # This should only really be testing if they are using condoms since we effectively disabled birth control pills
 				continue
 
 			Insemination.AutoInseminate(inseminatedSimInfo, sourceSimInfo)
@@ -335,6 +388,18 @@ def _WickedWhimsTryImpregnateSimPatch (originalCallable: typing.Callable, self,
 		Debug.Log("Failed to handle WickedWhim's try impregnate sim method.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()))
 		return originalCallable(self, sim_actor_id, turbo_sim, *args, **kwargs)
 
+def _GetSexSession (pregnancyHelper) -> _SexSession:
+	try:
+		sexSession = _sexSessions.get(pregnancyHelper, None)  # type: typing.Optional[_SexSession]
+
+		if sexSession is None:
+			sexSession = _SexSession()
+			_sexSessions[pregnancyHelper] = sexSession
+
+		return sexSession
+	except TypeError:  # The helper cannot be weakly referenced, its participants will be looked up again every time.
+		return _SexSession()
+
 def _WickedWhimsUpdateSexSettingsToGeneralSaveDataPatch (originalCallable: typing.Callable, *args, **kwargs) -> bool:
 	try:
 		# noinspection PyUnresolvedReferences
@@ -355,7 +420,6 @@ def _WickedWhimsUpdateSexSettingsToGeneralSaveDataPatch (originalCallable: typin
 
 def _WickedWhimsTakeBirthControlPillPatch (originalCallable: typing.Callable, turbo_sim: typing.Any, no_inventory: bool = False, *args, **kwargs) -> bool:
 	try:
-		Debug.Log("Here Pill", This.Mod.Namespace, Debug.LogLevels.Warning) # TODO REMOVE
 		targetSimInfo = turbo_sim.get_sim_info()  # type: typing.Optional[sim_info.SimInfo]
 
 		if targetSimInfo is None:
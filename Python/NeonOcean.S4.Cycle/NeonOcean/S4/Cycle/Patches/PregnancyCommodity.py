@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import sys
 import typing
 import weakref
 
+import alarms
+import date_and_time
+import services
 import zone
 from NeonOcean.S4.Cycle import Guides as CycleGuides, ReproductionShared, Settings, This
 from NeonOcean.S4.Cycle.Settings import Base as SettingsBase
@@ -15,9 +19,12 @@ from sims4 import resources
 from sims4.tuning import instance_manager
 from statistics import base_statistic, base_statistic_tracker, commodity
 
-_pregnancyStatistics = set()  # type: typing.Set[weakref.ReferenceType]
+_pregnancyStatistics = dict()  # type: typing.Dict[int, weakref.ReferenceType]  # Every pregnancy statistic instance, keyed by the statistic's id.
+_pregnantStatistics = dict()  # type: typing.Dict[int, weakref.ReferenceType]  # Only the pregnancy statistics belonging to pregnant sims, settings changes will only need to touch these.
 _handlingPregnancyStatistics = set()  # type: typing.Set[weakref.ReferenceType]
 
+_pendingApplySettingsAlarm = None  # type: typing.Optional[alarms.AlarmHandle]
+
 class _AnnouncerPreemptive(Director.Announcer):
 	Host = This.Mod
 	Preemptive = True
@@ -45,12 +52,17 @@ class _Announcer(Director.Announcer):
 	@classmethod
 	def ZoneLoad (cls, zoneReference: zone.Zone) -> None:
 		_ClearDeadPregnancyStatisticReferences()
+		_RebuildPregnantStatistics()
 		_ApplySettingsToAllPregnancyStatistics()
 
 	@classmethod
 	def ZoneSave (cls, zoneReference: zone.Zone, saveSlotData: typing.Optional[typing.Any] = None) -> None:
 		_ApplySettingsToAllPregnancyStatistics()
 
+	@classmethod
+	def ZoneOnToreDown (cls, *args, **kwargs) -> None:
+		_CancelPendingApplySettings()
+
 	@classmethod
 	def OnLoadingScreenAnimationFinished(cls, zoneReference: zone.Zone) -> None:
 		_FixOldCyclePregnancyStatisticBug()
@@ -93,8 +105,25 @@ def _GetPregnancyStatisticOwner (pregnancyStatistic: base_statistic.BaseStatisti
 
 	return pregnancyStatisticOwner
 
-def _ApplySettingsPregnancyStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
-	if not Settings.HandlePregnancySpeed.Get():
+def _ApplySettingsPregnancyStatistic (pregnancyStatistic: base_statistic.BaseStatistic,
+									  handlePregnancySpeed: typing.Optional[bool] = None,
+									  pregnancyRate: typing.Optional[float] = None) -> None:
+	"""
+	Apply the pregnancy speed settings to this pregnancy statistic.
+	:param pregnancyStatistic: The pregnancy statistic to apply the settings to.
+	:type pregnancyStatistic: base_statistic.BaseStatistic
+	:param handlePregnancySpeed: The value of the handle pregnancy speed setting. This will be retrieved if it is not provided, batched callers
+	should get it once and pass it in here.
+	:type handlePregnancySpeed: typing.Optional[bool]
+	:param pregnancyRate: The pregnancy rate the statistic should use. This will be calculated if it is not provided, batched callers should
+	calculate it once and pass it in here.
+	:type pregnancyRate: typing.Optional[float]
+	"""
+
+	if handlePregnancySpeed is None:
+		handlePregnancySpeed = Settings.HandlePregnancySpeed.Get()
+
+	if not handlePregnancySpeed:
 		_StopHandlingPregnancyStatistic(pregnancyStatistic)
 		return
 
@@ -106,29 +135,147 @@ def _ApplySettingsPregnancyStatistic (pregnancyStatistic: base_statistic.BaseSta
 	ownerPregnancyTracker = pregnancyStatisticOwner.pregnancy_tracker  # type: GamePregnancyTracker.PregnancyTracker
 
 	if not ownerPregnancyTracker.is_pregnant:
+		_UnregisterPregnantStatistic(pregnancyStatistic)
 		_StopHandlingPregnancyStatistic(pregnancyStatistic)
 		return
 
-	pregnancyRate = _GetPregnancyRate()  # type: float
+	_RegisterPregnantStatistic(pregnancyStatistic)
+
+	if pregnancyRate is None:
+		pregnancyRate = _GetPregnancyRate()
+
 	_ApplyPregnancyStatisticRate(pregnancyStatistic, pregnancyRate)
 	_handlingPregnancyStatistics.add(weakref.ref(pregnancyStatistic))  # Using a set prevents one stat from being added more than once, even though they are saved as weak refs.
 	return
 
 def _ApplySettingsToAllPregnancyStatistics () -> None:
-	for statisticReference in _pregnancyStatistics:  # type: weakref.ref
+	"""
+	Apply the settings to every known pregnancy statistic. This is meant for zone loads and saves, settings changes should only need to touch
+	the pregnant sims' statistics.
+	"""
+
+	_CancelPendingApplySettings()
+
+	handlePregnancySpeed = Settings.HandlePregnancySpeed.Get()  # type: bool
+	pregnancyRate = _GetPregnancyRate() if handlePregnancySpeed else None  # type: typing.Optional[float]
+
+	for statisticReference in list(_pregnancyStatistics.values()):  # type: weakref.ref
 		statistic = statisticReference()  # type: typing.Optional[base_statistic.BaseStatistic]
 
 		if statistic is not None:
-			_ApplySettingsPregnancyStatistic(statistic)
+			_ApplySettingsPregnancyStatistic(statistic, handlePregnancySpeed = handlePregnancySpeed, pregnancyRate = pregnancyRate)
 
-def _StopHandlingPregnancyStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
-	for handlingStatisticReference in _handlingPregnancyStatistics:  # type: weakref.ref
-		handlingStatistic = handlingStatisticReference()  # type: typing.Optional[base_statistic.BaseStatistic]
+def _ApplySettingsToPregnantStatistics () -> None:
+	"""
+	Apply the settings to the pregnancy statistics of every sim known to be pregnant.
+	"""
+
+	_CancelPendingApplySettings()
+
+	handlePregnancySpeed = Settings.HandlePregnancySpeed.Get()  # type: bool
+	pregnancyRate = _GetPregnancyRate() if handlePregnancySpeed else None  # type: typing.Optional[float]
+
+	for statisticReference in list(_pregnantStatistics.values()):  # type: weakref.ref
+		statistic = statisticReference()  # type: typing.Optional[base_statistic.BaseStatistic]
+
+		if statistic is not None:
+			_ApplySettingsPregnancyStatistic(statistic, handlePregnancySpeed = handlePregnancySpeed, pregnancyRate = pregnancyRate)
+
+def _QueueApplySettingsToPregnantStatistics () -> None:
+	"""
+	Apply the settings to the pregnant sims' statistics at the next opportunity. Any number of requests made before then will be handled
+	in a single pass.
+	"""
+
+	global _pendingApplySettingsAlarm
+
+	if _pendingApplySettingsAlarm is not None:
+		return
+
+	if services.current_zone() is None or services.time_service() is None:
+		_ApplySettingsToPregnantStatistics()
+		return
+
+	_pendingApplySettingsAlarm = alarms.add_alarm(sys.modules[__name__], date_and_time.TimeSpan(0), _PendingApplySettingsCallback)
+
+def _CancelPendingApplySettings () -> None:
+	global _pendingApplySettingsAlarm
+
+	if _pendingApplySettingsAlarm is not None:
+		_pendingApplySettingsAlarm.cancel()
+		_pendingApplySettingsAlarm = None
 
-		if handlingStatistic == pregnancyStatistic:
-			_handlingPregnancyStatistics.remove(handlingStatisticReference)
-			break
+# noinspection PyUnusedLocal
+def _PendingApplySettingsCallback (alarmHandle: alarms.AlarmHandle) -> None:
+	global _pendingApplySettingsAlarm
+
+	_pendingApplySettingsAlarm = None
+
+	if not This.Mod.IsLoaded():
+		return
+
+	try:
+		_ApplySettingsToPregnantStatistics()
+	except:
+		Debug.Log("Failed to apply settings to the pregnancy statistics.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()))
+
+def _RegisterPregnancyStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
+	pregnancyStatisticID = id(pregnancyStatistic)  # type: int
+
+	if pregnancyStatisticID in _pregnancyStatistics:
+		return
+
+	_pregnancyStatistics[pregnancyStatisticID] = weakref.ref(pregnancyStatistic, _CreatePregnancyStatisticCollectedCallback(pregnancyStatisticID))
+
+def _RegisterPregnantStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
+	pregnancyStatisticID = id(pregnancyStatistic)  # type: int
+
+	if pregnancyStatisticID in _pregnantStatistics:
+		return
+
+	_RegisterPregnancyStatistic(pregnancyStatistic)
+	_pregnantStatistics[pregnancyStatisticID] = _pregnancyStatistics[pregnancyStatisticID]
+
+def _UnregisterPregnantStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
+	_pregnantStatistics.pop(id(pregnancyStatistic), None)
+
+def _CreatePregnancyStatisticCollectedCallback (pregnancyStatisticID: int) -> typing.Callable[[weakref.ReferenceType], None]:
+	# Removes the statistic from the registries as soon as it is garbage collected, this way the registries never hold dead references and an
+	# id cannot be confused with a newer statistic that happens to reuse it.
+
+	def _pregnancyStatisticCollectedCallback (pregnancyStatisticReference: weakref.ReferenceType) -> None:
+		if _pregnancyStatistics.get(pregnancyStatisticID, None) is pregnancyStatisticReference:
+			del _pregnancyStatistics[pregnancyStatisticID]
 
+		if _pregnantStatistics.get(pregnancyStatisticID, None) is pregnancyStatisticReference:
+			del _pregnantStatistics[pregnancyStatisticID]
+
+	return _pregnancyStatisticCollectedCallback
+
+def _RebuildPregnantStatistics () -> None:
+	_pregnantStatistics.clear()
+
+	for pregnancyStatisticID, pregnancyStatisticReference in list(_pregnancyStatistics.items()):  # type: int, weakref.ref
+		pregnancyStatistic = pregnancyStatisticReference()  # type: typing.Optional[base_statistic.BaseStatistic]
+
+		if pregnancyStatistic is None:
+			continue
+
+		pregnancyStatisticTracker = pregnancyStatistic.tracker  # type: typing.Optional[base_statistic_tracker.BaseStatisticTracker]
+
+		if pregnancyStatisticTracker is None:
+			continue
+
+		pregnancyStatisticOwner = pregnancyStatisticTracker.owner  # type: typing.Optional[script_object.ScriptObject]
+
+		if not isinstance(pregnancyStatisticOwner, sim_info.SimInfo):
+			continue
+
+		if pregnancyStatisticOwner.is_pregnant:
+			_pregnantStatistics[pregnancyStatisticID] = pregnancyStatisticReference
+
+def _StopHandlingPregnancyStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
+	_handlingPregnancyStatistics.discard(weakref.ref(pregnancyStatistic))  # Live weak references hash and compare by their referent, so no search is needed.
 	_ResetPregnancyStatistic(pregnancyStatistic)
 
 def _ResetPregnancyStatistic (pregnancyStatistic: base_statistic.BaseStatistic) -> None:
@@ -157,17 +304,17 @@ def _ResetHandlingPregnancyStatistics () -> None:
 	_handlingPregnancyStatistics = set()
 
 def _ClearDeadPregnancyStatisticReferences () -> None:
-	global _pregnancyStatistics
+	global _handlingPregnancyStatistics
 
-	alivePregnancyStatistics = set()
+	# Dead references are removed from the registries by their collection callbacks, only the handling set can still hold them.
 
-	for pregnancyStatisticReference in _pregnancyStatistics:  # type: weakref.ref
-		pregnancyStatistic = pregnancyStatisticReference()  # type: typing.Optional[base_statistic.BaseStatistic]
+	aliveHandlingPregnancyStatistics = set()
 
-		if pregnancyStatistic is not None:
-			alivePregnancyStatistics.add(pregnancyStatisticReference)
+	for handlingStatisticReference in _handlingPregnancyStatistics:  # type: weakref.ref
+		if handlingStatisticReference() is not None:
+			aliveHandlingPregnancyStatistics.add(handlingStatisticReference)
 
-	_pregnancyStatistics = alivePregnancyStatistics
+	_handlingPregnancyStatistics = aliveHandlingPregnancyStatistics
 
 # noinspection PyProtectedMember
 def _ApplyPregnancyStatisticRate (pregnancyStatistic: base_statistic.BaseStatistic, pregnancyRate: typing.Optional[float]) -> None:
@@ -188,7 +335,7 @@ def _FixOldCyclePregnancyStatisticBug () -> None:
 	This makes sure a bug from an older version of this mod isn't still affecting someone's game.
 	"""
 
-	for pregnancyStatisticReference in _pregnancyStatistics:  # type: weakref.ref
+	for pregnancyStatisticReference in list(_pregnancyStatistics.values()):  # type: weakref.ref
 		pregnancyStatistic = pregnancyStatisticReference()  # type: typing.Optional[base_statistic.BaseStatistic]
 
 		if pregnancyStatistic is not None:
@@ -217,7 +364,7 @@ def _PregnancyCommodityInit (self: commodity.Commodity, *args, **kwargs) -> None
 	if self.tracker is not None:
 		self.tracker.add_watcher(_CreatePregnancyCommodityWatcherWrapper(self.tracker))
 
-	_pregnancyStatistics.add(weakref.ref(self))
+	_RegisterPregnancyStatistic(self)
 
 def _CreatePregnancyCommodityWatcherWrapper (commodityTracker: base_statistic_tracker.BaseStatisticTracker) -> typing.Callable:
 	# Without this, we only get the statistic type, old value, and new value. We would have no way of figuring out which instance of the statistic actually changed or for what object in changed for. I'm not sure why it isn't this way by default.
@@ -237,6 +384,7 @@ def _OnStart (cause) -> None:
 # noinspection PyUnusedLocal
 def _OnStop (cause) -> None:
 	Settings.UnregisterOnUpdateCallback(_SettingsOnUpdatedCallback)
+	_CancelPendingApplySettings()
 
 def _PregnancyCommodityWatcher (statisticTracker: base_statistic_tracker.BaseStatisticTracker, statisticType: typing.Type[base_statistic.BaseStatistic], oldValue: float, newValue: float) -> None:
 	try:
@@ -254,18 +402,22 @@ def _PregnancyCommodityWatcher (statisticTracker: base_statistic_tracker.BaseSta
 			return
 
 		statistic = statisticTracker.get_statistic(statisticType, add = True)  # type: base_statistic.BaseStatistic
+		_RegisterPregnantStatistic(statistic)
 		_ApplySettingsPregnancyStatistic(statistic)
 	except:
 		Debug.Log("Failed to handle statistic change.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()))
 
 # noinspection PyUnusedLocal
 def _SettingsOnUpdatedCallback (settingsModule, eventArguments: SettingsBase.UpdateEventArguments) -> None:
-	global _handlingPregnancyStatistics
+	if isinstance(eventArguments, SettingsBase.UpdateEventArguments):
+		if not eventArguments.Changed(Settings.HandlePregnancySpeed.Key) and not eventArguments.Changed(Settings.PregnancySpeed.Key):
+			return
 
-	_ApplySettingsToAllPregnancyStatistics()
+	_QueueApplySettingsToPregnantStatistics()
 
 def _GamePregnancyTrackerClearPregnancyPatch (self: GamePregnancyTracker.PregnancyTracker) -> None:
 	simPregnancyStatisticType = self.PREGNANCY_COMMODITY_MAP.get(sim_info_types.Species.HUMAN, None)  # type: typing.Type[base_statistic.BaseStatistic]
 	simPregnancyStatistic = self._sim_info.get_statistic(simPregnancyStatisticType)  # type: base_statistic.BaseStatistic
 
+	_UnregisterPregnantStatistic(simPregnancyStatistic)
 	_StopHandlingPregnancyStatistic(simPregnancyStatistic)
\ No newline at end of file
@@ -5,11 +5,17 @@ import random
 import typing
 import time
 
+import alarms
+import date_and_time
+import game_services
+import services
+import time_service
 from NeonOcean.S4.Cycle import ReproductionShared, Saving, This
-from NeonOcean.S4.Main import Debug
+from NeonOcean.S4.Main import Debug, Director, LoadingShared
 from NeonOcean.S4.Main.Saving import SectionBranched
-from NeonOcean.S4.Main.Tools import Events, Exceptions, Python, Types
+from NeonOcean.S4.Main.Tools import Events, Exceptions, Patcher, Python, Types
 from sims import sim_info
+from traits import trait_tracker
 
 RegisteredReproductiveSystemEvent = Events.EventHandler()  # type: Events.EventHandler
 UnregisteredReproductiveSystemEvent = Events.EventHandler()  # type: Events.EventHandler #The event arguments will be of the type RegistrationChangedArguments for both of these.
@@ -18,9 +24,39 @@ _reproductiveSystems = dict()  # type: typing.Dict[sim_info.SimInfo, Reproductio
 
 _fullUpdateTimes = list()  # type: typing.List[float]
 _individualUpdateTimes = list()  # type: typing.List[float]
+_maximumSavedUpdateTimes = 200  # type: int
+
+_traitChangeMethodNames = (
+	"add_trait",
+	"remove_trait",
+	"load_sim_info",
+)  # type: typing.Tuple[str, ...]
+
+_traitTrackerChangeMethodNames = (
+	"_add_trait",
+	"_remove_trait",
+)  # type: typing.Tuple[str, ...]  # Traits can be added or removed through the trait tracker without going through the sim info's methods.
+
+_ageChangeMethodNames = (
+	"change_age",
+)  # type: typing.Tuple[str, ...]
+
+_trackerReconciliationDelay = 1000  # type: int  # The number of ticks changes are gathered for, so that a wave of changes such as a round of age ups is reconciled in one pass.
+_trackerReconciliationAlarm = None  # type: typing.Optional[alarms.AlarmHandle]
+_pendingTrackerReconciliations = dict()  # type: typing.Dict[sim_info.SimInfo, ReproductionShared.ReproductiveSystem]
+
+_fullTrackerReconciliationInterval = ReproductionShared.GameMinutesToTicks(1440)  # type: int  # The number of ticks, one game day, between full tracker reconciliations done while verifying systems.
+_lastFullTrackerReconciliationTick = None  # type: typing.Optional[int]
 
 # TODO let the reset interaction to reset the save.
 
+class _Announcer(Director.Announcer):
+	Host = This.Mod
+
+	@classmethod
+	def ZoneOnToreDown (cls, *args, **kwargs) -> None:
+		_ResetPendingTrackerReconciliations()
+
 class RegistrationChangedArguments(Events.EventArguments):
 	def __init__ (self, reproductiveSystem: ReproductionShared.ReproductiveSystem):
 		if not isinstance(reproductiveSystem, ReproductionShared.ReproductiveSystem):
@@ -239,6 +275,70 @@ def VerifySystems (reproductiveSystems: typing.Optional[typing.Iterable[Reproduc
 		else:
 			Debug.Unlock(reportLockIdentifier, reportLockReference)
 
+	_FullTrackerReconciliationCheck()
+
+def ReconcileSystemTrackers (reproductiveSystems: typing.Optional[typing.Iterable[ReproductionShared.ReproductiveSystem]] = None) -> None:
+	"""
+	Add the trackers each specified reproductive system should have and remove those they should not. Each system will only reconsider the tracker types
+	affected by the changes it has seen since its last reconciliation.
+	:param reproductiveSystems: All reproductive systems that need to be reconciled. If this is None the function will go through all registered reproductive systems.
+	:type reproductiveSystems: typing.Iterable[ReproductionShared.ReproductiveSystem] | None
+	"""
+
+	if reproductiveSystems is None:
+		reproductiveSystems = GetAllSystems(automaticallyUpdate = False)
+
+	reportLockIdentifier = __name__ + ":" + str(Python.GetLineNumber())  # type: str
+
+	for reproductiveSystem in reproductiveSystems:  # type: ReproductionShared.ReproductiveSystem
+		reportLockReference = reproductiveSystem
+
+		try:
+			if reproductiveSystem.Simulation is not None:
+				continue
+
+			reproductiveSystem.ReconcileTrackers()
+		except:
+			Debug.Log("Failed to reconcile a reproductive system's trackers.\n" + reproductiveSystem.DebugInformation,
+					  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = reportLockIdentifier, lockReference = reportLockReference)
+		else:
+			Debug.Unlock(reportLockIdentifier, reportLockReference)
+
+def NotifyTrackerDependenciesChanged (simInfo: sim_info.SimInfo, dependencies: ReproductionShared.TrackerDependencies) -> None:
+	"""
+	Notify this sim's reproductive system that these parts of the game's state have changed. The system's trackers will be reconciled shortly after,
+	together with those of every other system notified in the meantime. Nothing will happen if the sim does not have a reproductive system.
+	:param simInfo: The target sim's info.
+	:type simInfo: sim_info.SimInfo
+	:param dependencies: The parts of the game's state that have changed.
+	:type dependencies: ReproductionShared.TrackerDependencies
+	"""
+
+	if not isinstance(simInfo, sim_info.SimInfo):
+		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
+
+	reproductiveSystem = _reproductiveSystems.get(simInfo, None)  # type: typing.Optional[ReproductionShared.ReproductiveSystem]
+
+	if reproductiveSystem is None:
+		return
+
+	reproductiveSystem.NotifyTrackerDependenciesChanged(dependencies)
+	_QueueTrackerReconciliation([reproductiveSystem])
+
+def NotifyAllTrackerDependenciesChanged (dependencies: ReproductionShared.TrackerDependencies) -> None:
+	"""
+	Notify every registered reproductive system that these parts of the game's state have changed. The systems' trackers will be reconciled shortly after.
+	:param dependencies: The parts of the game's state that have changed.
+	:type dependencies: ReproductionShared.TrackerDependencies
+	"""
+
+	reproductiveSystems = list(_reproductiveSystems.values())  # type: typing.List[ReproductionShared.ReproductiveSystem]
+
+	for reproductiveSystem in reproductiveSystems:  # type: ReproductionShared.ReproductiveSystem
+		reproductiveSystem.NotifyTrackerDependenciesChanged(dependencies)
+
+	_QueueTrackerReconciliation(reproductiveSystems)
+
 def UpdateSystems (reproductiveSystems: typing.Optional[typing.Iterable[ReproductionShared.ReproductiveSystem]] = None) -> None:
 	"""
 	Update all specified reproductive systems.
@@ -252,15 +352,22 @@ def UpdateSystems (reproductiveSystems: typing.Optional[typing.Iterable[Reproduc
 	if len(reproductiveSystems) == 0:
 		return
 
+	if game_services.service_manager is None:
+		return
+
+	# The current tick and the report lock identifier are the same for every system, so they are only gotten once for the whole batch.
+	timeService = services.time_service()  # type: time_service.TimeService
+	currentTick = timeService.sim_now.absolute_ticks()  # type: int
+
+	reportLockIdentifier = __name__ + ":" + str(Python.GetLineNumber())  # type: str
+
 	updateTimedRoll = random.random()  # type: float
 	updateTimedProbability = 0.125  # type: float
 
-	maximumSavedUpdateTimes = 200  # type: int
-
 	if len(_fullUpdateTimes) == 0:
 		updateTimed = True
 	else:
-		updateTimed = len(_fullUpdateTimes) != maximumSavedUpdateTimes and updateTimedRoll <= updateTimedProbability  # type: bool
+		updateTimed = len(_fullUpdateTimes) < _maximumSavedUpdateTimes and updateTimedRoll <= updateTimedProbability  # type: bool
 
 	if updateTimed:
 		fullUpdateStartTime = time.time()  # type: typing.Optional[float]
@@ -270,17 +377,23 @@ def UpdateSystems (reproductiveSystems: typing.Optional[typing.Iterable[Reproduc
 		chosenTimedSystem = None  # type: typing.Optional[ReproductionShared.ReproductiveSystem]
 
 	for reproductiveSystem in reproductiveSystems:  # type: ReproductionShared.ReproductiveSystem
-		reportLockIdentifier = __name__ + ":" + str(Python.GetLineNumber())  # type: str
-		reportLockReference = reproductiveSystem
-
 		if updateTimed and reproductiveSystem is chosenTimedSystem:
 			individualUpdateStartTime = time.time()  # type: typing.Optional[float]
 		else:
 			individualUpdateStartTime = None  # type: typing.Optional[float]
 
+		ticksBehind = currentTick - reproductiveSystem.LastSimulatedTick  # type: int
+
+		if ticksBehind <= 0 or reproductiveSystem.Simulating:
+			if individualUpdateStartTime is not None:
+				_individualUpdateTimes.append(time.time() - individualUpdateStartTime)
+
+			continue
+
+		reportLockReference = reproductiveSystem
+
 		try:
-			if reproductiveSystem.ShouldUpdate:
-				reproductiveSystem.Update()
+			reproductiveSystem.UpdateTo(currentTick)
 		except:
 			Debug.Log("Failed to update a reproductive system\n." + reproductiveSystem.DebugInformation, This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = reportLockIdentifier, lockReference = reportLockReference)
 		else:
@@ -292,6 +405,17 @@ def UpdateSystems (reproductiveSystems: typing.Optional[typing.Iterable[Reproduc
 	if fullUpdateStartTime is not None:
 		_fullUpdateTimes.append(time.time() - fullUpdateStartTime)
 
+def RecordFullUpdateTime (fullUpdateTime: float) -> None:
+	"""
+	Record the time it took to update a batch of reproductive systems that were updated outside of the update systems function. These times are
+	averaged with the others and logged when the mod stops.
+	:param fullUpdateTime: The time it took to update the batch, in seconds.
+	:type fullUpdateTime: float
+	"""
+
+	if len(_fullUpdateTimes) < _maximumSavedUpdateTimes:
+		_fullUpdateTimes.append(fullUpdateTime)
+
 def SimulateSystems (ticks: int, reproductiveSystems: typing.Optional[typing.Iterable[ReproductionShared.ReproductiveSystem]] = None) -> None:
 	"""
 	Simulate this many ticks in the specified reproductive systems. All out of date reproductive systems will be updated before simulating.
@@ -307,8 +431,9 @@ def SimulateSystems (ticks: int, reproductiveSystems: typing.Optional[typing.Ite
 	if reproductiveSystems is None:
 		reproductiveSystems = GetAllSystems()
 
+	reportLockIdentifier = __name__ + ":" + str(Python.GetLineNumber())  # type: str
+
 	for reproductiveSystem in reproductiveSystems:  # type: ReproductionShared.ReproductiveSystem
-		reportLockIdentifier = __name__ + ":" + str(Python.GetLineNumber())  # type: str
 		reportLockReference = reproductiveSystem
 
 		try:
@@ -378,8 +503,102 @@ def InvokeUnregisteredReproductiveSystemEvent (reproductiveSystem: ReproductionS
 		except:
 			Debug.Log("Failed to run unregistered reproductive system event callback " + Types.GetFullName(unregisteredEventCallback), This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__)
 
+def _QueueTrackerReconciliation (reproductiveSystems: typing.Iterable[ReproductionShared.ReproductiveSystem]) -> None:
+	global _trackerReconciliationAlarm
+
+	for reproductiveSystem in reproductiveSystems:  # type: ReproductionShared.ReproductiveSystem
+		_pendingTrackerReconciliations[reproductiveSystem.SimInfo] = reproductiveSystem
+
+	if _trackerReconciliationAlarm is not None:
+		return
+
+	if services.time_service() is None:
+		_ReconcilePendingTrackers()
+		return
+
+	alarmTimeSpan = date_and_time.TimeSpan(_trackerReconciliationDelay)
+	_trackerReconciliationAlarm = alarms.add_alarm(sys.modules[__name__], alarmTimeSpan, _TrackerReconciliationCallback)
+
+def _ReconcilePendingTrackers () -> None:
+	global _pendingTrackerReconciliations, _trackerReconciliationAlarm
+
+	if _trackerReconciliationAlarm is not None:
+		_trackerReconciliationAlarm.cancel()
+		_trackerReconciliationAlarm = None
+
+	if len(_pendingTrackerReconciliations) == 0:
+		return
+
+	reconcilingSystems = _pendingTrackerReconciliations  # type: typing.Dict[sim_info.SimInfo, ReproductionShared.ReproductiveSystem]
+	_pendingTrackerReconciliations = dict()
+
+	ReconcileSystemTrackers([reproductiveSystem for simInfo, reproductiveSystem in reconcilingSystems.items() if _reproductiveSystems.get(simInfo, None) is reproductiveSystem])
+
+def _ResetPendingTrackerReconciliations () -> None:
+	global _pendingTrackerReconciliations, _trackerReconciliationAlarm, _lastFullTrackerReconciliationTick
+
+	if _trackerReconciliationAlarm is not None:
+		_trackerReconciliationAlarm.cancel()
+		_trackerReconciliationAlarm = None
+
+	_pendingTrackerReconciliations = dict()
+	_lastFullTrackerReconciliationTick = None
+
+def _FullTrackerReconciliationCheck () -> None:
+	# Every so often, every system reconsiders all of its tracker types. This catches any change we were not notified of, such as a trait added through a
+	# path we have not patched.
+
+	global _lastFullTrackerReconciliationTick
+
+	if game_services.service_manager is None:
+		return
+
+	timeService = services.time_service()  # type: typing.Optional[time_service.TimeService]
+
+	if timeService is None:
+		return
+
+	currentTick = timeService.sim_now.absolute_ticks()  # type: int
+
+	if _lastFullTrackerReconciliationTick is not None and 0 <= currentTick - _lastFullTrackerReconciliationTick < _fullTrackerReconciliationInterval:
+		return
+
+	_lastFullTrackerReconciliationTick = currentTick
+
+	reconcilingSystems = GetAllSystems(automaticallyUpdate = False)  # type: typing.List[ReproductionShared.ReproductiveSystem]
+
+	for reproductiveSystem in reconcilingSystems:  # type: ReproductionShared.ReproductiveSystem
+		reproductiveSystem.NotifyTrackerDependenciesChanged(ReproductionShared.TrackerDependencies.All)
+
+	ReconcileSystemTrackers(reconcilingSystems)
+
+def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
+	if cause != LoadingShared.LoadingCauses.Reloading:
+		for methodName in _traitChangeMethodNames:  # type: str
+			if not hasattr(sim_info.SimInfo, methodName):
+				Debug.Log("Could not find the sim info method '%s', reproductive systems will not reconsider their trackers when it is called." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+				continue
+
+			Patcher.Patch(sim_info.SimInfo, methodName, _TraitChangedPatch, patchType = Patcher.PatchTypes.After)
+
+		for methodName in _traitTrackerChangeMethodNames:  # type: str
+			if not hasattr(trait_tracker.TraitTracker, methodName):
+				Debug.Log("Could not find the trait tracker method '%s', reproductive systems will not reconsider their trackers when it is called." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+				continue
+
+			Patcher.Patch(trait_tracker.TraitTracker, methodName, _TraitTrackerChangedPatch, patchType = Patcher.PatchTypes.After)
+
+		for methodName in _ageChangeMethodNames:  # type: str
+			if not hasattr(sim_info.SimInfo, methodName):
+				Debug.Log("Could not find the sim info method '%s', reproductive systems will not reconsider their trackers until they are next verified when it is called." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+				continue
+
+			Patcher.Patch(sim_info.SimInfo, methodName, _AgeChangedPatch, patchType = Patcher.PatchTypes.After)
+
 # noinspection PyUnusedLocal
 def _OnStop (cause) -> None:
+	_ResetPendingTrackerReconciliations()
+
 	if len(_fullUpdateTimes) != 0:
 		averageFullUpdateTime = round(sum(_fullUpdateTimes) / len(_fullUpdateTimes), 5)  # type: float
 
@@ -390,3 +609,37 @@ def _OnStop (cause) -> None:
 
 
 		Debug.Log("Average individual reproductive system update time for session: %s seconds." % str(averageIndividualUpdateTime), This.Mod.Namespace, Debug.LogLevels.Info, group = This.Mod.Namespace, owner = __name__)
+
+# noinspection PyUnusedLocal
+def _TrackerReconciliationCallback (alarmHandle: alarms.AlarmHandle) -> None:
+	global _trackerReconciliationAlarm
+
+	_trackerReconciliationAlarm = None
+
+	if not This.Mod.IsLoaded():
+		return
+
+	try:
+		_ReconcilePendingTrackers()
+	except:
+		Debug.Log("Failed to reconcile the trackers of reproductive systems with pending changes.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()))
+
+# noinspection PyUnusedLocal
+def _TraitChangedPatch (self: sim_info.SimInfo, *args, **kwargs) -> None:
+	NotifyTrackerDependenciesChanged(self, ReproductionShared.TrackerDependencies.Traits)
+
+# noinspection PyUnusedLocal
+def _TraitTrackerChangedPatch (self: trait_tracker.TraitTracker, *args, **kwargs) -> None:
+	trackerSimInfo = getattr(self, "_sim_info", None)  # type: typing.Optional[sim_info.SimInfo]
+
+	if trackerSimInfo is None:
+		# We cannot tell who this tracker belongs to, so every system will need to reconsider its trackers.
+		NotifyAllTrackerDependenciesChanged(ReproductionShared.TrackerDependencies.Traits)
+		return
+
+	NotifyTrackerDependenciesChanged(trackerSimInfo, ReproductionShared.TrackerDependencies.Traits)
+
+# noinspection PyUnusedLocal
+def _AgeChangedPatch (self: sim_info.SimInfo, *args, **kwargs) -> None:
+	NotifyTrackerDependenciesChanged(self, ReproductionShared.TrackerDependencies.Age)
+
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import collections
 import sys
+import time
 import typing
 
 import alarms
@@ -9,9 +11,10 @@ import indexed_manager
 import services
 import time_service
 import zone
-from NeonOcean.S4.Cycle import Reproduction, ReproductionShared, Saving, This
+from NeonOcean.S4.Cycle import Reproduction, ReproductionShared, Saving, Settings, This
 from NeonOcean.S4.Main import Debug, Director, LoadingShared
 from NeonOcean.S4.Main.Saving import SectionBranched
+from NeonOcean.S4.Main.Tools import Python
 from sims import sim_info, sim_info_manager
 
 _lastUpdateTick = None  # type: typing.Optional[int]
@@ -21,6 +24,14 @@ _standardUpdateAlarm = None  # type: typing.Optional[alarms.AlarmHandle]
 
 _plannedUpdateAlarms = list()  # type: typing.List[alarms.AlarmHandle]
 
+# Updates are worked through a little at a time, spending no more than the update budget setting's milliseconds each game tick. Systems still waiting in
+# the queue are never read out of date, getting a system through Reproduction.GetSimSystem will always update it first.
+_updateQueue = collections.deque()  # type: typing.Deque[ReproductionShared.ReproductiveSystem]  # Systems waiting to be updated.
+_queuedSystemPlans = dict()  # type: typing.Dict[int, bool]  # Whether each queued system's next update should be planned after it is updated, keyed by the id of the system.
+_updateQueueAlarm = None  # type: typing.Optional[alarms.AlarmHandle]
+
+_plannedUpdates = dict()  # type: typing.Dict[int, typing.List[ReproductionShared.ReproductiveSystem]]  # Updates planned during the current work slice, keyed by the absolute tick they are planned for.
+
 class _Announcer(Director.Announcer):
 	Host = This.Mod
 
@@ -68,10 +79,18 @@ def _SetupZoneHandling () -> None:
 		_standardUpdateAlarm = alarms.add_alarm(sys.modules[__name__], alarmTimeSpan, _StandardUpdateCallback, repeating = True)
 
 def _ResetZoneHandling () -> None:
-	global _lastUpdateTick, _standardUpdateAlarm
+	global _lastUpdateTick, _standardUpdateAlarm, _updateQueueAlarm
 
 	_lastUpdateTick = None
 
+	_updateQueue.clear()
+	_queuedSystemPlans.clear()
+	_plannedUpdates.clear()
+
+	if _updateQueueAlarm is not None:
+		_updateQueueAlarm.cancel()
+		_updateQueueAlarm = None
+
 	simInfoManager = services.sim_info_manager()  # type: sim_info_manager.SimInfoManager
 
 	if simInfoManager is not None:
@@ -115,18 +134,8 @@ def _StandardUpdateCallback (alarmHandle: alarms.AlarmHandle) -> None:
 	reportLockIdentifier = __name__ + ":UpdateCallback"  # type: str
 
 	try:
-		Reproduction.UpdateSystems()  # TODO log the time taken?
-
-		updateTicks = Reproduction.GetUpdateTicks(_standardUpdateInterval)  # type: typing.Dict[int, typing.List[ReproductionShared.ReproductiveSystem]]
-
-		for plannedTick, plannedSystems in updateTicks.items():  # type: int, typing.List[ReproductionShared.ReproductiveSystem]
-			if plannedTick >= _standardUpdateInterval:
-				continue
-
-			alarmTimeSpan = date_and_time.TimeSpan(plannedTick)
-			plannedUpdateAlarm = alarms.add_alarm(sys.modules[__name__], alarmTimeSpan, _CreatePlannedUpdateCallback(plannedSystems))
-
-			_plannedUpdateAlarms.append(plannedUpdateAlarm)
+		_QueueSystems(_GetPrioritizedSystems(Reproduction.GetAllSystems(automaticallyUpdate = False)), planUpdates = True)
+		_WorkUpdateQueue()
 	except:
 		Debug.Log("Reproduction standard update callback failed.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = reportLockIdentifier)
 	else:
@@ -141,7 +150,8 @@ def _CreatePlannedUpdateCallback (plannedSystems: typing.List[ReproductionShared
 		reportLockIdentifier = __name__ + ":UpdateCallback"  # type: str
 
 		try:
-			Reproduction.UpdateSystems(plannedSystems)  # TODO log the time taken?
+			_QueueSystems(plannedSystems, planUpdates = False, urgent = True)
+			_WorkUpdateQueue()
 		except:
 			Debug.Log("Reproduction planned update callback failed.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = reportLockIdentifier)
 		else:
@@ -154,6 +164,128 @@ def _CreatePlannedUpdateCallback (plannedSystems: typing.List[ReproductionShared
 
 	return _plannedUpdateCallback
 
+def _GetPrioritizedSystems (reproductiveSystems: typing.List[ReproductionShared.ReproductiveSystem]) -> typing.List[ReproductionShared.ReproductiveSystem]:
+	# Sims in the active household come first, then sims instanced on the current lot, then everyone else.
+
+	activeHouseholdID = services.active_household_id()  # type: typing.Optional[int]
+
+	def _GetPriority (reproductiveSystem: ReproductionShared.ReproductiveSystem) -> int:
+		systemSimInfo = reproductiveSystem.SimInfo  # type: sim_info.SimInfo
+
+		if activeHouseholdID is not None and systemSimInfo.household_id == activeHouseholdID:
+			return 0
+
+		if systemSimInfo.is_instanced():
+			return 1
+
+		return 2
+
+	return sorted(reproductiveSystems, key = _GetPriority)
+
+def _QueueSystems (reproductiveSystems: typing.Iterable[ReproductionShared.ReproductiveSystem], planUpdates: bool, urgent: bool = False) -> None:
+	queuingSystems = list()  # type: typing.List[ReproductionShared.ReproductiveSystem]
+
+	for reproductiveSystem in reproductiveSystems:  # type: ReproductionShared.ReproductiveSystem
+		queuedPlanUpdates = _queuedSystemPlans.get(id(reproductiveSystem), None)  # type: typing.Optional[bool]
+
+		if queuedPlanUpdates is not None:
+			# The system is already waiting, it should still be planned if either request asked for it.
+			_queuedSystemPlans[id(reproductiveSystem)] = queuedPlanUpdates or planUpdates
+			continue
+
+		_queuedSystemPlans[id(reproductiveSystem)] = planUpdates
+		queuingSystems.append(reproductiveSystem)
+
+	if urgent:
+		_updateQueue.extendleft(reversed(queuingSystems))
+	else:
+		_updateQueue.extend(queuingSystems)
+
+def _WorkUpdateQueue () -> None:
+	global _updateQueueAlarm
+
+	if _updateQueueAlarm is not None:
+		_updateQueueAlarm.cancel()
+		_updateQueueAlarm = None
+
+	if len(_updateQueue) == 0:
+		return
+
+	timeService = services.time_service()  # type: time_service.TimeService
+	currentTick = timeService.sim_now.absolute_ticks()  # type: int
+
+	updateBudget = Settings.UpdateBudget.Get() / 1000  # type: float
+	workStartTime = time.perf_counter()  # type: float
+
+	reportLockIdentifier = __name__ + ":" + str(Python.GetLineNumber())  # type: str
+
+	while len(_updateQueue) != 0:
+		reproductiveSystem = _updateQueue.popleft()  # type: ReproductionShared.ReproductiveSystem
+		planUpdate = _queuedSystemPlans.pop(id(reproductiveSystem), False)  # type: bool
+
+		try:
+			reproductiveSystem.UpdateTo(currentTick)
+		except:
+			Debug.Log("Failed to update a reproductive system\n." + reproductiveSystem.DebugInformation, This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = reportLockIdentifier, lockReference = reproductiveSystem)
+		else:
+			Debug.Unlock(reportLockIdentifier, reproductiveSystem)
+
+		if planUpdate:
+			for plannedTick, plannedSystems in Reproduction.GetUpdateTicks(_standardUpdateInterval, [reproductiveSystem]).items():  # type: int, typing.List[ReproductionShared.ReproductiveSystem]
+				if plannedTick >= _standardUpdateInterval:
+					continue
+
+				_plannedUpdates.setdefault(currentTick + plannedTick, list()).extend(plannedSystems)
+
+		if time.perf_counter() - workStartTime >= updateBudget:
+			break
+
+	Reproduction.RecordFullUpdateTime(time.perf_counter() - workStartTime)
+
+	# Planned updates are scheduled after every slice, so systems updated early in a long queue do not have to wait for the queue to empty.
+	_SchedulePlannedUpdates(currentTick)
+
+	if len(_updateQueue) != 0:
+		_updateQueueAlarm = alarms.add_alarm(sys.modules[__name__], date_and_time.TimeSpan(1), _UpdateQueueCallback)
+
+def _SchedulePlannedUpdates (currentTick: int) -> None:
+	lateSystems = list()  # type: typing.List[ReproductionShared.ReproductiveSystem]
+
+	for plannedAbsoluteTick, plannedSystems in _plannedUpdates.items():  # type: int, typing.List[ReproductionShared.ReproductiveSystem]
+		plannedTick = plannedAbsoluteTick - currentTick  # type: int
+
+		if plannedTick <= 0:  # The planned update is already due, it will be handled in the next slice.
+			lateSystems.extend(plannedSystems)
+			continue
+
+		alarmTimeSpan = date_and_time.TimeSpan(plannedTick)
+		plannedUpdateAlarm = alarms.add_alarm(sys.modules[__name__], alarmTimeSpan, _CreatePlannedUpdateCallback(plannedSystems))
+
+		_plannedUpdateAlarms.append(plannedUpdateAlarm)
+
+	_plannedUpdates.clear()
+
+	if len(lateSystems) != 0:
+		_QueueSystems(lateSystems, planUpdates = False, urgent = True)
+
+# noinspection PyUnusedLocal
+def _UpdateQueueCallback (alarmHandle: alarms.AlarmHandle) -> None:
+	global _updateQueueAlarm
+
+	_updateQueueAlarm = None
+
+	if not This.Mod.IsLoaded():
+		return
+
+	reportLockIdentifier = __name__ + ":UpdateCallback"  # type: str
+
+	try:
+		_WorkUpdateQueue()
+	except:
+		Debug.Log("Reproduction update queue callback failed.", This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = reportLockIdentifier)
+	else:
+		Debug.Unlock(reportLockIdentifier)
+
 def _OnSimAddCallback (simInfo: sim_info.SimInfo) -> None:
 	if not This.Mod.IsLoaded():
 		return
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
+import bisect
+import enum_lib
 import inspect
 import random
+import time
 import typing
+import uuid
 
 import date_and_time
 import game_services
 import services
 import time_service
 from NeonOcean.S4.Cycle import Events as CycleEvents, GuideGroups as CycleGuideGroups, ReproductionTrackers, Settings, This, Saving
-from NeonOcean.S4.Main import Debug
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
+from NeonOcean.S4.Cycle.Settings import Base as SettingsBase
+from NeonOcean.S4.Main import Debug, LoadingShared
 from NeonOcean.S4.Main.Saving import SectionBranched
 from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable, Sims as ToolsSims, Types, Version
 from sims import sim_info
 
+_reproductiveTimeMultipliers = None  # type: typing.Optional[ReproductiveTimeMultipliers]
+_reproductiveTimeMultipliersVersion = 0  # type: int
+_simulationSettingsSnapshot = None  # type: typing.Optional[SimulationSettingsSnapshot]
+
 class Schedule:
 	def __init__ (self):
 		self._points = list()  # type: typing.List[int]
+		self._origin = 0  # type: int
 
 		self.BlockAdditions = False
 
@@ -35,6 +46,22 @@ class Schedule:
 
 		self._blockAdditions = value
 
+	@property
+	def Origin (self) -> int:
+		"""
+		The tick that points are being added relative to. This is set to the number of completed ticks whenever the simulation is planned, so that
+		planners can add points as the number of ticks from the current tick.
+		"""
+
+		return self._origin
+
+	@Origin.setter
+	def Origin (self, value: int) -> None:
+		if not isinstance(value, int):
+			raise Exceptions.IncorrectTypeException(value, "Origin", (int,))
+
+		self._origin = value
+
 	@property
 	def Points (self) -> typing.List[int]:
 		"""
@@ -72,9 +99,9 @@ class Schedule:
 	def AddPoint (self, addingPoint: int) -> None:
 		"""
 		Add a point to this schedule. Additions may be blocked at certain times such as while simulating.
-		:param addingPoint: The point to be added. Each point is a tick that the simulation will stop at to allow for special work to be done.  If the
-		point has already been added nothing will happen. The adding point cannot be less than or equal to 0, otherwise we will schedule a point at the
-		earliest possible tick.
+		:param addingPoint: The point to be added. Each point is a number of ticks after the schedule's origin that the simulation will stop at to allow
+		for special work to be done. If the point has already been added nothing will happen. The adding point cannot be less than or equal to 0,
+		otherwise we will schedule a point at the earliest possible tick.
 		:type addingPoint: int
 		"""
 
@@ -93,17 +120,44 @@ class Schedule:
 		if self.BlockAdditions:
 			raise Exception("Cannot add points at this time.")
 
-		if addingPoint in self._points:
+		addingPoint += self._origin
+
+		addingPointIndex = bisect.bisect_left(self._points, addingPoint)  # type: int
+
+		if addingPointIndex < len(self._points) and self._points[addingPointIndex] == addingPoint:
 			return
 
-		for existingPointIndex in range(len(self._points)):  # type: int
-			existingPoint = self._points[existingPointIndex]  # type: int
+		self._points.insert(addingPointIndex, addingPoint)
+
+	def AddPoints (self, addingPoints: typing.Iterable[int]) -> None:
+		"""
+		Add many points to this schedule at once. This works the same as calling 'AddPoint' for each point, but the points are merged into the schedule
+		in a single pass.
+		:param addingPoints: The points to be added, in any order.
+		:type addingPoints: typing.Iterable[int]
+		"""
+
+		if self.BlockAdditions:
+			raise Exception("Cannot add points at this time.")
+
+		mergingPoints = set(self._points)  # type: typing.Set[int]
+
+		for addingPoint in addingPoints:  # type: int
+			if not isinstance(addingPoint, int):
+				raise Exceptions.IncorrectTypeException(addingPoint, "addingPoints[...]", (int,))
 
-			if existingPoint > addingPoint:
-				self._points.insert(existingPointIndex, addingPoint)
-				return
+			if addingPoint <= 0:
+				lastFrame = inspect.currentframe().f_back
+				lockIdentifier = lastFrame.f_code.co_filename + ":" + str(lastFrame.f_lineno)  # type: str
 
-		self._points.append(addingPoint)
+				Debug.Log("Tried to add the less than or equal to zero point '%s' to the schedule." % addingPoint,
+						  This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__, logStack = True, lockIdentifier = lockIdentifier)
+
+				addingPoint = 1
+
+			mergingPoints.add(addingPoint + self._origin)
+
+		self._points = sorted(mergingPoints)
 
 	def MoveToNextPoint (self) -> None:
 		"""
@@ -171,6 +225,116 @@ class SimulationPhase:
 
 		return self._required
 
+class ReproductiveTimeMultipliers:
+	def __init__ (self, version: int, general: float, pregnancy: float):
+		"""
+		The reproductive time multipliers derived from the settings, frozen so that they can be read freely while simulating.
+		:param version: The settings version these multipliers were calculated for.
+		:type version: int
+		:param general: The general reproductive time multiplier, used by most trackers.
+		:type general: float
+		:param pregnancy: The pregnancy reproductive time multiplier.
+		:type pregnancy: float
+		"""
+
+		self._version = version  # type: int
+		self._general = general  # type: float
+		self._pregnancy = pregnancy  # type: float
+
+	@property
+	def Version (self) -> int:
+		"""
+		The settings version these multipliers were calculated for, this changes whenever the settings are updated or loaded.
+		"""
+
+		return self._version
+
+	@property
+	def General (self) -> float:
+		return self._general
+
+	@property
+	def Pregnancy (self) -> float:
+		return self._pregnancy
+
+class HandleTable:
+	def __init__ (self):
+		"""
+		A table that gives live objects small integer handles. Handles are only meaningful to the table that gave them out, so they should be used to
+		refer to objects for a short time, such as within a single simulation, and never saved. Unique identifiers should still be used for anything
+		that is persisted.
+		"""
+
+		self._objects = list()  # type: typing.List[typing.Any]
+		self._handles = dict()  # type: typing.Dict[int, int]  # Handles keyed by the python id of the objects they were given to.
+
+	def __len__ (self) -> int:
+		return len(self._objects)
+
+	def GetHandle (self, handleObject: typing.Any) -> int:
+		"""
+		Get the handle of this object, a new handle will be given out if the object doesn't have one yet.
+		"""
+
+		handle = self._handles.get(id(handleObject), None)  # type: typing.Optional[int]
+
+		if handle is None:
+			handle = len(self._objects)
+			self._objects.append(handleObject)
+			self._handles[id(handleObject)] = handle
+
+		return handle
+
+	def GetObject (self, handle: int) -> typing.Any:
+		"""
+		Get the object this handle was given to.
+		"""
+
+		if not isinstance(handle, int):
+			raise Exceptions.IncorrectTypeException(handle, "handle", (int,))
+
+		if handle < 0 or handle >= len(self._objects):
+			raise ValueError("The handle '%s' was not given out by this table." % handle)
+
+		return self._objects[handle]
+
+	def Clear (self) -> None:
+		"""
+		Forget every handle given out by this table.
+		"""
+
+		self._objects = list()
+		self._handles = dict()
+
+class SimulationSettingsSnapshot:
+	def __init__ (self, reproductiveTimeMultipliers: ReproductiveTimeMultipliers, quickMode: bool):
+		"""
+		The settings that reproductive simulations read, frozen so that objects being simulated don't need to look each setting up again.
+		:param reproductiveTimeMultipliers: The reproductive time multipliers for these settings.
+		:type reproductiveTimeMultipliers: ReproductiveTimeMultipliers
+		:param quickMode: The value of the quick mode setting.
+		:type quickMode: bool
+		"""
+
+		self._reproductiveTimeMultipliers = reproductiveTimeMultipliers  # type: ReproductiveTimeMultipliers
+		self._quickMode = quickMode  # type: bool
+
+	@property
+	def Version (self) -> int:
+		"""
+		The settings version this snapshot was taken for, this changes whenever the settings are updated or loaded.
+		"""
+
+		return self._reproductiveTimeMultipliers.Version
+
+	@property
+	def ReproductiveTimeMultipliers (self) -> ReproductiveTimeMultipliers:
+		return self._reproductiveTimeMultipliers
+
+	@property
+	def QuickMode (self) -> bool:
+		return self._quickMode
+
 class Simulation:
 	def __init__ (self, simulatingSystem: object, ticks: int):
 		"""
@@ -196,8 +360,12 @@ class Simulation:
 		self._phases = list()  # type: typing.List[SimulationPhase]
 		self._schedule = Schedule()  # type: Schedule
 		self._memory = dict()  # type: typing.Dict[str, typing.Any]
+		self._handles = HandleTable()  # type: HandleTable
 
 		self._lastTickStep = False  # type: bool
+		self._settingsSnapshot = GetSimulationSettingsSnapshot()  # type: SimulationSettingsSnapshot
+
+		self.TraceRecorder = simulatingSystem.SimulationTraceRecorder
 
 	@property
 	def SimulatingSystem (self):
@@ -208,6 +376,23 @@ class Simulation:
 
 		return self._simulatingSystem
 
+	@property
+	def ReproductiveTimeMultipliers (self) -> ReproductiveTimeMultipliers:
+		"""
+		The reproductive time multipliers as they were when this simulation was created. Trackers should read these instead of the settings while simulating.
+		"""
+
+		return self._settingsSnapshot.ReproductiveTimeMultipliers
+
+	@property
+	def SettingsSnapshot (self) -> SimulationSettingsSnapshot:
+		"""
+		The settings as they were when this simulation was created. Trackers and the objects they simulate should read these instead of the settings while
+		simulating.
+		"""
+
+		return self._settingsSnapshot
+
 	@property
 	def Ticks (self) -> int:
 		"""
@@ -294,6 +479,15 @@ class Simulation:
 
 		self._memory = value
 
+	@property
+	def Handles (self) -> HandleTable:
+		"""
+		A table of integer handles for the objects taking part in this simulation. Trackers should use these handles, rather than converting unique
+		identifiers to strings, to key the information they store in the simulation memory.
+		"""
+
+		return self._handles
+
 	@property
 	def NeedToPlan (self) -> bool:
 		"""
@@ -317,6 +511,19 @@ class Simulation:
 
 		return self._lastTickStep
 
+	@property
+	def TraceRecorder (self) -> typing.Optional[typing.Any]:
+		"""
+		An object that will be told about every step of this simulation, this is typically a SimulationTrace.TraceRecorder. Phases are only timed
+		while there is a recorder.
+		"""
+
+		return self._traceRecorder
+
+	@TraceRecorder.setter
+	def TraceRecorder (self, value: typing.Optional[typing.Any]) -> None:
+		self._traceRecorder = value
+
 	def GetPhases (self) -> typing.List[SimulationPhase]:
 		"""
 		Get the phases this simulation will run through. You cannot remove or add a phase my modifying the list returned, please use
@@ -353,6 +560,11 @@ class Simulation:
 		Run the simulation.
 		"""
 
+		traceRecorder = self.TraceRecorder  # type: typing.Optional[typing.Any]
+
+		if traceRecorder is not None:
+			traceRecorder.StartSimulation(self)
+
 		while self.RemainingTicks != 0:
 			self.SimulatingSystem.Verify()
 
@@ -392,32 +604,65 @@ class Simulation:
 				if tickStep == self.RemainingTicks:
 					self._lastTickStep = True
 
-				for phaseInformation in self._phases:  # type: SimulationPhase
-					if not phaseInformation.Required:
-						try:
-							phaseInformation.Phase(self, tickStep)
-						except:
-							Debug.Log("Failed to complete reproductive cycle phase at '%s'.\n%s" % (Types.GetFullName(phaseInformation.Phase), self.SimulatingSystem.DebugInformation),
-									  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = phaseInformation.Phase)
-					else:
-						phaseInformation.Phase(self, tickStep)
-
-				if self._lastTickStep:
-					self._lastTickStep = False
-
-					self.SimulatingSystem.TicksSimulated += tickStep
-					self.CompletedTicks = self.Ticks
+				if self._RunTickStep(tickStep, recorder = traceRecorder):
 					break
-				else:
-					self.SimulatingSystem.TicksSimulated += tickStep
-					self.CompletedTicks += tickStep
 
 		self.SimulatingSystem.Verify()
 
+	def _RunTickStep (self, tickStep: int, recorder: typing.Optional[typing.Any] = None) -> bool:
+		# Returns whether or not this was the simulation's last step. Phases are only timed if there is a recorder to report them to.
+
+		if recorder is not None:
+			recorder.StartStep(self, tickStep)
+
+		for phaseInformation in self._phases:  # type: SimulationPhase
+			if recorder is not None:
+				phaseStartTime = time.perf_counter()  # type: typing.Optional[float]
+			else:
+				phaseStartTime = None  # type: typing.Optional[float]
+
+			if not phaseInformation.Required:
+				try:
+					phaseInformation.Phase(self, tickStep)
+				except:
+					Debug.Log("Failed to complete reproductive cycle phase at '%s'.\n%s" % (Types.GetFullName(phaseInformation.Phase), self.SimulatingSystem.DebugInformation),
+							  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = phaseInformation.Phase)
+			else:
+				phaseInformation.Phase(self, tickStep)
+
+			if recorder is not None:
+				recorder.RecordPhase(phaseInformation, time.perf_counter() - phaseStartTime)
+
+		self.SimulatingSystem.TicksSimulated += tickStep
+
+		if self._lastTickStep:
+			self._lastTickStep = False
+			self.CompletedTicks = self.Ticks
+			lastTickStep = True  # type: bool
+		else:
+			self.CompletedTicks += tickStep
+			lastTickStep = False  # type: bool
+
+		if recorder is not None:
+			recorder.EndStep(self)
+
+		return lastTickStep
+
 	def _PlanSimulation (self) -> None:
 		self.Schedule.ClearPoints()
+		self.Schedule.Origin = self.CompletedTicks
 		self.SimulatingSystem.PlanSimulation(self)
 
+class TrackerDependencies(enum_lib.IntFlag):
+	Traits = 1  # type: TrackerDependencies
+	Age = 2  # type: TrackerDependencies
+	Species = 4  # type: TrackerDependencies
+	Gender = 8  # type: TrackerDependencies
+	LOD = 16  # type: TrackerDependencies
+
+	Nothing = 0  # type: TrackerDependencies
+	All = Traits | Age | Species | Gender | LOD  # type: TrackerDependencies
+
 class TrackerBase(Savable.SavableExtension):
 	HostNamespace = This.Mod.Namespace
 
@@ -440,6 +685,16 @@ class TrackerBase(Savable.SavableExtension):
 
 		raise NotImplementedError()
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return TrackerDependencies.All
+
 	@property
 	def TrackingSystem (self):
 		return self._trackingSystem
@@ -522,16 +777,22 @@ class TrackerBase(Savable.SavableExtension):
 		pass
 
 	def _PrepareForSimulation (self, simulation: Simulation) -> None:
-		self._UpdateReproductiveTimeMultiplier()
+		self._UpdateReproductiveTimeMultiplier(simulation.ReproductiveTimeMultipliers)
 
 	def _CleanUpSimulation (self, simulation: Simulation) -> None:
 		pass
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
+	# noinspection PyUnusedLocal
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductiveTimeMultipliers] = None) -> float:
+		"""
+		:param multipliers: The reproductive time multipliers to derive this tracker's multiplier from. The current multipliers will be used if this is None.
+		:type multipliers: ReproductiveTimeMultipliers | None
+		"""
+
 		return self.TrackingSystem.ReproductiveTimeMultiplier
 
-	def _UpdateReproductiveTimeMultiplier (self) -> None:
-		nextReproductiveTimeMultiplier = self._GetNextReproductiveTimeMultiplier()  # type: float
+	def _UpdateReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductiveTimeMultipliers] = None) -> None:
+		nextReproductiveTimeMultiplier = self._GetNextReproductiveTimeMultiplier(multipliers)  # type: float
 
 		if nextReproductiveTimeMultiplier != self._currentReproductiveTimeMultiplier:
 			self._currentReproductiveTimeMultiplier = nextReproductiveTimeMultiplier
@@ -555,12 +816,21 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 	_trackersSavingKey = "Trackers"
 
-	def __init__ (self, simInfo: sim_info.SimInfo, sectionKey: str = "ReproductiveSystem", *args, **kwargs):
+	_trackerFacetDependencies = (
+		TrackerDependencies.Age,
+		TrackerDependencies.Species,
+		TrackerDependencies.Gender,
+		TrackerDependencies.LOD,
+	)  # type: typing.Tuple[TrackerDependencies, ...]
+
+	def __init__ (self, simInfo: sim_info.SimInfo, sectionKey: str = "ReproductiveSystem", replaying: bool = False, *args, **kwargs):
 		"""
 		:param simInfo: The info of the sim this reproductive system is tied to.
 		:type simInfo: sim_info.SimInfo
 		:param sectionKey: The section key that this object's data will be written to when saving.
 		:type sectionKey: str
+		:param replaying: Whether or not this system only exists to replay a simulation trace. See the 'Replaying' property.
+		:type replaying: bool
 		"""
 
 		super().__init__(*args, **kwargs)
@@ -571,6 +841,9 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 		if not isinstance(sectionKey, str):
 			raise Exceptions.IncorrectTypeException(sectionKey, "sectionKey", (str,))
 
+		if not isinstance(replaying, bool):
+			raise Exceptions.IncorrectTypeException(replaying, "replaying", (bool,))
+
 		if game_services.service_manager is None:
 			raise Exception("Cannot create a reproductive system while the time service is inactive.")
 
@@ -581,6 +854,7 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 		self.LastSimulatedTick = services.time_service().sim_now.absolute_ticks()
 		self.TicksSimulated = 0
 		self.Simulation = None
+		self.SimulationTraceRecorder = None
 
 		self._isSetup = False  # type: bool
 
@@ -588,6 +862,7 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		self._simInfo = simInfo  # type: sim_info.SimInfo
 		self._sectionKey = sectionKey  # type: str
+		self._replaying = replaying  # type: bool
 
 		random.seed(self.SimInfo.id)
 		self._savedStaticSeed = random.randint(-1000000000, 1000000000)  # type: int
@@ -599,6 +874,10 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		self._trackers = list()  # type: typing.List[TrackerBase]
 
+		self._changedTrackerDependencies = TrackerDependencies.All  # type: TrackerDependencies
+		self._reconciledTrackerFacets = None  # type: typing.Optional[tuple]
+		self._reconciledTrackerTypesVersion = None  # type: typing.Optional[int]
+
 		self._SetGuideGroup()
 
 		self.RegisterSavableAttribute(Savable.StandardAttributeHandler("TicksSimulated", "TicksSimulated", self.TicksSimulated, requiredSuccess = False))
@@ -687,6 +966,15 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		return self._sectionKey
 
+	@property
+	def Replaying (self) -> bool:
+		"""
+		Whether or not this system only exists to replay a simulation trace. Replaying systems share their sim with the sim's real system, so trackers
+		must not change the sim or the game through them. This means no buffs, no Dot app changes, no pregnancy visuals and no game pregnancies.
+		"""
+
+		return self._replaying
+
 	@property
 	def ShouldExist (self) -> bool:
 		"""
@@ -764,6 +1052,18 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		self._simulation = value
 
+	@property
+	def SimulationTraceRecorder (self) -> typing.Optional[typing.Any]:
+		"""
+		The recorder every new simulation of this reproductive system will report its steps to, see the SimulationTrace module. This is not saved.
+		"""
+
+		return self._simulationTraceRecorder
+
+	@SimulationTraceRecorder.setter
+	def SimulationTraceRecorder (self, value: typing.Optional[typing.Any]) -> None:
+		self._simulationTraceRecorder = value
+
 	@property
 	def Simulating (self) -> bool:
 		"""
@@ -813,6 +1113,14 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		return self._savedCurrentSeed
 
+	@property
+	def UniqueSeedsGenerated (self) -> int:
+		"""
+		The number of unique seeds created for this sim so far.
+		"""
+
+		return self._uniqueSeedsGenerated
+
 	@property
 	def GuideGroup (self) -> CycleGuideGroups.GuideGroup:
 		"""
@@ -947,18 +1255,27 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 		if game_services.service_manager is None:
 			return
 
-		if not self.Outdated:
-			return
+		timeService = services.time_service()  # type: time_service.TimeService
+		self.UpdateTo(timeService.sim_now.absolute_ticks())
+
+	def UpdateTo (self, currentTick: int) -> None:
+		"""
+		Update this reproductive system to this tick. This works the same as the update method, except that the current tick is given rather than looked up,
+		allowing an update of many systems to look it up only once.
+		:param currentTick: The game's current absolute tick.
+		:type currentTick: int
+		"""
 
 		if self.Simulating:
 			return
 
-		ticksBehind = self.TicksBehind
+		ticksBehind = currentTick - self.LastSimulatedTick  # type: int
 
 		if ticksBehind <= 0:
 			return
 
-		self.Simulate(ticksBehind)
+		self._SimulateInternal(ticksBehind)
+		self.LastSimulatedTick = currentTick
 
 	def Simulate (self, ticks: int) -> None:
 		"""
@@ -1000,6 +1317,44 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		self._VerifyInternal()
 
+	def NotifyTrackerDependenciesChanged (self, dependencies: TrackerDependencies) -> None:
+		"""
+		Notify this reproductive system that these parts of the game's state have changed. The tracker types that depend on them will be reconsidered the next
+		time the trackers are reconciled. Changes to the sim's age, species, gender and lod are noticed without being notified.
+		:param dependencies: The parts of the game's state that have changed.
+		:type dependencies: TrackerDependencies
+		"""
+
+		if not isinstance(dependencies, TrackerDependencies):
+			raise Exceptions.IncorrectTypeException(dependencies, "dependencies", (TrackerDependencies,))
+
+		self._changedTrackerDependencies |= dependencies
+
+	def ReconcileTrackers (self) -> None:
+		"""
+		Add the trackers this system should have and remove those it should not. Only the tracker types that depend on the parts of the game's state that have
+		changed since the last reconciliation will be reconsidered.
+		"""
+
+		changedDependencies = self._changedTrackerDependencies  # type: TrackerDependencies
+		currentFacets = self._GetTrackerFacets()  # type: tuple
+		reconciledFacets = self._reconciledTrackerFacets  # type: typing.Optional[tuple]
+
+		if reconciledFacets is None or self._reconciledTrackerTypesVersion != ReproductionTrackers.GetTrackerTypesVersion():
+			changedDependencies = None
+		elif currentFacets != reconciledFacets:
+			for facetDependency, currentFacet, reconciledFacet in zip(self._trackerFacetDependencies, currentFacets, reconciledFacets):
+				if currentFacet != reconciledFacet:
+					changedDependencies |= facetDependency
+
+		if changedDependencies == TrackerDependencies.Nothing:
+			return
+
+		self._RemoveInvalidTrackers(changedDependencies)
+		self._AddValidTrackers(changedDependencies)
+
+		self._SetTrackersReconciled(currentFacets)
+
 	def PlanUpdate (self) -> CycleEvents.PlanUpdateArguments:
 		"""
 		Determine when the next update should occur.
@@ -1007,12 +1362,7 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		eventArguments = CycleEvents.PlanUpdateArguments()  # type: CycleEvents.PlanUpdateArguments
 
-		for planUpdateCallback in self.PlanUpdateEvent:
-			try:
-				planUpdateCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call plan update callback '" + Types.GetFullName(planUpdateCallback) + "'.\n" + self.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = planUpdateCallback)
+		EventsDispatch.Dispatch("ReproductiveSystem.PlanUpdateEvent", self.PlanUpdateEvent, self, eventArguments, debugSource = self)
 
 		return eventArguments
 
@@ -1074,7 +1424,12 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 		self._InvokeTrackerRemovedEvent(tracker)
 
-	def _AddValidTrackers (self) -> None:
+	def _AddValidTrackers (self, dependencies: typing.Optional[TrackerDependencies] = None) -> None:
+		"""
+		:param dependencies: Only tracker types that depend on these parts of the game's state will be considered. Every tracker type will be considered if this is None.
+		:type dependencies: TrackerDependencies | None
+		"""
+
 		activeTypeIdentifiers = set(tracker.TypeIdentifier for tracker in self._trackers)  # type: typing.Set[str]
 		allTypeIdentifiers = ReproductionTrackers.GetAllTrackerTypeIdentifiers()  # type: typing.Set[str]
 
@@ -1082,6 +1437,9 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 			if not typeIdentifier in activeTypeIdentifiers:
 				trackerType = ReproductionTrackers.GetTrackerType(typeIdentifier)
 
+				if dependencies is not None and trackerType.ShouldHaveDependencies & dependencies == TrackerDependencies.Nothing:
+					continue
+
 				if not trackerType.ShouldHave(self.SimInfo, self):
 					continue
 
@@ -1095,22 +1453,45 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 
 				self._AddTracker(tracker)
 
-	def _RemoveInvalidTrackers (self) -> None:
+	def _RemoveInvalidTrackers (self, dependencies: typing.Optional[TrackerDependencies] = None) -> None:
+		"""
+		:param dependencies: Only trackers that depend on these parts of the game's state will be considered. Every tracker will be considered if this is None.
+		:type dependencies: TrackerDependencies | None
+		"""
+
 		for tracker in self.Trackers:  # type: TrackerBase
+			if dependencies is not None and tracker.ShouldHaveDependencies & dependencies == TrackerDependencies.Nothing:
+				continue
+
 			if tracker.ShouldHave(self.SimInfo, self):
 				continue
 
 			self._RemoveTracker(tracker)
 
+	def _GetTrackerFacets (self) -> tuple:
+		"""
+		Get the parts of the sim's state that can be checked cheaply for changes, in the same order as the '_trackerFacetDependencies' tuple.
+		"""
+
+		simInfo = self.SimInfo  # type: sim_info.SimInfo
+
+		# noinspection PyPropertyAccess
+		return simInfo.age, simInfo.species, simInfo.gender, simInfo.lod
+
+	def _SetTrackersReconciled (self, currentFacets: typing.Optional[tuple] = None) -> None:
+		self._changedTrackerDependencies = TrackerDependencies.Nothing
+		self._reconciledTrackerFacets = currentFacets if currentFacets is not None else self._GetTrackerFacets()
+		self._reconciledTrackerTypesVersion = ReproductionTrackers.GetTrackerTypesVersion()
+
 	def _RemoveAllTrackers (self) -> None:
 		for tracker in self.Trackers:  # type: TrackerBase
 			self._RemoveTracker(tracker)
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return GetGeneralReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductiveTimeMultipliers] = None) -> float:
+		return GetGeneralReproductiveTimeMultiplier(multipliers)
 
-	def _UpdateReproductiveTimeMultiplier (self) -> None:
-		nextReproductiveTimeMultiplier = self._GetNextReproductiveTimeMultiplier()  # type: float
+	def _UpdateReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductiveTimeMultipliers] = None) -> None:
+		nextReproductiveTimeMultiplier = self._GetNextReproductiveTimeMultiplier(multipliers)  # type: float
 
 		if nextReproductiveTimeMultiplier != self._currentReproductiveTimeMultiplier:
 			self._currentReproductiveTimeMultiplier = nextReproductiveTimeMultiplier
@@ -1128,6 +1509,7 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 	def _SetupInternal (self) -> None:
 		self._RemoveInvalidTrackers()
 		self._AddValidTrackers()
+		self._SetTrackersReconciled()
 
 		for tracker in self._trackers:  # type: TrackerBase
 			try:
@@ -1159,7 +1541,7 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()))
 
 	def _PrepareForSimulation (self, simulation: Simulation) -> None:
-		self._UpdateReproductiveTimeMultiplier()
+		self._UpdateReproductiveTimeMultiplier(simulation.ReproductiveTimeMultipliers)
 
 		for tracker in self._trackers:  # type: TrackerBase
 			try:
@@ -1182,8 +1564,7 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 		if self._assignedGuides is None or not self._assignedGuides.Matches(self.SimInfo):
 			self._SetGuideGroup()
 
-		self._RemoveInvalidTrackers()
-		self._AddValidTrackers()
+		self.ReconcileTrackers()
 
 		for tracker in self._trackers:  # type: TrackerBase
 			try:
@@ -1313,27 +1694,52 @@ class ReproductiveSystem(Savable.SavableExtension, metaclass = ReproductiveSyste
 		return superOperationSuccessful
 
 	def _InvokeTrackerAddedEvent (self, tracker: TrackerBase) -> None:
-		eventArguments = CycleEvents.TrackerAddedArguments(tracker)  # type: CycleEvents.TrackerAddedArguments
-
-		for trackerAddedCallback in self.TrackerAddedEvent:
-			try:
-				trackerAddedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call tracker added callback '" + Types.GetFullName(trackerAddedCallback) + "'.\n" + self.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = trackerAddedCallback)
+		EventsDispatch.DispatchLazily("ReproductiveSystem.TrackerAddedEvent", self.TrackerAddedEvent, self, self, CycleEvents.TrackerAddedArguments, tracker)
 
 	def _InvokeTrackerRemovedEvent (self, tracker: TrackerBase) -> None:
-		eventArguments = CycleEvents.TrackerRemovedArguments(tracker)  # type: CycleEvents.TrackerRemovedArguments
+		EventsDispatch.DispatchLazily("ReproductiveSystem.TrackerRemovedEvent", self.TrackerRemovedEvent, self, self, CycleEvents.TrackerRemovedArguments, tracker)
 
-		for trackerRemovedCallback in self.TrackerRemovedEvent:
-			try:
-				trackerRemovedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call tracker removed callback '" + Types.GetFullName(trackerRemovedCallback) + "'.\n" + self.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = trackerRemovedCallback)
+def GetReproductiveTimeMultipliers () -> ReproductiveTimeMultipliers:
+	"""
+	Get the reproductive time multipliers for the current settings. These are only calculated again after the settings are updated or loaded.
+	"""
+
+	global _reproductiveTimeMultipliers
+
+	if _reproductiveTimeMultipliers is None:
+		_reproductiveTimeMultipliers = ReproductiveTimeMultipliers(
+			_reproductiveTimeMultipliersVersion,
+			Settings.ReproductiveSpeed.Get(),
+			Settings.PregnancySpeed.Get()
+		)
+
+	return _reproductiveTimeMultipliers
+
+def GetSimulationSettingsSnapshot () -> SimulationSettingsSnapshot:
+	"""
+	Get a snapshot of the settings read by reproductive simulations. A new snapshot is only taken after the settings are updated or loaded.
+	"""
 
-def GetGeneralReproductiveTimeMultiplier () -> float:
-	return Settings.ReproductiveSpeed.Get()
+	global _simulationSettingsSnapshot
+
+	if _simulationSettingsSnapshot is None:
+		_simulationSettingsSnapshot = SimulationSettingsSnapshot(
+			GetReproductiveTimeMultipliers(),
+			Settings.QuickMode.Get()
+		)
+
+	return _simulationSettingsSnapshot
+
+def GetGeneralReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductiveTimeMultipliers] = None) -> float:
+	"""
+	:param multipliers: The reproductive time multipliers to read from. The current multipliers will be used if this is None.
+	:type multipliers: ReproductiveTimeMultipliers | None
+	"""
+
+	if multipliers is None:
+		multipliers = GetReproductiveTimeMultipliers()
+
+	return multipliers.General
 
 def GameMinutesToTicks (gameMinutes: typing.Union[float, int]) -> int:
 	"""
@@ -1488,3 +1894,101 @@ def GetClosestPreciseReproductiveMinute (reproductiveMinutes: typing.Union[float
 		return reproductiveMinutes
 
 	return TicksToReproductiveMinutes(ReproductiveMinutesToTicks(reproductiveMinutes, reproductiveTimeMultiplier), reproductiveTimeMultiplier)
+
+def InvalidateReproductiveTimeMultipliers () -> None:
+	"""
+	Make the reproductive time multipliers and the simulation settings snapshot be calculated again the next time they are needed. Settings update
+	callbacks that simulate reproductive systems should call this first, as they may run before this module's own callback.
+	"""
+
+	global _reproductiveTimeMultipliers, _reproductiveTimeMultipliersVersion, _simulationSettingsSnapshot
+
+	_reproductiveTimeMultipliers = None
+	_reproductiveTimeMultipliersVersion += 1
+	_simulationSettingsSnapshot = None
+
+# noinspection PyUnusedLocal
+def EncodeUUID (value: typing.Optional[uuid.UUID]) -> typing.Optional[str]:
+	"""
+	A savable attribute encoder for unique identifiers, identifiers are saved in their string form.
+	"""
+
+	return str(value) if value is not None else None
+
+def DecodeUUID (valueString: typing.Optional[str]) -> typing.Optional[uuid.UUID]:
+	"""
+	A savable attribute decoder for unique identifiers saved by the 'EncodeUUID' function.
+	"""
+
+	return uuid.UUID(valueString) if valueString is not None else None
+
+def CreateUniqueIdentifierVerifier (savingKey: str) -> typing.Callable[[typing.Optional[uuid.UUID]], None]:
+	"""
+	Create a savable attribute type verifier for unique identifiers. These verifiers don't depend on the object being saved, so modules should create one
+	per saving key and share it between every object.
+	:param savingKey: The key the unique identifier is saved under, this is used to name the attribute in the verifier's exceptions.
+	:type savingKey: str
+	"""
+
+	if not isinstance(savingKey, str):
+		raise Exceptions.IncorrectTypeException(savingKey, "savingKey", (str,))
+
+	def uniqueIdentifierVerifier (value: typing.Optional[uuid.UUID]) -> None:
+		if not isinstance(value, uuid.UUID) and value is not None:
+			raise Exceptions.IncorrectTypeException(value, savingKey, (uuid.UUID, None))
+
+	return uniqueIdentifierVerifier
+
+def CreateUniqueSeedVerifier (savingKey: str) -> typing.Callable[[typing.Optional[int]], None]:
+	"""
+	Create a savable attribute type verifier for unique seeds. These verifiers don't depend on the object being saved, so modules should create one per
+	saving key and share it between every object.
+	:param savingKey: The key the unique seed is saved under, this is used to name the attribute in the verifier's exceptions.
+	:type savingKey: str
+	"""
+
+	if not isinstance(savingKey, str):
+		raise Exceptions.IncorrectTypeException(savingKey, "savingKey", (str,))
+
+	def uniqueSeedVerifier (value: typing.Optional[int]) -> None:
+		if not isinstance(value, int) and value is not None:
+			raise Exceptions.IncorrectTypeException(value, savingKey, (int, None))
+
+	return uniqueSeedVerifier
+
+def CreateUniqueSeedUpdater (savingKey: str) -> typing.Callable[[dict, typing.Optional[Version.Version]], None]:
+	"""
+	Create a savable attribute updater that removes unique seeds saved in the old list form. These updaters don't depend on the object being loaded, so
+	modules should create one per saving key and share it between every object.
+	:param savingKey: The key the unique seed is saved under.
+	:type savingKey: str
+	"""
+
+	if not isinstance(savingKey, str):
+		raise Exceptions.IncorrectTypeException(savingKey, "savingKey", (str,))
+
+	# noinspection PyUnusedLocal
+	def uniqueSeedUpdater (data: dict, lastVersion: typing.Optional[Version.Version]) -> None:
+		if isinstance(data.get(savingKey, None), list):
+			data.pop(savingKey)
+
+	return uniqueSeedUpdater
+
+def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
+	Settings.RegisterOnUpdateCallback(_SettingsOnUpdatedCallback)
+	Settings.RegisterOnLoadCallback(_SettingsOnLoadedCallback)
+
+# noinspection PyUnusedLocal
+def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
+	Settings.UnregisterOnUpdateCallback(_SettingsOnUpdatedCallback)
+	Settings.UnregisterOnLoadCallback(_SettingsOnLoadedCallback)
+
+	InvalidateReproductiveTimeMultipliers()
+
+# noinspection PyUnusedLocal
+def _SettingsOnUpdatedCallback (owner, eventArguments: SettingsBase.UpdateEventArguments) -> None:
+	InvalidateReproductiveTimeMultipliers()
+
+# noinspection PyUnusedLocal
+def _SettingsOnLoadedCallback (owner, eventArguments: Events.EventArguments) -> None:
+	InvalidateReproductiveTimeMultipliers()
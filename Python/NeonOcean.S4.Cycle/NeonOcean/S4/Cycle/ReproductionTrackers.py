@@ -6,6 +6,7 @@ from NeonOcean.S4.Cycle import ReproductionShared
 from NeonOcean.S4.Main.Tools import Exceptions
 
 _trackerTypes = dict()  # type: typing.Dict[str, typing.Type[ReproductionShared.TrackerBase]]
+_trackerTypesVersion = 0  # type: int  # Incremented whenever a tracker type is registered, reproductive systems need to reconsider every tracker type when this changes.
 
 def RegisterTrackerType (identifier: str, trackerType: typing.Type[ReproductionShared.TrackerBase]) -> None:
 	"""
@@ -17,6 +18,8 @@ def RegisterTrackerType (identifier: str, trackerType: typing.Type[ReproductionS
 	:type trackerType: typing.Type[ReproductionShared.TrackerBase]
 	"""
 
+	global _trackerTypesVersion
+
 	if not isinstance(identifier, str):
 		raise Exceptions.IncorrectTypeException(identifier, "identifier", (str,))
 
@@ -27,6 +30,7 @@ def RegisterTrackerType (identifier: str, trackerType: typing.Type[ReproductionS
 		raise Exceptions.DoesNotInheritException("trackerType", (ReproductionShared.TrackerBase,))
 
 	_trackerTypes[identifier] = trackerType
+	_trackerTypesVersion += 1
 
 def GetTrackerType (identifier: str) -> typing.Type[ReproductionShared.TrackerBase]:
 	"""
@@ -57,6 +61,13 @@ def GetAllTrackerTypeIdentifiers () -> typing.Set[str]:
 
 	return set(_trackerTypes.keys())
 
+def GetTrackerTypesVersion () -> int:
+	"""
+	Get a number that changes whenever a tracker type is registered.
+	"""
+
+	return _trackerTypesVersion
+
 def TrackerTypeExists (identifier: str) -> bool:
 	"""
 	Get whether or not a tracker of this type exists.
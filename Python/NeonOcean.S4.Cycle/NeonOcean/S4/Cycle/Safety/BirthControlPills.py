@@ -6,6 +6,7 @@ import services
 from NeonOcean.S4.Cycle import Reproduction, ReproductionShared
 from NeonOcean.S4.Cycle.Effects import BirthControlPills as EffectsBirthControlPills, Shared as EffectsShared
 from NeonOcean.S4.Cycle.Safety import Resources as SafetyResources
+from NeonOcean.S4.Cycle.Tools import Inventory
 from NeonOcean.S4.Cycle.UI import BirthControlPills as UIBirthControlPills
 from NeonOcean.S4.Cycle.Universal import EffectTracker, Shared as UniversalShared
 from NeonOcean.S4.Main.Tools import Exceptions
@@ -13,7 +14,6 @@ from objects import definition_manager, script_object
 from objects.components import inventory as ComponentsInventory, types as ComponentsTypes
 from sims import sim, sim_info
 from sims4 import resources
-from sims4.tuning import instance_manager
 from statistics import statistic, statistic_tracker
 
 def OnBirthControlPills (targetSimInfo: sim_info.SimInfo) -> bool:
@@ -130,28 +130,13 @@ def FindValidPillsObject (targetSim: sim.Sim) -> typing.Optional[script_object.S
 
 	inventoryComponent = targetSim.get_component(ComponentsTypes.INVENTORY_COMPONENT)  # type: ComponentsInventory.InventoryComponent
 
-	statisticManager = services.get_instance_manager(resources.Types.STATISTIC)  # type: instance_manager.InstanceManager
+	pillsCountStatisticType = _GetPillsCountStatisticType()  # type: typing.Type[statistic.Statistic]
 
-	pillsCountStatisticType = statisticManager.get(SafetyResources.BirthControlPillsCountStatisticID)  # type: typing.Type[statistic.Statistic]
-
-	for inventoryObject in inventoryComponent:  # type: script_object.ScriptObject
-		if inventoryObject.definition.id == SafetyResources.BirthControlPillsObjectDefinitionID:
-			pillsCountStatisticTracker = inventoryObject.get_tracker(pillsCountStatisticType)
-
-			if pillsCountStatisticTracker is None:
-				continue
-
-			pillsCountStatistic = pillsCountStatisticTracker.get_statistic(pillsCountStatisticType, add = True)  # type: typing.Optional[statistic.Statistic]
-
-			if pillsCountStatistic is None:
-				continue
-
-			pillsObjectCount = int(pillsCountStatistic.get_value())  # type: int
-
-			if pillsObjectCount > 0:
-				return inventoryObject
+	if pillsCountStatisticType is None:
+		return None
 
-	return None
+	pillsIndex = Inventory.GetStatisticIndex(SafetyResources.BirthControlPillsObjectDefinitionID, pillsCountStatisticType)  # type: Inventory.InventoryStatisticIndex
+	return pillsIndex.GetUsableObject(inventoryComponent)
 
 def GetPillsLeftInObject (pillsObject: script_object.ScriptObject) -> typing.Optional[int]:
 	"""
@@ -164,21 +149,13 @@ def GetPillsLeftInObject (pillsObject: script_object.ScriptObject) -> typing.Opt
 	if pillsObject.definition.id != SafetyResources.BirthControlPillsObjectDefinitionID:
 		return None
 
-	statisticManager = services.get_instance_manager(resources.Types.STATISTIC)  # type: typing.Optional[definition_manager.InstanceManager]
-
-	pillsCountStatisticType = statisticManager.get(SafetyResources.BirthControlPillsCountStatisticID)  # type: typing.Type[statistic.Statistic]
-
-	pillsCountStatisticTracker = pillsObject.get_tracker(pillsCountStatisticType)  # type: typing.Optional[statistic_tracker.StatisticTracker]
+	pillsCountStatisticType = _GetPillsCountStatisticType()  # type: typing.Type[statistic.Statistic]
 
-	if pillsCountStatisticTracker is None:
-		return None
-
-	pillsCountStatistic = pillsCountStatisticTracker.get_statistic(pillsCountStatisticType, add = True)  # type: typing.Optional[statistic.Statistic]
-
-	if pillsCountStatistic is None:
+	if pillsCountStatisticType is None:
 		return None
 
-	return int(pillsCountStatistic.get_value())
+	pillsIndex = Inventory.GetStatisticIndex(SafetyResources.BirthControlPillsObjectDefinitionID, pillsCountStatisticType)  # type: Inventory.InventoryStatisticIndex
+	return pillsIndex.GetObjectValue(pillsObject)
 
 def RemovePillFromObject (pillsObject: script_object.ScriptObject) -> bool:
 	"""
@@ -191,9 +168,7 @@ def RemovePillFromObject (pillsObject: script_object.ScriptObject) -> bool:
 	if pillsObject.definition.id != SafetyResources.BirthControlPillsObjectDefinitionID:
 		return False
 
-	statisticManager = services.get_instance_manager(resources.Types.STATISTIC)  # type: typing.Optional[definition_manager.InstanceManager]
-
-	pillsCountStatisticType = statisticManager.get(SafetyResources.BirthControlPillsCountStatisticID)  # type: typing.Type[statistic.Statistic]
+	pillsCountStatisticType = _GetPillsCountStatisticType()  # type: typing.Type[statistic.Statistic]
 	pillsCountStatisticTracker = pillsObject.get_tracker(pillsCountStatisticType)  # type: typing.Optional[statistic_tracker.StatisticTracker]
 
 	if pillsCountStatisticTracker is None:
@@ -212,3 +187,7 @@ def RemovePillFromObject (pillsObject: script_object.ScriptObject) -> bool:
 	pillsCountStatistic.set_value(pillsObjectCount - 1)
 
 	return True
+
+def _GetPillsCountStatisticType () -> typing.Optional[typing.Type[statistic.Statistic]]:
+	statisticManager = services.get_instance_manager(resources.Types.STATISTIC)  # type: typing.Optional[definition_manager.InstanceManager]
+	return statisticManager.get(SafetyResources.BirthControlPillsCountStatisticID)
@@ -5,6 +5,7 @@ import typing
 import services
 from NeonOcean.S4.Cycle import This
 from NeonOcean.S4.Cycle.Safety import WoohooSafety
+from NeonOcean.S4.Cycle.Tools import Inventory
 from NeonOcean.S4.Main import Debug
 from NeonOcean.S4.Main.Tools import Exceptions
 from objects import definition
@@ -71,22 +72,7 @@ class UseReductionInventoryStatistic(UseReductionBase, tunable.HasTunableSinglet
 		targetSim = targetSimInfo.get_sim_instance()  # type: sim.Sim
 
 		inventoryComponent = targetSim.get_component(ComponentsTypes.INVENTORY_COMPONENT)  # type: ComponentsInventory.InventoryComponent
-
-		if not inventoryComponent.has_item_with_definition(self.TargetObject):
-			return 0
-
-		useCount = 0  # type: int
-
-		for matchingObject in inventoryComponent.get_items_with_definition_gen(self.TargetObject):  # type: game_object.GameObject
-			matchingStatistic = matchingObject.statistic_tracker.get_statistic(self.TargetStatistic, add = True)  # type: statistic.BaseStatistic
-			matchingStatisticValue = int(matchingStatistic.get_value())  # type: int
-
-			if matchingStatisticValue <= 0:
-				continue
-
-			useCount += matchingStatisticValue
-
-		return useCount
+		return self._GetStatisticIndex().GetTotalValue(inventoryComponent)
 
 	def RemoveUse (self, targetSimInfo: sim_info.SimInfo) -> bool:
 		"""
@@ -112,21 +98,19 @@ class UseReductionInventoryStatistic(UseReductionBase, tunable.HasTunableSinglet
 
 		inventoryComponent = targetSim.get_component(ComponentsTypes.INVENTORY_COMPONENT)  # type: ComponentsInventory.InventoryComponent
 
-		if not inventoryComponent.has_item_with_definition(self.TargetObject):
-			return False
-
-		for matchingObject in inventoryComponent.get_items_with_definition_gen(self.TargetObject):  # type: game_object.GameObject
-			matchingStatistic = matchingObject.statistic_tracker.get_statistic(self.TargetStatistic, add = True)  # type: statistic.BaseStatistic
-			matchingStatisticValue = int(matchingStatistic.get_value())  # type: int
+		matchingObject = self._GetStatisticIndex().GetUsableObject(inventoryComponent)  # type: typing.Optional[game_object.GameObject]
 
-			if matchingStatisticValue <= 0:
-				continue
+		if matchingObject is None:
+			return False
 
-			matchingStatistic.set_value(matchingStatisticValue - 1)
-			break
+		matchingStatistic = matchingObject.get_tracker(self.TargetStatistic).get_statistic(self.TargetStatistic, add = True)  # type: statistic.BaseStatistic
+		matchingStatistic.set_value(int(matchingStatistic.get_value()) - 1)  # The statistic index's watcher will pick up on this change.
 
 		return True
 
+	def _GetStatisticIndex (self) -> Inventory.InventoryStatisticIndex:
+		return Inventory.GetStatisticIndex(self.TargetObject.id, self.TargetStatistic)
+
 class UseReductionInventoryObject(UseReductionBase, tunable.HasTunableSingletonFactory, tunable.AutoFactoryInit):
 	FACTORY_TUNABLES = {
 		"TargetObject": tunable.TunableReference(description = "The type of object for which we should remove from the sim's inventory.", manager = services.get_instance_manager(resources.Types.OBJECT), pack_safe = True),
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import random
+import types
 import typing
 
 import services
 import snippets
 from NeonOcean.S4.Cycle import SimSettings, This
 from NeonOcean.S4.Cycle.Safety import BirthControlPills as SafetyBirthControlPills
-from NeonOcean.S4.Cycle.Tools import Distribution, Probability
-from NeonOcean.S4.Main import Debug, Snippets as MainSnippets
-from NeonOcean.S4.Main.Tools import Exceptions
+from NeonOcean.S4.Cycle.SimSettings import Base as SimSettingsBase
+from NeonOcean.S4.Cycle.Tools import Distribution, Inventory, Probability
+from NeonOcean.S4.Main import Debug, Director, LoadingShared, Snippets as MainSnippets
+from NeonOcean.S4.Main.Tools import Events, Exceptions, Patcher
 from event_testing import resolver, tests
 from objects import definition
 from objects.components import inventory as ComponentsInventory, types as ComponentsTypes
@@ -24,8 +26,33 @@ if typing.TYPE_CHECKING:
 _woohooSafetyMethodSnippetName = This.Mod.Namespace.replace(".", "_") + "_Woohoo_Safety_Method"  # type: str
 _limitedUseWoohooSafetyMethodSnippetName = This.Mod.Namespace.replace(".", "_") + "_Limited_Use_Woohoo_Safety_Method"  # type: str
 
+_traitChangeMethodNames = (
+	"add_trait",
+	"remove_trait",
+)  # type: typing.Tuple[str, ...]
+
 _woohooSafetyMethods = dict()  # type: typing.Dict[int, WoohooSafetyMethod]
 
+_orderedWoohooSafetyMethods = tuple()  # type: typing.Tuple[WoohooSafetyMethod, ...]  # Every method, with the compounding methods placed before the non-compounding methods.
+
+_simMethodsVersion = 0  # type: int  # Incremented whenever a change that may affect any sim's methods is made, such as a trait or setting change.
+_simMethods = dict()  # type: typing.Dict[int, _SimMethods]
+
+class _Announcer(Director.Announcer):
+	Host = This.Mod
+
+	@classmethod
+	def ZoneOnToreDown (cls, *args, **kwargs) -> None:
+		ClearSimMethodsCache()
+
+class _SimMethods:
+	def __init__ (self, methodsVersion: int, inventoryVersion: typing.Optional[int], available: typing.Tuple[typing.Optional[bool], ...], using: typing.Tuple[bool, ...]):
+		self.MethodsVersion = methodsVersion  # type: int
+		self.InventoryVersion = inventoryVersion  # type: typing.Optional[int]  # None if the sim was not instanced when this was built.
+
+		self.Available = available  # type: typing.Tuple[typing.Optional[bool], ...]  # Whether or not each ordered method is available, None if the method's availability needs to be checked every time.
+		self.Using = using  # type: typing.Tuple[bool, ...]  # Whether or not the sim should use each ordered method if available.
+
 class WoohooSafetyMethod(tunable.HasTunableSingletonFactory, tunable.AutoFactoryInit):
 	class Requirement:
 		def RequirementMet (self, targetSim: sim.Sim) -> bool:
@@ -35,6 +62,14 @@ class WoohooSafetyMethod(tunable.HasTunableSingletonFactory, tunable.AutoFactory
 
 			raise NotImplementedError()
 
+		@property
+		def ResultCacheable (self) -> bool:
+			"""
+			Whether or not this requirement's result will only change when the target sim's inventory, traits or settings change.
+			"""
+
+			return True
+
 	class ObjectRequirement(Requirement, tunable.HasTunableSingletonFactory, tunable.AutoFactoryInit):
 		FACTORY_TUNABLES = {
 			"RequiredObject": tunable.TunableReference(description = "A sim must have this object in their inventory in order to meet this requirement.", manager = services.get_instance_manager(resources.Types.OBJECT), pack_safe = True),
@@ -44,6 +79,15 @@ class WoohooSafetyMethod(tunable.HasTunableSingletonFactory, tunable.AutoFactory
 		RequiredObject: typing.Optional[definition.Definition]
 		RequiredObjectTests: tests.CompoundTestList
 
+		@property
+		def ResultCacheable (self) -> bool:
+			"""
+			Whether or not this requirement's result will only change when the target sim's inventory, traits or settings change. The object tests may
+			look at things we cannot watch, such as object statistics, so this requirement must be checked every time if it has any.
+			"""
+
+			return len(self.RequiredObjectTests) == 0
+
 		def RequirementMet (self, targetSim: sim.Sim) -> bool:
 			"""
 			Whether or not the target sim meets the requirements.
@@ -56,14 +100,15 @@ class WoohooSafetyMethod(tunable.HasTunableSingletonFactory, tunable.AutoFactory
 				return False
 
 			inventoryComponent = targetSim.get_component(ComponentsTypes.INVENTORY_COMPONENT)  # type: ComponentsInventory.InventoryComponent
+			matchingObjects = Inventory.GetObjectsWithDefinition(inventoryComponent, self.RequiredObject.id)  # type: typing.Tuple[game_object.GameObject, ...]
 
-			if not inventoryComponent.has_item_with_definition(self.RequiredObject):
+			if len(matchingObjects) == 0:
 				return False
 			else:
 				if len(self.RequiredObjectTests) == 0:
 					return True
 
-			for matchingObject in inventoryComponent.get_items_with_definition_gen(self.RequiredObject):  # type: game_object.GameObject
+			for matchingObject in matchingObjects:  # type: game_object.GameObject
 				requiredObjectResolver = resolver.SingleObjectResolver(matchingObject)
 				testResults = self.RequiredObjectTests.run_tests(requiredObjectResolver)  # type: typing.Optional[TestingUnit.TestResult]
 
@@ -141,6 +186,8 @@ class WoohooSafetyMethod(tunable.HasTunableSingletonFactory, tunable.AutoFactory
 
 	GUID = None  # type: typing.Optional[int]
 
+	_uniqueSeed = None  # type: typing.Optional[int]
+
 	@property
 	def HasRequirement (self) -> bool:
 		"""
@@ -156,13 +203,33 @@ class WoohooSafetyMethod(tunable.HasTunableSingletonFactory, tunable.AutoFactory
 
 		return False
 
+	@property
+	def AvailabilityCacheable (self) -> bool:
+		"""
+		Whether or not this safety method's availability will only change when the target sim's inventory, traits or settings change.
+		"""
+
+		for requirementGroup in self.Requirements:  # type: typing.Tuple[WoohooSafetyMethod.Requirement, ...]
+			for requirement in requirementGroup:  # type: WoohooSafetyMethod.Requirement
+				if not requirement.ResultCacheable:
+					return False
+
+		return True
+
 	def GetUniqueSeed (self) -> int:
 		"""
 		Get a unique randomization seed for this woohoo safety method.
 		"""
 
-		random.seed(self.GUID)
-		return random.randint(-1000000000, 1000000000)  # type: int
+		if self._uniqueSeed is not None:
+			return self._uniqueSeed
+
+		uniqueSeed = random.Random(self.GUID).randint(-1000000000, 1000000000)  # type: int
+
+		if self.GUID is not None:
+			self._uniqueSeed = uniqueSeed
+
+		return uniqueSeed
 
 	def IsAvailable (self, targetSimInfo: sim_info.SimInfo) -> bool:
 		"""
@@ -338,9 +405,8 @@ class MethodPerformanceSelectionSet(list):
 		if not isinstance(autoSelectBaseSeed, int):
 			raise Exceptions.IncorrectTypeException(autoSelectBaseSeed, "autoSelectBaseSeed", (int, None))
 
-		performanceSelections = list()  # type: typing.List[MethodPerformanceSelection]
-
-		hasCompoundingMethod = False  # type: bool
+		selectedMethods = list()  # type: typing.List[WoohooSafetyMethod]
+		firstNonCompoundingMethod = None  # type: typing.Optional[WoohooSafetyMethod]
 
 		for woohooSafetyMethodIndex in range(len(woohooSafetyMethods)):  # type: int
 			woohooSafetyMethod = woohooSafetyMethods[woohooSafetyMethodIndex]  # type: WoohooSafetyMethod
@@ -349,21 +415,20 @@ class MethodPerformanceSelectionSet(list):
 				raise Exceptions.IncorrectTypeException(woohooSafetyMethods, "woohooSafetyMethods[%s]" % woohooSafetyMethodIndex, (WoohooSafetyMethod,))
 
 			if woohooSafetyMethod.CompoundingMethod:
-				hasCompoundingMethod = True
+				selectedMethods.append(woohooSafetyMethod)
+			elif firstNonCompoundingMethod is None:
+				firstNonCompoundingMethod = woohooSafetyMethod
 
-		for woohooSafetyMethodIndex in range(len(woohooSafetyMethods)):  # type: int
-			woohooSafetyMethod = woohooSafetyMethods[woohooSafetyMethodIndex]  # type: WoohooSafetyMethod
+		if len(selectedMethods) == 0 and firstNonCompoundingMethod is not None:
+			# We have only been given a list of non compounding methods. Added the first of the list and no other because the rest can't compound with the first.
+			selectedMethods.append(firstNonCompoundingMethod)
 
-			if hasCompoundingMethod and not woohooSafetyMethod.CompoundingMethod:
-				continue
+		performanceSelections = list()  # type: typing.List[MethodPerformanceSelection]
 
+		for woohooSafetyMethod in selectedMethods:  # type: WoohooSafetyMethod
 			autoSelectSeed = autoSelectBaseSeed + woohooSafetyMethod.GetUniqueSeed()
 			performanceSelections.append(MethodPerformanceSelection(woohooSafetyMethod, autoSelectSeed = autoSelectSeed))
 
-			if not hasCompoundingMethod:
-				# We have only been given a list of non compounding methods. Added the first of the list and no other because the rest can't compound with the first.
-				break
-
 		super().__init__(performanceSelections)
 
 	def GenerateSpermArrivingPercentage (self, generationBaseSeed: typing.Optional[int] = None) -> float:
@@ -442,10 +507,13 @@ def GetAvailableWoohooSafetyMethods (targetSimInfo: sim_info.SimInfo) -> typing.
 	if not isinstance(targetSimInfo, sim_info.SimInfo):
 		raise Exceptions.IncorrectTypeException(targetSimInfo, "targetSimInfo", (sim_info.SimInfo,))
 
+	simMethods = _GetSimMethods(targetSimInfo)  # type: _SimMethods
 	availableSafetyMethods = list()  # type: typing.List[WoohooSafetyMethod]
 
-	for woohooSafetyMethod in _woohooSafetyMethods.values():  # type: WoohooSafetyMethod
-		if woohooSafetyMethod.IsAvailable(targetSimInfo):
+	for woohooSafetyMethodIndex in range(len(_orderedWoohooSafetyMethods)):  # type: int
+		woohooSafetyMethod = _orderedWoohooSafetyMethods[woohooSafetyMethodIndex]  # type: WoohooSafetyMethod
+
+		if _MethodAvailable(simMethods, woohooSafetyMethodIndex, targetSimInfo):
 			availableSafetyMethods.append(woohooSafetyMethod)
 
 	return availableSafetyMethods
@@ -458,10 +526,16 @@ def GetUsingWoohooSafetyMethods (targetSimInfo: sim_info.SimInfo) -> typing.List
 	if not isinstance(targetSimInfo, sim_info.SimInfo):
 		raise Exceptions.IncorrectTypeException(targetSimInfo, "targetSimInfo", (sim_info.SimInfo,))
 
+	simMethods = _GetSimMethods(targetSimInfo)  # type: _SimMethods
 	usingSafetyMethods = list()  # type: typing.List[WoohooSafetyMethod]
 
-	for woohooSafetyMethod in GetAvailableWoohooSafetyMethods(targetSimInfo):  # type: WoohooSafetyMethod
-		if IsUsingWoohooSafetyMethod(woohooSafetyMethod, targetSimInfo):
+	for woohooSafetyMethodIndex in range(len(_orderedWoohooSafetyMethods)):  # type: int
+		woohooSafetyMethod = _orderedWoohooSafetyMethods[woohooSafetyMethodIndex]  # type: WoohooSafetyMethod
+
+		if not simMethods.Using[woohooSafetyMethodIndex]:
+			continue
+
+		if _MethodAvailable(simMethods, woohooSafetyMethodIndex, targetSimInfo):
 			usingSafetyMethods.append(woohooSafetyMethod)
 
 	return usingSafetyMethods
@@ -506,6 +580,101 @@ def SetIsUsingWoohooSafetyMethod (woohooSafetyMethod: WoohooSafetyMethod, target
 	woohooSafetyMethodUse[woohooSafetyMethod.GUID] = isUsing
 	SimSettings.WoohooSafetyMethodUse.Set(str(targetSimInfo.id), woohooSafetyMethodUse)
 
+	InvalidateSimMethodsCache()
+
+def InvalidateSimMethodsCache () -> None:
+	"""
+	Mark every sim's cached woohoo safety method availability as out of date. This should be called after anything we do not watch changes in a way
+	that may affect which methods a sim can or will use.
+	"""
+
+	global _simMethodsVersion
+
+	_simMethodsVersion += 1
+
+def ClearSimMethodsCache () -> None:
+	"""
+	Throw out every sim's cached woohoo safety method availability.
+	"""
+
+	InvalidateSimMethodsCache()
+	_simMethods.clear()
+
+def _GetSimMethods (targetSimInfo: sim_info.SimInfo) -> _SimMethods:
+	if targetSimInfo.is_instanced():
+		targetSim = targetSimInfo.get_sim_instance()  # type: sim.Sim
+		inventoryComponent = targetSim.get_component(ComponentsTypes.INVENTORY_COMPONENT)  # type: typing.Optional[ComponentsInventory.InventoryComponent]
+		inventoryVersion = Inventory.GetInventoryVersion(inventoryComponent) if inventoryComponent is not None else None  # type: typing.Optional[int]
+		cacheable = inventoryVersion is not None  # type: bool
+	else:
+		inventoryVersion = None  # type: typing.Optional[int]
+		cacheable = True  # type: bool
+
+	simMethods = _simMethods.get(targetSimInfo.id, None)  # type: typing.Optional[_SimMethods]
+
+	if simMethods is not None and cacheable and simMethods.MethodsVersion == _simMethodsVersion and simMethods.InventoryVersion == inventoryVersion:
+		return simMethods
+
+	available = list()  # type: typing.List[typing.Optional[bool]]
+	using = list()  # type: typing.List[bool]
+
+	for woohooSafetyMethod in _orderedWoohooSafetyMethods:  # type: WoohooSafetyMethod
+		if woohooSafetyMethod.AvailabilityCacheable:
+			available.append(woohooSafetyMethod.IsAvailable(targetSimInfo))
+		else:
+			available.append(None)
+
+		using.append(IsUsingWoohooSafetyMethod(woohooSafetyMethod, targetSimInfo))
+
+	simMethods = _SimMethods(_simMethodsVersion, inventoryVersion, tuple(available), tuple(using))
+
+	if cacheable:
+		_simMethods[targetSimInfo.id] = simMethods
+
+	return simMethods
+
+def _MethodAvailable (simMethods: _SimMethods, woohooSafetyMethodIndex: int, targetSimInfo: sim_info.SimInfo) -> bool:
+	methodAvailable = simMethods.Available[woohooSafetyMethodIndex]  # type: typing.Optional[bool]
+
+	if methodAvailable is None:
+		return _orderedWoohooSafetyMethods[woohooSafetyMethodIndex].IsAvailable(targetSimInfo)
+
+	return methodAvailable
+
+def _SetupMethodPartitions () -> None:
+	global _orderedWoohooSafetyMethods
+
+	compoundingMethods = list()  # type: typing.List[WoohooSafetyMethod]
+	nonCompoundingMethods = list()  # type: typing.List[WoohooSafetyMethod]
+
+	for woohooSafetyMethod in _woohooSafetyMethods.values():  # type: WoohooSafetyMethod
+		if woohooSafetyMethod.CompoundingMethod:
+			compoundingMethods.append(woohooSafetyMethod)
+		else:
+			nonCompoundingMethods.append(woohooSafetyMethod)
+
+	_orderedWoohooSafetyMethods = tuple(compoundingMethods) + tuple(nonCompoundingMethods)
+
+	ClearSimMethodsCache()
+
+def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
+	if cause != LoadingShared.LoadingCauses.Reloading:
+		for methodName in _traitChangeMethodNames:  # type: str
+			if not hasattr(sim_info.SimInfo, methodName):
+				Debug.Log("Could not find the sim info method '%s', woohoo safety method availability will not be updated when a sim's traits change." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+				continue
+
+			Patcher.Patch(sim_info.SimInfo, methodName, _TraitChangedPatch, patchType = Patcher.PatchTypes.After)
+
+	SimSettings.RegisterOnUpdateCallback(_SimSettingsOnUpdatedCallback)
+	SimSettings.RegisterOnLoadCallback(_SimSettingsOnLoadedCallback)
+
+def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
+	SimSettings.UnregisterOnUpdateCallback(_SimSettingsOnUpdatedCallback)
+	SimSettings.UnregisterOnLoadCallback(_SimSettingsOnLoadedCallback)
+
+	ClearSimMethodsCache()
+
 def _Setup () -> None:
 	snippets.define_snippet(_woohooSafetyMethodSnippetName, WoohooSafetyMethod.TunableFactory())
 	MainSnippets.SetupSnippetScanning(_woohooSafetyMethodSnippetName, _WoohooSafetyMethodsScanningCallback)
@@ -522,4 +691,18 @@ def _WoohooSafetyMethodsScanningCallback (woohooSafetyMethodSnippets: typing.Lis
 
 		_woohooSafetyMethods[woohooSafetyMethod.GUID] = woohooSafetyMethod
 
+	_SetupMethodPartitions()
+
+# noinspection PyUnusedLocal
+def _TraitChangedPatch (self: sim_info.SimInfo, *args, **kwargs) -> None:
+	InvalidateSimMethodsCache()
+
+# noinspection PyUnusedLocal
+def _SimSettingsOnUpdatedCallback (owner: types.ModuleType, eventArguments: SimSettingsBase.UpdateEventArguments) -> None:
+	InvalidateSimMethodsCache()
+
+# noinspection PyUnusedLocal
+def _SimSettingsOnLoadedCallback (owner: types.ModuleType, eventArguments: Events.EventArguments) -> None:
+	InvalidateSimMethodsCache()
+
 _Setup()
@@ -20,6 +20,9 @@ AllSettings = list()  # type: typing.List[typing.Type[Setting]]
 
 _previousValues = dict()  # type: typing.Dict[str, typing.Any]
 
+_unresolvedValue = object()
+_cacheableValueTypes = (bool, int, float, str)  # Mutable values will never be cached as the receiver may modify them.
+
 _onUpdateWrapper = Events.EventHandler()  # type: Events.EventHandler
 _onLoadWrapper = Events.EventHandler()  # type: Events.EventHandler
 
@@ -47,10 +50,16 @@ class Setting(AbstractSettings.SettingAbstract):
 	ListPriority = 0  # type: typing.Union[float, int]
 
 	_overrides = None  # type: typing.Optional[typing.List[_SettingOverride]]
+	_overrideIndex = None  # type: typing.Dict[str, _SettingOverride]  # Every override in this setting, keyed by their identifiers.
+
+	_resolvedValue = _unresolvedValue  # type: typing.Any  # The value returned by the get method. Cleared whenever the value or the overrides may have changed.
 
 	def __init_subclass__ (cls, **kwargs):
 		super().OnInitializeSubclass()
 
+		cls._overrideIndex = dict()
+		cls._resolvedValue = _unresolvedValue
+
 		if cls.IsSetting:
 			cls.SetDefault()
 			AllSettings.append(cls)
@@ -87,6 +96,9 @@ class Setting(AbstractSettings.SettingAbstract):
 		:return: The setting's value.
 		"""
 
+		if ignoreOverride is False and cls._resolvedValue is not _unresolvedValue:
+			return cls._resolvedValue
+
 		if not isinstance(ignoreOverride, bool):
 			raise Exceptions.IncorrectTypeException(ignoreOverride, "ignoreOverride", (bool,))
 
@@ -94,11 +106,14 @@ class Setting(AbstractSettings.SettingAbstract):
 			return _Get(cls.Key)
 
 		if not cls.IsOverridden():
-			return _Get(cls.Key)
+			value = _Get(cls.Key)  # type: typing.Any
+		else:
+			value = cls._overrides[0].Value
+
+		if isinstance(value, _cacheableValueTypes):
+			cls._resolvedValue = value
 
-		activeOverrideIdentifier = cls.GetActiveOverrideIdentifier()  # type: str
-		activeOverrideValue = cls.GetOverrideValue(activeOverrideIdentifier)  # type: typing.Any
-		return activeOverrideValue
+		return value
 
 	@classmethod
 	def Set (cls, value: typing.Any, autoSave: bool = True, autoUpdate: bool = True) -> None:
@@ -113,6 +128,7 @@ class Setting(AbstractSettings.SettingAbstract):
 		:type autoUpdate: bool
 		"""
 
+		cls._resolvedValue = _unresolvedValue
 		return _Set(cls.Key, value, autoSave = autoSave, autoUpdate = autoUpdate)
 
 	@classmethod
@@ -121,6 +137,7 @@ class Setting(AbstractSettings.SettingAbstract):
 		Reset to the default value.
 		"""
 
+		cls._resolvedValue = _unresolvedValue
 		_Reset(key = cls.Key, autoSave = autoSave, autoUpdate = autoUpdate)
 
 	@classmethod
@@ -176,11 +193,15 @@ class Setting(AbstractSettings.SettingAbstract):
 		if cls._overrides is None:
 			cls._overrides = list()
 
-		if any(testingOverride.Identifier == overrideIdentifier for testingOverride in cls._overrides):
+		if overrideIdentifier in cls._overrideIndex:
 			raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by another override.")
 
-		cls._overrides.append(_SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText))
+		override = _SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText)  # type: _SettingOverride
+
+		cls._overrides.append(override)
 		cls._overrides.sort(key = lambda sortingOverride: sortingOverride.Priority, reverse = True)
+		cls._overrideIndex[overrideIdentifier] = override
+		cls._resolvedValue = _unresolvedValue
 		Update()
 
 	@classmethod
@@ -197,17 +218,16 @@ class Setting(AbstractSettings.SettingAbstract):
 		if not cls.IsSetup():
 			raise Exception("Cannot remove override of the non setup setting '%s'." % cls.Key)
 
-		if cls._overrides is None:
-			return
+		override = cls._overrideIndex.pop(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
 
-		if len(cls._overrides) == 0:
+		if override is None:
 			return
 
-		for overrideIndex in range(len(cls._overrides)):
-			if cls._overrides[overrideIndex].Identifier == overrideIdentifier:
-				cls._overrides.pop(overrideIndex)
-				Update()
-				return
+		if cls._overrides is not None and override in cls._overrides:
+			cls._overrides.remove(override)
+
+		cls._resolvedValue = _unresolvedValue
+		Update()
 
 	@classmethod
 	def ClearAllOverrides (cls) -> None:
@@ -216,6 +236,8 @@ class Setting(AbstractSettings.SettingAbstract):
 		"""
 
 		cls._overrides = None
+		cls._overrideIndex.clear()
+		cls._resolvedValue = _unresolvedValue
 
 	@classmethod
 	def IsOverridden (cls) -> bool:
@@ -240,14 +262,7 @@ class Setting(AbstractSettings.SettingAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if not cls.IsOverridden():
-			return False
-
-		for override in cls._overrides:  # type: _SettingOverride
-			if override.Identifier == overrideIdentifier:
-				return True
-
-		return False
+		return overrideIdentifier in cls._overrideIndex
 
 	@classmethod
 	def GetActiveOverrideIdentifier (cls) -> str:
@@ -268,13 +283,7 @@ class Setting(AbstractSettings.SettingAbstract):
 		Get the identifier of all registered overrides in this setting as a set.
 		"""
 
-		allIdentifiers = set()  # type: typing.Set[str]
-
-		if cls._overrides is not None:
-			for override in cls._overrides:  # type: _SettingOverride
-				allIdentifiers.add(override.Identifier)
-
-		return allIdentifiers
+		return set(cls._overrideIndex.keys())
 
 	@classmethod
 	def GetOverrideValue (cls, overrideIdentifier: str) -> typing.Any:
@@ -289,10 +298,10 @@ class Setting(AbstractSettings.SettingAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if cls._overrides is not None:
-			for override in cls._overrides:  # type: _SettingOverride
-				if override.Identifier == overrideIdentifier:
-					return override.Value
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
+
+		if override is not None:
+			return override.Value
 
 		raise Exception("No override with the identifier '" + overrideIdentifier + "' in the setting '" + cls.Key + "'.")
 
@@ -309,10 +318,10 @@ class Setting(AbstractSettings.SettingAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if cls._overrides is not None:
-			for override in cls._overrides:  # type: _SettingOverride
-				if override.Identifier == overrideIdentifier:
-					return override.Priority
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
+
+		if override is not None:
+			return override.Priority
 
 		raise Exception("No override with the identifier '" + overrideIdentifier + "' in the setting '" + cls.Key + "'.")
 
@@ -329,10 +338,10 @@ class Setting(AbstractSettings.SettingAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if cls._overrides is not None:
-			for override in cls._overrides:  # type: _SettingOverride
-				if override.Identifier == overrideIdentifier:
-					return override.ReasonText
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
+
+		if override is not None:
+			return override.ReasonText
 
 		raise Exception("No override with the identifier '" + overrideIdentifier + "' in the setting '" + cls.Key + "'.")
 
@@ -407,6 +416,14 @@ class _SettingOverride:
 def GetAllSettings () -> typing.List[typing.Type[Setting]]:
 	return list(AllSettings)
 
+def ClearResolvedValues () -> None:
+	"""
+	Forget every cached setting value, the next get calls will resolve their values again.
+	"""
+
+	for setting in AllSettings:  # type: typing.Type[Setting]
+		setting._resolvedValue = _unresolvedValue
+
 def Load () -> None:
 	SettingsPersistence.Load()
 
@@ -510,6 +527,8 @@ def _InvokeOnLoadWrapperEvent () -> Events.EventArguments:
 def _OnUpdateCallback (owner: Persistence.Persistent, eventArguments: Events.EventArguments) -> None:
 	global _previousValues
 
+	ClearResolvedValues()
+
 	allSettings = GetAllSettings()  # type: typing.List[typing.Type[Setting]]
 
 	currentValues = dict()  # type: typing.Dict[str, typing.Any]
@@ -532,6 +551,8 @@ def _OnUpdateCallback (owner: Persistence.Persistent, eventArguments: Events.Eve
 
 # noinspection PyUnusedLocal
 def _OnLoadCallback (owner: Persistence.Persistent, eventArguments: Events.EventArguments) -> None:
+	ClearResolvedValues()
+
 	for setting in AllSettings:  # type: Setting
 		try:
 			# noinspection PyProtectedMember
@@ -66,3 +66,21 @@ class QuickMode(SettingsTypes.BooleanEnabledDisabledDialogSetting):
 
 	ListPath = "Root/Time"  # type: str
 	ListPriority = 25  # type: float
+
+class UpdateBudget(SettingsTypes.RealNumberSetting):
+	IsSetting = True  # type: bool
+
+	Key = "Update_Budget"  # type: str
+	Default = 2  # type: float  # The number of milliseconds that can be spent updating reproductive systems in a single game tick.
+
+	Minimum = 0.25  # type: float
+	Maximum = 1000  # type: float
+
+	@classmethod
+	def Verify (cls, value: float, lastChangeVersion: Version.Version = None) -> float:
+		value = super().Verify(value, lastChangeVersion = lastChangeVersion)
+
+		if not (cls.Minimum <= value <= cls.Maximum):
+			raise ValueError("Value must be greater than '" + str(cls.Minimum) + "' and less than '" + str(cls.Maximum) + "'.")
+
+		return value
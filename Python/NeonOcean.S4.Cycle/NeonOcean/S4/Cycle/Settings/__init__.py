@@ -10,7 +10,7 @@ from NeonOcean.S4.Cycle.Settings.Debug import DebugMode
 from NeonOcean.S4.Cycle.Settings.Menstruation import AllSimsExperiencePMS
 from NeonOcean.S4.Cycle.Settings.LifeSpan import HandleLifeSpan, LifeSpanLongMultiplier, LifeSpanNormalMultiplier, LifeSpanShortMultiplier
 from NeonOcean.S4.Cycle.Settings.Reproduction import EasyFertilization, EnableWoohooChanges, WoohooIsAlwaysSafe
-from NeonOcean.S4.Cycle.Settings.Time import HandlePregnancySpeed, PregnancySpeed, QuickMode, ReproductiveSpeed
+from NeonOcean.S4.Cycle.Settings.Time import HandlePregnancySpeed, PregnancySpeed, QuickMode, ReproductiveSpeed, UpdateBudget
 from NeonOcean.S4.Main.Tools import Events
 
 def GetSettingsFilePath () -> str:
@@ -19,6 +19,9 @@ AllSettings = list()  # type: typing.List[typing.Type[Setting]]
 
 _previousValues = dict()  # type: typing.Dict[str, typing.Dict[str, typing.Any]]
 
+_unresolvedValue = object()
+_cacheableValueTypes = (bool, int, float, str)  # Mutable values, such as dictionaries, will never be cached as the receiver may modify them.
+
 _onUpdateWrapper = Events.EventHandler()  # type: Events.EventHandler
 _onLoadWrapper = Events.EventHandler()  # type: Events.EventHandler
 
@@ -52,10 +55,16 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 
 	_overrides = None  # type: typing.Optional[typing.Dict[str, typing.List[_SettingOverride]]]
 	_universalOverrides = None  # type: typing.Optional[typing.List[_SettingOverride]]
+	_overrideIndex = None  # type: typing.Dict[str, _SettingOverride]  # Every branch and universal override in this setting, keyed by their identifiers.
+
+	_resolvedValues = None  # type: typing.Dict[str, typing.Any]  # The values returned by the get method, keyed by their branches. Cleared whenever a value or override may have changed.
 
 	def __init_subclass__ (cls, **kwargs):
 		super().OnInitializeSubclass()
 
+		cls._overrideIndex = dict()
+		cls._resolvedValues = dict()
+
 		if cls.IsSetting:
 			cls.SetDefault()
 			AllSettings.append(cls)
@@ -106,12 +115,20 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if ignoreOverride:
 			return _Get(simID, cls.Key)
 
+		resolvedValue = cls._resolvedValues.get(simID, _unresolvedValue)  # type: typing.Any
+
+		if resolvedValue is not _unresolvedValue:
+			return resolvedValue
+
 		if not cls.IsOverridden(simID):
-			return _Get(simID, cls.Key)
+			value = _Get(simID, cls.Key)  # type: typing.Any
+		else:
+			value = cls._GetActiveOverride(simID).Value
+
+		if isinstance(value, _cacheableValueTypes):
+			cls._resolvedValues[simID] = value
 
-		activeOverrideIdentifier = cls.GetActiveOverrideIdentifier(simID)  # type: str
-		activeOverrideValue = cls.GetOverrideValue(activeOverrideIdentifier)  # type: typing.Any
-		return activeOverrideValue
+		return value
 
 	@classmethod
 	def GetAllBranches (cls, ignoreOverrides: bool = False) -> typing.Dict[str, typing.Any]:
@@ -169,6 +186,7 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		:type autoUpdate: bool
 		"""
 
+		cls._resolvedValues.clear()
 		return _Set(simID, cls.Key, value, autoSave = autoSave, autoUpdate = autoUpdate)
 
 	@classmethod
@@ -177,6 +195,7 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		Reset to the default value.
 		"""
 
+		cls._resolvedValues.clear()
 		_Reset(simID = simID, key = cls.Key, autoSave = autoSave, autoUpdate = autoUpdate)
 
 	@classmethod
@@ -237,25 +256,22 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if cls._overrides is None:
 			cls._overrides = dict()
 
-		if cls._universalOverrides is not None:
-			if any(universalOverride.Identifier == overrideIdentifier for universalOverride in cls._universalOverrides):
-				raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by a universal override.")
+		cls._VerifyOverrideIdentifierAvailable(overrideIdentifier)
 
-		for testingBranch, testingOverrides in cls._overrides.items():  # type: str, typing.List[_SettingOverride]
-			for testingOverride in testingOverrides:  # type: _SettingOverride
-				if testingOverride.Identifier == overrideIdentifier:
-					raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by a override for the branch '" + testingBranch + "'.")
+		override = _SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText, branch = simID)  # type: _SettingOverride
 
 		if not simID in cls._overrides:
 			branchOverrides = list()  # type: typing.List[_SettingOverride]
 
 			cls._overrides[simID] = branchOverrides
-			branchOverrides.append(_SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText))
+			branchOverrides.append(override)
 		else:
 			branchOverrides = cls._overrides[simID]  # type: typing.List[_SettingOverride]
-			branchOverrides.append(_SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText))
+			branchOverrides.append(override)
 
 		branchOverrides.sort(key = lambda sortingOverride: sortingOverride.Priority, reverse = True)
+		cls._overrideIndex[overrideIdentifier] = override
+		cls._resolvedValues.clear()
 		Update()
 
 	@classmethod
@@ -298,17 +314,14 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if cls._universalOverrides is None:
 			cls._universalOverrides = list()
 
-		if any(universalOverride.Identifier == overrideIdentifier for universalOverride in cls._universalOverrides):
-			raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by a universal override.")
+		cls._VerifyOverrideIdentifierAvailable(overrideIdentifier)
 
-		if cls._overrides is not None:
-			for testingBranch, testingOverrides in cls._overrides.items():  # type: str, typing.List[_SettingOverride]
-				for testingOverride in testingOverrides:  # type: _SettingOverride
-					if testingOverride.Identifier == overrideIdentifier:
-						raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by a override for the branch '" + testingBranch + "'.")
+		override = _SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText)  # type: _SettingOverride
 
-		cls._universalOverrides.append(_SettingOverride(value, overrideIdentifier, overridePriority, overrideReasonText))
+		cls._universalOverrides.append(override)
 		cls._universalOverrides.sort(key = lambda sortingOverride: sortingOverride.Priority, reverse = True)
+		cls._overrideIndex[overrideIdentifier] = override
+		cls._resolvedValues.clear()
 		Update()
 
 	@classmethod
@@ -325,24 +338,22 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if not cls.IsSetup():
 			raise Exception("Cannot remove override of the non setup setting '%s'." % cls.Key)
 
-		if cls._overrides is not None:
-			for testingBranch, testingBranchOverrides in cls._overrides.items():  # type: str, typing.List[_SettingOverride]
-				for testingBranchOverrideIndex in range(len(testingBranchOverrides)):  # type: int
-					testingBranchOverride = testingBranchOverrides[testingBranchOverrideIndex]  # type: _SettingOverride
+		override = cls._overrideIndex.pop(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
+
+		if override is None:
+			return
 
-					if testingBranchOverride.Identifier == overrideIdentifier:
-						testingBranchOverrides.pop(testingBranchOverrideIndex)
-						Update()
-						return
+		if override.Branch is not None:
+			branchOverrides = cls._overrides.get(override.Branch, None) if cls._overrides is not None else None  # type: typing.Optional[typing.List[_SettingOverride]]
 
-		if cls._universalOverrides is not None:
-			for testingUniversalOverrideIndex in range(len(cls._universalOverrides)):  # type: int
-				testingUniversalOverride = cls._universalOverrides[testingUniversalOverrideIndex]  # type: _SettingOverride
+			if branchOverrides is not None and override in branchOverrides:
+				branchOverrides.remove(override)
+		else:
+			if cls._universalOverrides is not None and override in cls._universalOverrides:
+				cls._universalOverrides.remove(override)
 
-				if testingUniversalOverride.Identifier == overrideIdentifier:
-					cls._universalOverrides.pop(testingUniversalOverrideIndex)
-					Update()
-					return
+		cls._resolvedValues.clear()
+		Update()
 
 	@classmethod
 	def ClearAllOverrides (cls) -> None:
@@ -352,6 +363,8 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 
 		cls._overrides = None
 		cls._universalOverrides = None
+		cls._overrideIndex.clear()
+		cls._resolvedValues.clear()
 
 	@classmethod
 	def IsOverridden (cls, simID: str) -> bool:
@@ -385,18 +398,12 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if not cls.IsOverridden(simID):
 			return False
 
-		if cls._overrides is not None:
-			for branchOverrides in cls._overrides.values():  # type: typing.List[_SettingOverride]
-				for branchOverride in branchOverrides:  # type: _SettingOverride
-					if branchOverride.Identifier == overrideIdentifier:
-						return True
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
 
-		if cls._universalOverrides is not None:
-			for universalOverride in cls._universalOverrides:
-				if universalOverride.Identifier == overrideIdentifier:
-					return True
+		if override is None:
+			return False
 
-		return False
+		return override.Branch is None or override.Branch == simID
 
 	@classmethod
 	def GetActiveOverrideIdentifier (cls, simID: str) -> str:
@@ -411,6 +418,10 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if not isinstance(simID, str):
 			raise Exceptions.IncorrectTypeException(simID, "simID", (str,))
 
+		return cls._GetActiveOverride(simID).Identifier
+
+	@classmethod
+	def _GetActiveOverride (cls, simID: str) -> _SettingOverride:
 		if not cls.IsOverridden(simID):
 			raise Exception("No overrides exist for the setting '" + cls.Key + "' and branch '" + simID + "'.")
 
@@ -430,14 +441,26 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 			raise Exception("The 'IsOverride' method signaled true but we failed to find a valid override.")
 
 		if branchOverrideCandidate is None:
-			return universalOverrideCandidate.Identifier
+			return universalOverrideCandidate
 		elif universalOverrideCandidate is None:
-			return branchOverrideCandidate.Identifier
+			return branchOverrideCandidate
 
 		if branchOverrideCandidate.Priority >= universalOverrideCandidate.Priority:
-			return branchOverrideCandidate.Identifier
+			return branchOverrideCandidate
+		else:
+			return universalOverrideCandidate
+
+	@classmethod
+	def _VerifyOverrideIdentifierAvailable (cls, overrideIdentifier: str) -> None:
+		takenOverride = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
+
+		if takenOverride is None:
+			return
+
+		if takenOverride.Branch is None:
+			raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by a universal override.")
 		else:
-			return universalOverrideCandidate.Identifier
+			raise Exception("The identifier '" + overrideIdentifier + "' has already been taken by a override for the branch '" + takenOverride.Branch + "'.")
 
 	@classmethod
 	def GetAllOverrideIdentifiers (cls) -> typing.Set[str]:
@@ -445,18 +468,7 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		Get the identifier of all registered overrides in this setting as a set.
 		"""
 
-		allIdentifiers = set()  # type: typing.Set[str]
-
-		if cls._overrides is not None:
-			for branchOverrides in cls._overrides.values():  # type: typing.List[_SettingOverride]
-				for branchOverride in branchOverrides:  # type: _SettingOverride
-					allIdentifiers.add(branchOverride.Identifier)
-
-		if cls._universalOverrides is not None:
-			for universalOverride in cls._universalOverrides:  # type: _SettingOverride
-				allIdentifiers.add(universalOverride.Identifier)
-
-		return allIdentifiers
+		return set(cls._overrideIndex.keys())
 
 	@classmethod
 	def GetOverrideValue (cls, overrideIdentifier: str) -> typing.Any:
@@ -471,16 +483,10 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if cls._overrides is not None:
-			for branchOverrides in cls._overrides.values():  # type: typing.List[_SettingOverride]
-				for branchOverride in branchOverrides:  # type: _SettingOverride
-					if branchOverride.Identifier == overrideIdentifier:
-						return branchOverride.Value
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
 
-		if cls._universalOverrides is not None:
-			for universalOverride in cls._universalOverrides:
-				if universalOverride.Identifier == overrideIdentifier:
-					return universalOverride.Value
+		if override is not None:
+			return override.Value
 
 		raise Exception("No override with the identifier '" + overrideIdentifier + "' in the setting '" + cls.Key + "'.")
 
@@ -497,16 +503,10 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if cls._overrides is not None:
-			for branchOverrides in cls._overrides.values():  # type: typing.List[_SettingOverride]
-				for branchOverride in branchOverrides:  # type: _SettingOverride
-					if branchOverride.Identifier == overrideIdentifier:
-						return branchOverride.Priority
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
 
-		if cls._universalOverrides is not None:
-			for universalOverride in cls._universalOverrides:
-				if universalOverride.Identifier == overrideIdentifier:
-					return universalOverride.Priority
+		if override is not None:
+			return override.Priority
 
 		raise Exception("No override with the identifier '" + overrideIdentifier + "' in the setting '" + cls.Key + "'.")
 
@@ -523,16 +523,10 @@ class Setting(AbstractSettings.SettingBranchedAbstract):
 		if not isinstance(overrideIdentifier, str):
 			raise Exceptions.IncorrectTypeException(overrideIdentifier, "overrideIdentifier", (str,))
 
-		if cls._overrides is not None:
-			for branchOverrides in cls._overrides.values():  # type: typing.List[_SettingOverride]
-				for branchOverride in branchOverrides:  # type: _SettingOverride
-					if branchOverride.Identifier == overrideIdentifier:
-						return branchOverride.ReasonText
+		override = cls._overrideIndex.get(overrideIdentifier, None)  # type: typing.Optional[_SettingOverride]
 
-		if cls._universalOverrides is not None:
-			for universalOverride in cls._universalOverrides:
-				if universalOverride.Identifier == overrideIdentifier:
-					return universalOverride.ReasonText
+		if override is not None:
+			return override.ReasonText
 
 		raise Exception("No override with the identifier '" + overrideIdentifier + "' in the setting '" + cls.Key + "'.")
 
@@ -607,11 +601,13 @@ class _SettingOverride:
 				  value: typing.Any,
 				  identifier: str,
 				  priority: typing.Union[float, int],
-				  reasonText: typing.Optional[typing.Callable[[], localization.LocalizedString]] = None):
+				  reasonText: typing.Optional[typing.Callable[[], localization.LocalizedString]] = None,
+				  branch: typing.Optional[str] = None):
 
 		self.Value = value  # type: typing.Any
 		self.Identifier = identifier  # type: str
 		self.Priority = priority  # type: typing.Union[float, int]
+		self.Branch = branch  # type: typing.Optional[str]  # The branch this override is imposed on, or None if it is universal.
 
 		if reasonText is not None:
 			self.ReasonText = reasonText  # type: typing.Callable[[], localization.LocalizedString]
@@ -621,6 +617,15 @@ class _SettingOverride:
 def GetAllSettings () -> typing.List[typing.Type[Setting]]:
 	return list(AllSettings)
 
+def ClearResolvedValues () -> None:
+	"""
+	Forget every cached setting value, the next get calls will resolve their values again.
+	"""
+
+	for setting in AllSettings:  # type: typing.Type[Setting]
+		# noinspection PyProtectedMember
+		setting._resolvedValues.clear()
+
 def Update () -> None:
 	SettingsPersistence.Update()
 
@@ -715,6 +720,8 @@ def _InvokeOnLoadWrapperEvent () -> Events.EventArguments:
 def _OnUpdateCallback (owner: Persistence.Persistent, eventArguments: Events.EventArguments) -> None:
 	global _previousValues
 
+	ClearResolvedValues()
+
 	allSettings = GetAllSettings()  # type: typing.List[typing.Type[Setting]]
 
 	currentValues = dict()  # type: typing.Dict[str, typing.Dict[str, typing.Any]]
@@ -755,6 +762,8 @@ def _OnUpdateCallback (owner: Persistence.Persistent, eventArguments: Events.Eve
 
 # noinspection PyUnusedLocal
 def _OnLoadCallback (owner: Persistence.Persistent, eventArguments: Events.EventArguments) -> None:
+	ClearResolvedValues()
+
 	for setting in AllSettings:  # type: Setting
 		try:
 			# noinspection PyProtectedMember
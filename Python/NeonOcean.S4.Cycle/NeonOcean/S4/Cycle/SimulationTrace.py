@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import typing
+
+from NeonOcean.S4.Cycle import ReproductionShared, This
+from NeonOcean.S4.Main.Tools import Exceptions, Types
+from sims import sim_info
+
+TracesDirectoryPath = os.path.join(This.Mod.PersistentPath, "Simulation Traces")  # type: str
+
+_traceSignature = b"CYTR"  # type: bytes
+_traceFormatVersion = 1  # type: int
+
+_phaseNameRecordType = 1  # type: int
+_simulationRecordType = 2  # type: int
+_stepRecordType = 3  # type: int
+
+_headerStruct = struct.Struct("<4sHI")  # The signature, the format version, and the length of the snapshot that follows.
+_recordTypeStruct = struct.Struct("<B")
+_phaseNameStruct = struct.Struct("<HH")  # The phase name's index, and the length of the name that follows.
+_simulationStruct = struct.Struct("<q")  # The number of ticks being simulated.
+_stepStruct = struct.Struct("<qqqIH")  # The step's starting tick, the step's length, the current seed, the unique seeds generated so far, and the number of phases run.
+_stepPhaseStruct = struct.Struct("<Hd")  # The phase name's index, and the time it took to run the phase.
+_stepPointCountStruct = struct.Struct("<H")
+_stepPointStruct = struct.Struct("<q")
+
+class TraceStep:
+	def __init__ (self, startTick: int, tickStep: int, currentSeed: int):
+		"""
+		A single tick step of a simulation, as seen by a trace recorder.
+		:param startTick: The number of ticks already completed in the simulation when this step started.
+		:type startTick: int
+		:param tickStep: The number of ticks simulated in this step.
+		:type tickStep: int
+		:param currentSeed: The simulating system's current seed at the start of the step.
+		:type currentSeed: int
+		"""
+
+		self.StartTick = startTick  # type: int
+		self.TickStep = tickStep  # type: int
+		self.CurrentSeed = currentSeed  # type: int
+		self.UniqueSeedsGenerated = 0  # type: int
+
+		self.PhaseNames = list()  # type: typing.List[str]
+		self.PhaseTimes = list()  # type: typing.List[float]
+
+		self.SchedulePoints = list()  # type: typing.List[int]
+
+	def Matches (self, other: TraceStep) -> bool:
+		"""
+		Whether or not this step did the same thing as the other step. The time taken to run each phase is not compared.
+		"""
+
+		return self.StartTick == other.StartTick and \
+			   self.TickStep == other.TickStep and \
+			   self.CurrentSeed == other.CurrentSeed and \
+			   self.UniqueSeedsGenerated == other.UniqueSeedsGenerated and \
+			   self.PhaseNames == other.PhaseNames and \
+			   self.SchedulePoints == other.SchedulePoints
+
+class TraceSimulation:
+	def __init__ (self, ticks: int):
+		"""
+		A recording of one simulation of a reproductive system.
+		:param ticks: The number of ticks the simulation was asked to simulate.
+		:type ticks: int
+		"""
+
+		self.Ticks = ticks  # type: int
+		self.Steps = list()  # type: typing.List[TraceStep]
+
+class SimulationTrace:
+	def __init__ (self, snapshot: typing.Optional[dict] = None):
+		"""
+		A recording of every simulation a reproductive system ran through.
+		:param snapshot: The saved data of the reproductive system from just before the first recorded simulation. A trace can only be replayed
+		if it has a snapshot.
+		:type snapshot: typing.Optional[dict]
+		"""
+
+		if not isinstance(snapshot, dict) and snapshot is not None:
+			raise Exceptions.IncorrectTypeException(snapshot, "snapshot", (dict, None))
+
+		self.Snapshot = snapshot  # type: typing.Optional[dict]
+		self.Simulations = list()  # type: typing.List[TraceSimulation]
+
+	def ToBytes (self) -> bytes:
+		"""
+		Get this trace in its binary form. Phase names are written once and then referred to by index.
+		"""
+
+		snapshotBytes = json.dumps(self.Snapshot, separators = (",", ":")).encode("utf-8") if self.Snapshot is not None else b""  # type: bytes
+
+		traceParts = [_headerStruct.pack(_traceSignature, _traceFormatVersion, len(snapshotBytes)), snapshotBytes]  # type: typing.List[bytes]
+		phaseNameIndices = dict()  # type: typing.Dict[str, int]
+
+		for simulation in self.Simulations:  # type: TraceSimulation
+			traceParts.append(_recordTypeStruct.pack(_simulationRecordType))
+			traceParts.append(_simulationStruct.pack(simulation.Ticks))
+
+			for step in simulation.Steps:  # type: TraceStep
+				for phaseName in step.PhaseNames:  # type: str
+					if phaseName in phaseNameIndices:
+						continue
+
+					phaseNameIndex = len(phaseNameIndices)  # type: int
+					phaseNameIndices[phaseName] = phaseNameIndex
+					phaseNameBytes = phaseName.encode("utf-8")  # type: bytes
+
+					traceParts.append(_recordTypeStruct.pack(_phaseNameRecordType))
+					traceParts.append(_phaseNameStruct.pack(phaseNameIndex, len(phaseNameBytes)))
+					traceParts.append(phaseNameBytes)
+
+				traceParts.append(_recordTypeStruct.pack(_stepRecordType))
+				traceParts.append(_stepStruct.pack(step.StartTick, step.TickStep, step.CurrentSeed, step.UniqueSeedsGenerated, len(step.PhaseNames)))
+
+				for phaseName, phaseTime in zip(step.PhaseNames, step.PhaseTimes):  # type: str, float
+					traceParts.append(_stepPhaseStruct.pack(phaseNameIndices[phaseName], phaseTime))
+
+				traceParts.append(_stepPointCountStruct.pack(len(step.SchedulePoints)))
+
+				for schedulePoint in step.SchedulePoints:  # type: int
+					traceParts.append(_stepPointStruct.pack(schedulePoint))
+
+		return b"".join(traceParts)
+
+	@classmethod
+	def FromBytes (cls, traceBytes: bytes) -> SimulationTrace:
+		"""
+		Read a trace from its binary form.
+		"""
+
+		if not isinstance(traceBytes, bytes):
+			raise Exceptions.IncorrectTypeException(traceBytes, "traceBytes", (bytes,))
+
+		signature, formatVersion, snapshotLength = _headerStruct.unpack_from(traceBytes, 0)  # type: bytes, int, int
+
+		if signature != _traceSignature:
+			raise ValueError("The data is not a simulation trace.")
+
+		if formatVersion != _traceFormatVersion:
+			raise ValueError("Cannot read simulation trace format version %s, only version %s is supported." % (formatVersion, _traceFormatVersion))
+
+		offset = _headerStruct.size  # type: int
+		snapshot = json.loads(traceBytes[offset: offset + snapshotLength].decode("utf-8")) if snapshotLength != 0 else None  # type: typing.Optional[dict]
+		offset += snapshotLength
+
+		trace = cls(snapshot = snapshot)  # type: SimulationTrace
+		phaseNames = dict()  # type: typing.Dict[int, str]
+		simulation = None  # type: typing.Optional[TraceSimulation]
+
+		while offset < len(traceBytes):
+			recordType = _recordTypeStruct.unpack_from(traceBytes, offset)[0]  # type: int
+			offset += _recordTypeStruct.size
+
+			if recordType == _phaseNameRecordType:
+				phaseNameIndex, phaseNameLength = _phaseNameStruct.unpack_from(traceBytes, offset)  # type: int, int
+				offset += _phaseNameStruct.size
+
+				phaseNames[phaseNameIndex] = traceBytes[offset: offset + phaseNameLength].decode("utf-8")
+				offset += phaseNameLength
+			elif recordType == _simulationRecordType:
+				simulation = TraceSimulation(_simulationStruct.unpack_from(traceBytes, offset)[0])
+				offset += _simulationStruct.size
+
+				trace.Simulations.append(simulation)
+			elif recordType == _stepRecordType:
+				if simulation is None:
+					raise ValueError("Found a simulation trace step before any simulation.")
+
+				startTick, tickStep, currentSeed, uniqueSeedsGenerated, phaseCount = _stepStruct.unpack_from(traceBytes, offset)  # type: int, int, int, int, int
+				offset += _stepStruct.size
+
+				step = TraceStep(startTick, tickStep, currentSeed)  # type: TraceStep
+				step.UniqueSeedsGenerated = uniqueSeedsGenerated
+
+				for _ in range(phaseCount):
+					phaseNameIndex, phaseTime = _stepPhaseStruct.unpack_from(traceBytes, offset)  # type: int, float
+					offset += _stepPhaseStruct.size
+
+					step.PhaseNames.append(phaseNames[phaseNameIndex])
+					step.PhaseTimes.append(phaseTime)
+
+				pointCount = _stepPointCountStruct.unpack_from(traceBytes, offset)[0]  # type: int
+				offset += _stepPointCountStruct.size
+
+				for _ in range(pointCount):
+					step.SchedulePoints.append(_stepPointStruct.unpack_from(traceBytes, offset)[0])
+					offset += _stepPointStruct.size
+
+				simulation.Steps.append(step)
+			else:
+				raise ValueError("Unknown simulation trace record type %s." % recordType)
+
+		return trace
+
+	def Save (self, filePath: str) -> None:
+		if not isinstance(filePath, str):
+			raise Exceptions.IncorrectTypeException(filePath, "filePath", (str,))
+
+		fileDirectoryPath = os.path.dirname(filePath)  # type: str
+
+		if fileDirectoryPath and not os.path.exists(fileDirectoryPath):
+			os.makedirs(fileDirectoryPath)
+
+		with open(filePath, "wb") as traceFile:
+			traceFile.write(self.ToBytes())
+
+	@classmethod
+	def Load (cls, filePath: str) -> SimulationTrace:
+		if not isinstance(filePath, str):
+			raise Exceptions.IncorrectTypeException(filePath, "filePath", (str,))
+
+		with open(filePath, "rb") as traceFile:
+			return cls.FromBytes(traceFile.read())
+
+class TraceRecorder:
+	def __init__ (self, trace: SimulationTrace):
+		"""
+		Adds every simulation step of the reproductive system it is attached to onto a trace.
+		:param trace: The trace to be added to.
+		:type trace: SimulationTrace
+		"""
+
+		if not isinstance(trace, SimulationTrace):
+			raise Exceptions.IncorrectTypeException(trace, "trace", (SimulationTrace,))
+
+		self.Trace = trace  # type: SimulationTrace
+
+		self._currentStep = None  # type: typing.Optional[TraceStep]
+
+	def StartSimulation (self, simulation: ReproductionShared.Simulation) -> None:
+		self.Trace.Simulations.append(TraceSimulation(simulation.Ticks))
+
+	def StartStep (self, simulation: ReproductionShared.Simulation, tickStep: int) -> None:
+		if len(self.Trace.Simulations) == 0:
+			self.StartSimulation(simulation)
+
+		self._currentStep = TraceStep(simulation.CompletedTicks, tickStep, simulation.SimulatingSystem.CurrentSeed)
+
+	def RecordPhase (self, phase: ReproductionShared.SimulationPhase, phaseTime: float) -> None:
+		if self._currentStep is None:
+			return
+
+		self._currentStep.PhaseNames.append(Types.GetFullName(phase.Phase))
+		self._currentStep.PhaseTimes.append(phaseTime)
+
+	def EndStep (self, simulation: ReproductionShared.Simulation) -> None:
+		if self._currentStep is None:
+			return
+
+		self._currentStep.UniqueSeedsGenerated = simulation.SimulatingSystem.UniqueSeedsGenerated
+		self._currentStep.SchedulePoints = simulation.Schedule.Points
+
+		self.Trace.Simulations[-1].Steps.append(self._currentStep)
+		self._currentStep = None
+
+class TraceDifference:
+	def __init__ (self):
+		"""
+		The differences found between an expected and an actual simulation trace.
+		"""
+
+		self.FirstDivergence = None  # type: typing.Optional[str]
+		self.PhaseTimes = dict()  # type: typing.Dict[str, typing.Tuple[float, float]]  # The total time each phase took in the expected and actual traces.
+
+	@property
+	def Diverged (self) -> bool:
+		return self.FirstDivergence is not None
+
+def StartRecording (reproductiveSystem: ReproductionShared.ReproductiveSystem) -> TraceRecorder:
+	"""
+	Start recording the simulations of this reproductive system. The system will be updated and a snapshot of it taken before recording starts.
+	"""
+
+	if not isinstance(reproductiveSystem, ReproductionShared.ReproductiveSystem):
+		raise Exceptions.IncorrectTypeException(reproductiveSystem, "reproductiveSystem", (ReproductionShared.ReproductiveSystem,))
+
+	if reproductiveSystem.ShouldUpdate:
+		reproductiveSystem.Update()
+
+	saveSuccessful, snapshot = reproductiveSystem.SaveToDictionary()  # type: bool, dict
+
+	if not saveSuccessful:
+		raise Exception("Failed to take a snapshot of the reproductive system.")
+
+	traceRecorder = TraceRecorder(SimulationTrace(snapshot = snapshot))  # type: TraceRecorder
+	reproductiveSystem.SimulationTraceRecorder = traceRecorder
+
+	return traceRecorder
+
+def StopRecording (reproductiveSystem: ReproductionShared.ReproductiveSystem) -> typing.Optional[SimulationTrace]:
+	"""
+	Stop recording the simulations of this reproductive system. This will return None if the system was not being recorded.
+	"""
+
+	if not isinstance(reproductiveSystem, ReproductionShared.ReproductiveSystem):
+		raise Exceptions.IncorrectTypeException(reproductiveSystem, "reproductiveSystem", (ReproductionShared.ReproductiveSystem,))
+
+	traceRecorder = reproductiveSystem.SimulationTraceRecorder  # type: typing.Optional[TraceRecorder]
+
+	if traceRecorder is None:
+		return None
+
+	if reproductiveSystem.ShouldUpdate:
+		reproductiveSystem.Update()
+
+	reproductiveSystem.SimulationTraceRecorder = None
+	return traceRecorder.Trace
+
+def ReplayTrace (trace: SimulationTrace, simInfo: sim_info.SimInfo) -> SimulationTrace:
+	"""
+	Run the recorded simulations again on a new reproductive system created from the trace's snapshot, recording them to a new trace. The new system is
+	never registered and is created in replay mode, so its trackers will not add buffs, change the sim's Dot app information, apply pregnancy visuals or
+	start a game pregnancy. The sim's other state, such as whether they are instanced or pregnant, is read as it is now, so a replay will only match the
+	recording while that state is the same as when it was recorded. Only the steps of each simulation are compared by 'DiffTraces': their ticks, seeds,
+	phases and schedule points.
+	:param trace: The trace to replay, this must have a snapshot.
+	:type trace: SimulationTrace
+	:param simInfo: The sim the trace was recorded from.
+	:type simInfo: sim_info.SimInfo
+	"""
+
+	if not isinstance(trace, SimulationTrace):
+		raise Exceptions.IncorrectTypeException(trace, "trace", (SimulationTrace,))
+
+	if not isinstance(simInfo, sim_info.SimInfo):
+		raise Exceptions.IncorrectTypeException(simInfo, "simInfo", (sim_info.SimInfo,))
+
+	if trace.Snapshot is None:
+		raise ValueError("Cannot replay a simulation trace without a snapshot.")
+
+	replayingSystem = ReproductionShared.ReproductiveSystem(simInfo, replaying = True)  # type: ReproductionShared.ReproductiveSystem
+
+	if not replayingSystem.LoadFromDictionary(trace.Snapshot):
+		raise Exception("Failed to load the simulation trace's snapshot.")
+
+	replayTrace = SimulationTrace(snapshot = trace.Snapshot)  # type: SimulationTrace
+	replayingSystem.SimulationTraceRecorder = TraceRecorder(replayTrace)
+
+	for simulation in trace.Simulations:  # type: TraceSimulation
+		replayingSystem.Simulate(simulation.Ticks)
+
+	replayingSystem.SimulationTraceRecorder = None
+	return replayTrace
+
+def DiffTraces (expectedTrace: SimulationTrace, actualTrace: SimulationTrace) -> TraceDifference:
+	"""
+	Find the first point the actual trace stopped doing what the expected trace did, and compare the time taken by each phase in both traces.
+	"""
+
+	if not isinstance(expectedTrace, SimulationTrace):
+		raise Exceptions.IncorrectTypeException(expectedTrace, "expectedTrace", (SimulationTrace,))
+
+	if not isinstance(actualTrace, SimulationTrace):
+		raise Exceptions.IncorrectTypeException(actualTrace, "actualTrace", (SimulationTrace,))
+
+	traceDifference = TraceDifference()  # type: TraceDifference
+
+	for simulationIndex in range(max(len(expectedTrace.Simulations), len(actualTrace.Simulations))):  # type: int
+		if simulationIndex >= len(expectedTrace.Simulations) or simulationIndex >= len(actualTrace.Simulations):
+			traceDifference.FirstDivergence = "Simulation %s: the traces contain %s and %s simulations." % (simulationIndex, len(expectedTrace.Simulations), len(actualTrace.Simulations))
+			break
+
+		expectedSimulation = expectedTrace.Simulations[simulationIndex]  # type: TraceSimulation
+		actualSimulation = actualTrace.Simulations[simulationIndex]  # type: TraceSimulation
+
+		if expectedSimulation.Ticks != actualSimulation.Ticks:
+			traceDifference.FirstDivergence = "Simulation %s: expected %s ticks, got %s." % (simulationIndex, expectedSimulation.Ticks, actualSimulation.Ticks)
+			break
+
+		for stepIndex in range(max(len(expectedSimulation.Steps), len(actualSimulation.Steps))):  # type: int
+			if stepIndex >= len(expectedSimulation.Steps) or stepIndex >= len(actualSimulation.Steps):
+				traceDifference.FirstDivergence = "Simulation %s, step %s: the simulations contain %s and %s steps." % (simulationIndex, stepIndex, len(expectedSimulation.Steps), len(actualSimulation.Steps))
+				break
+
+			expectedStep = expectedSimulation.Steps[stepIndex]  # type: TraceStep
+			actualStep = actualSimulation.Steps[stepIndex]  # type: TraceStep
+
+			if not expectedStep.Matches(actualStep):
+				traceDifference.FirstDivergence = "Simulation %s, step %s: expected %s, got %s." % (simulationIndex, stepIndex, _GetStepText(expectedStep), _GetStepText(actualStep))
+				break
+
+		if traceDifference.Diverged:
+			break
+
+	expectedPhaseTimes = _GetPhaseTimes(expectedTrace)  # type: typing.Dict[str, float]
+	actualPhaseTimes = _GetPhaseTimes(actualTrace)  # type: typing.Dict[str, float]
+
+	for phaseName in sorted(set(expectedPhaseTimes.keys()) | set(actualPhaseTimes.keys())):  # type: str
+		traceDifference.PhaseTimes[phaseName] = (expectedPhaseTimes.get(phaseName, 0.0), actualPhaseTimes.get(phaseName, 0.0))
+
+	return traceDifference
+
+def GetTraceDifferenceText (traceDifference: TraceDifference) -> str:
+	if not isinstance(traceDifference, TraceDifference):
+		raise Exceptions.IncorrectTypeException(traceDifference, "traceDifference", (TraceDifference,))
+
+	if traceDifference.Diverged:
+		differenceLines = ["First divergence: " + traceDifference.FirstDivergence]  # type: typing.List[str]
+	else:
+		differenceLines = ["The traces match."]  # type: typing.List[str]
+
+	differenceLines.append("Expected [us] | Actual [us] | Phase")
+
+	for phaseName, (expectedPhaseTime, actualPhaseTime) in traceDifference.PhaseTimes.items():  # type: str, typing.Tuple[float, float]
+		differenceLines.append("%13d | %11d | %s" % (expectedPhaseTime * 1000000, actualPhaseTime * 1000000, phaseName))
+
+	return "\n".join(differenceLines)
+
+def GetTraceFilePath (traceName: str) -> str:
+	"""
+	Get the path of the trace with this name in the mod's trace directory.
+	"""
+
+	if not isinstance(traceName, str):
+		raise Exceptions.IncorrectTypeException(traceName, "traceName", (str,))
+
+	if not traceName.endswith(".trace"):
+		traceName += ".trace"
+
+	return os.path.join(TracesDirectoryPath, os.path.basename(traceName))
+
+def _GetStepText (step: TraceStep) -> str:
+	return "ticks %s to %s, seed %s, %s unique seeds, %s phases, schedule %s" % (step.StartTick, step.StartTick + step.TickStep, step.CurrentSeed, step.UniqueSeedsGenerated, len(step.PhaseNames), step.SchedulePoints)
+
+def _GetPhaseTimes (trace: SimulationTrace) -> typing.Dict[str, float]:
+	phaseTimes = dict()  # type: typing.Dict[str, float]
+
+	for simulation in trace.Simulations:  # type: TraceSimulation
+		for step in simulation.Steps:  # type: TraceStep
+			for phaseName, phaseTime in zip(step.PhaseNames, step.PhaseTimes):  # type: str, float
+				phaseTimes[phaseName] = phaseTimes.get(phaseName, 0.0) + phaseTime
+
+	return phaseTimes
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import sys
+import time
+import typing
+from importlib import abc
+
+# This module is started before any other part of the mod is imported, it should not import anything outside of the standard library.
+
+_profilingFinder = None  # type: typing.Optional[_ProfilingFinder]
+
+_importTimes = list()  # type: typing.List[ImportTime]
+_importStack = list()  # type: typing.List[typing.List]  # The name, the time spent importing children, and the start time of each module currently being imported.
+
+class ImportTime:
+	def __init__ (self, moduleName: str, totalTime: float, selfTime: float):
+		"""
+		The time it took to import a module, in seconds.
+		:param moduleName: The name of the imported module.
+		:type moduleName: str
+		:param totalTime: The time spent importing the module, including the modules it imported.
+		:type totalTime: float
+		:param selfTime: The time spent importing the module, excluding the modules it imported.
+		:type selfTime: float
+		"""
+
+		self.ModuleName = moduleName  # type: str
+		self.TotalTime = totalTime  # type: float
+		self.SelfTime = selfTime  # type: float
+
+class _ProfilingFinder(abc.MetaPathFinder):
+	def __init__ (self, namespace: str):
+		self.Namespace = namespace  # type: str
+
+	def find_spec (self, fullname: str, path, target = None):
+		if fullname != self.Namespace and not fullname.startswith(self.Namespace + "."):
+			return None
+
+		for finder in sys.meta_path:
+			if finder is self:
+				continue
+
+			finderFindSpec = getattr(finder, "find_spec", None)  # type: typing.Optional[typing.Callable]
+
+			if finderFindSpec is None:
+				continue
+
+			moduleSpec = finderFindSpec(fullname, path, target)
+
+			if moduleSpec is None:
+				continue
+
+			if moduleSpec.loader is not None:
+				if hasattr(moduleSpec.loader, "exec_module"):
+					moduleSpec.loader = _ProfilingLoader(moduleSpec.loader)
+				elif hasattr(moduleSpec.loader, "load_module"):
+					moduleSpec.loader = _LegacyProfilingLoader(moduleSpec.loader)
+
+			return moduleSpec
+
+		return None
+
+class _ProfilingLoaderBase:
+	def __init__ (self, loader):
+		self.Loader = loader
+
+	def __getattr__ (self, name: str):
+		# Anything other than the loading methods, such as 'get_source' or 'is_package', goes straight to the real loader.
+		return getattr(self.Loader, name)
+
+class _ProfilingLoader(_ProfilingLoaderBase):
+	def create_module (self, spec):
+		return self.Loader.create_module(spec)
+
+	def exec_module (self, module) -> None:
+		_StartTiming(module.__name__)
+
+		try:
+			self.Loader.exec_module(module)
+		finally:
+			_StopTiming()
+
+class _LegacyProfilingLoader(_ProfilingLoaderBase):
+	def load_module (self, fullname: str):
+		_StartTiming(fullname)
+
+		try:
+			return self.Loader.load_module(fullname)
+		finally:
+			_StopTiming()
+
+def StartImportProfiling (namespace: str) -> None:
+	"""
+	Start recording the time it takes to import each module in this namespace. Nothing will happen if the profiler has already been started.
+	"""
+
+	global _profilingFinder
+
+	if _profilingFinder is not None:
+		return
+
+	_profilingFinder = _ProfilingFinder(namespace)
+	sys.meta_path.insert(0, _profilingFinder)
+
+def StopImportProfiling () -> None:
+	"""
+	Stop recording import times, the times already recorded will be kept.
+	"""
+
+	global _profilingFinder
+
+	if _profilingFinder is None:
+		return
+
+	if _profilingFinder in sys.meta_path:
+		sys.meta_path.remove(_profilingFinder)
+
+	_profilingFinder = None
+
+def IsProfiling () -> bool:
+	return _profilingFinder is not None
+
+def GetImportTimes () -> typing.List[ImportTime]:
+	"""
+	Get the recorded import times, in the order the modules finished importing.
+	"""
+
+	return list(_importTimes)
+
+def GetImportTimesText (maximumModules: typing.Optional[int] = None) -> str:
+	"""
+	Get a table of the recorded import times in microseconds, slowest modules first.
+	:param maximumModules: The maximum number of modules to include, every module will be included if this is None.
+	:type maximumModules: typing.Optional[int]
+	"""
+
+	importTimes = sorted(_importTimes, key = lambda importTime: importTime.SelfTime, reverse = True)  # type: typing.List[ImportTime]
+
+	if maximumModules is not None:
+		importTimes = importTimes[:maximumModules]
+
+	importTimesLines = ["Self [us] | Total [us] | Module"]  # type: typing.List[str]
+	totalSelfTime = 0  # type: float
+
+	for importTime in _importTimes:  # type: ImportTime
+		totalSelfTime += importTime.SelfTime
+
+	for importTime in importTimes:  # type: ImportTime
+		importTimesLines.append("%9d | %10d | %s" % (importTime.SelfTime * 1000000, importTime.TotalTime * 1000000, importTime.ModuleName))
+
+	importTimesLines.append("%s modules imported in %d us." % (len(_importTimes), totalSelfTime * 1000000))
+
+	return "\n".join(importTimesLines)
+
+def _StartTiming (moduleName: str) -> None:
+	_importStack.append([moduleName, 0.0, time.perf_counter()])
+
+def _StopTiming () -> None:
+	moduleName, childrenTime, startTime = _importStack.pop()  # type: str, float, float
+	totalTime = time.perf_counter() - startTime  # type: float
+
+	if len(_importStack) != 0:
+		_importStack[-1][1] += totalTime
+
+	_importTimes.append(ImportTime(moduleName, totalTime, totalTime - childrenTime))
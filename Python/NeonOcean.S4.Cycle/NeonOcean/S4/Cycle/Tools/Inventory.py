@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import typing
+import weakref
+
+from NeonOcean.S4.Cycle import This
+from NeonOcean.S4.Main import Debug, Director, LoadingShared
+from NeonOcean.S4.Main.Tools import Exceptions, Patcher
+from objects import script_object
+from objects.components import inventory as ComponentsInventory
+from statistics import base_statistic, base_statistic_tracker
+
+_inventoryChangeMethodNames = (
+	"on_object_inserted",
+	"on_object_removed",
+)  # type: typing.Tuple[str, ...]
+
+_inventoryStackChangeMethodNames = (
+	"on_object_id_changed",
+)  # type: typing.Tuple[str, ...]
+
+_definitionIndexes = dict()  # type: typing.Dict[int, _DefinitionIndex]
+_statisticIndexes = dict()  # type: typing.Dict[typing.Tuple[int, int], InventoryStatisticIndex]
+_indexingAvailable = False  # type: bool
+_nextIndexVersion = 1  # type: int
+
+class _Announcer(Director.Announcer):
+	Host = This.Mod
+
+	@classmethod
+	def ZoneOnToreDown (cls, *args, **kwargs) -> None:
+		ClearIndexes()
+
+class _DefinitionIndex:
+	def __init__ (self, inventoryComponent: ComponentsInventory.InventoryComponent):
+		global _nextIndexVersion
+
+		self.InventoryReference = weakref.ref(inventoryComponent)  # type: weakref.ReferenceType
+
+		self.Version = _nextIndexVersion  # type: int  # Every index gets a new version, so the version of an inventory changes whenever its index is thrown out.
+		_nextIndexVersion += 1
+
+		indexedObjects = dict()  # type: typing.Dict[int, typing.List[script_object.ScriptObject]]
+
+		for inventoryObject in inventoryComponent:  # type: script_object.ScriptObject
+			if inventoryObject.definition is None:
+				continue
+
+			definitionObjects = indexedObjects.get(inventoryObject.definition.id, None)  # type: typing.Optional[typing.List[script_object.ScriptObject]]
+
+			if definitionObjects is None:
+				definitionObjects = list()
+				indexedObjects[inventoryObject.definition.id] = definitionObjects
+
+			definitionObjects.append(inventoryObject)
+
+		self.Objects = { definitionID: tuple(definitionObjects) for definitionID, definitionObjects in indexedObjects.items() }  # type: typing.Dict[int, typing.Tuple[script_object.ScriptObject, ...]]
+
+class _InventoryStatisticTotals:
+	def __init__ (self, definitionIndex: typing.Optional[_DefinitionIndex], objects: typing.Tuple[script_object.ScriptObject, ...]):
+		self.DefinitionIndex = definitionIndex  # type: typing.Optional[_DefinitionIndex]  # The definition index these totals were built from, once the inventory's index is thrown out these totals are out of date.
+		self.Objects = objects  # type: typing.Tuple[script_object.ScriptObject, ...]
+
+		self.TotalValue = 0  # type: int  # The sum of every positive statistic value.
+		self.UsableObjects = 0  # type: int  # The number of objects with a statistic value above 0.
+
+class InventoryStatisticIndex:
+	def __init__ (self, definitionID: int, statisticType: typing.Type[base_statistic.BaseStatistic]):
+		"""
+		Keeps track of the objects in each inventory that have a certain definition, along with the running total of a statistic across those objects. The
+		totals are updated incrementally by statistic watchers, while changes to the inventory's contents cause the inventory's totals to be rebuilt on the
+		next query. Objects without a tracker for the statistic are ignored.
+		:param definitionID: The definition id of the objects to track.
+		:type definitionID: int
+		:param statisticType: The statistic whose values are to be totalled.
+		:type statisticType: typing.Type[base_statistic.BaseStatistic]
+		"""
+
+		if not isinstance(definitionID, int):
+			raise Exceptions.IncorrectTypeException(definitionID, "definitionID", (int,))
+
+		if not isinstance(statisticType, type):
+			raise Exceptions.IncorrectTypeException(statisticType, "statisticType", (type,))
+
+		self.DefinitionID = definitionID  # type: int
+		self.StatisticType = statisticType  # type: typing.Type[base_statistic.BaseStatistic]
+
+		self._inventoryTotals = dict()  # type: typing.Dict[int, _InventoryStatisticTotals]  # Keyed by the id of the inventory component.
+		self._objectValues = dict()  # type: typing.Dict[int, int]  # The statistic value of every object we are watching, keyed by object id.
+		self._objectTotals = dict()  # type: typing.Dict[int, _InventoryStatisticTotals]  # The inventory totals each object is currently counted in, keyed by object id.
+		self._objectReferences = dict()  # type: typing.Dict[int, weakref.ReferenceType]  # Weak references to every object we are watching, keyed by object id. Their callbacks drop the object's entries once it is collected.
+		self._objectWatcherHandles = dict()  # type: typing.Dict[int, typing.Any]  # The handles of the watchers we added to each object's statistic tracker, keyed by object id.
+
+	def GetTotalValue (self, inventoryComponent: ComponentsInventory.InventoryComponent) -> int:
+		"""
+		Get the sum of the statistic values of every object in this inventory. Objects with values below 0 are not counted.
+		"""
+
+		return self._GetTotals(inventoryComponent).TotalValue
+
+	def GetUsableObject (self, inventoryComponent: ComponentsInventory.InventoryComponent) -> typing.Optional[script_object.ScriptObject]:
+		"""
+		Get the first object in this inventory with a statistic value above 0. This will return None if there is no such object.
+		"""
+
+		inventoryTotals = self._GetTotals(inventoryComponent)  # type: _InventoryStatisticTotals
+
+		if inventoryTotals.UsableObjects <= 0:
+			return None
+
+		for trackedObject in inventoryTotals.Objects:  # type: script_object.ScriptObject
+			if self._objectValues.get(trackedObject.id, 0) > 0:
+				return trackedObject
+
+		return None
+
+	def GetObjectValue (self, targetObject: script_object.ScriptObject) -> typing.Optional[int]:
+		"""
+		Get the statistic value of this object. This will return None if the object does not have a tracker for the statistic.
+		"""
+
+		objectValue = self._objectValues.get(targetObject.id, None)  # type: typing.Optional[int]
+
+		if objectValue is not None:
+			return objectValue
+
+		return self._WatchObject(targetObject)
+
+	def Clear (self) -> None:
+		"""
+		Forget every inventory and object value, and remove the watchers we added to the statistic trackers of objects that still exist.
+		"""
+
+		for objectID, watcherHandle in self._objectWatcherHandles.items():  # type: int, typing.Any
+			objectReference = self._objectReferences.get(objectID, None)  # type: typing.Optional[weakref.ReferenceType]
+			watchedObject = objectReference() if objectReference is not None else None  # type: typing.Optional[script_object.ScriptObject]
+
+			if watchedObject is None:
+				continue
+
+			statisticTracker = watchedObject.get_tracker(self.StatisticType)  # type: typing.Optional[base_statistic_tracker.BaseStatisticTracker]
+
+			if statisticTracker is not None and statisticTracker.has_watcher(watcherHandle):
+				statisticTracker.remove_watcher(watcherHandle)
+
+		self._inventoryTotals = dict()
+		self._objectValues = dict()
+		self._objectTotals = dict()
+		self._objectReferences = dict()
+		self._objectWatcherHandles = dict()
+
+	def _GetTotals (self, inventoryComponent: ComponentsInventory.InventoryComponent) -> _InventoryStatisticTotals:
+		definitionIndex = _GetDefinitionIndex(inventoryComponent)  # type: typing.Optional[_DefinitionIndex]
+		inventoryTotals = self._inventoryTotals.get(id(inventoryComponent), None)  # type: typing.Optional[_InventoryStatisticTotals]
+
+		if inventoryTotals is not None and definitionIndex is not None and inventoryTotals.DefinitionIndex is definitionIndex:
+			return inventoryTotals
+
+		if definitionIndex is not None:
+			trackedObjects = definitionIndex.Objects.get(self.DefinitionID, tuple())  # type: typing.Tuple[script_object.ScriptObject, ...]
+		else:
+			trackedObjects = GetObjectsWithDefinition(inventoryComponent, self.DefinitionID)
+
+		inventoryTotals = _InventoryStatisticTotals(definitionIndex, trackedObjects)
+
+		for trackedObject in trackedObjects:  # type: script_object.ScriptObject
+			objectValue = self.GetObjectValue(trackedObject)  # type: typing.Optional[int]
+
+			if objectValue is None:
+				continue
+
+			self._objectTotals[trackedObject.id] = inventoryTotals
+
+			if objectValue > 0:
+				inventoryTotals.TotalValue += objectValue
+				inventoryTotals.UsableObjects += 1
+
+		if definitionIndex is not None:
+			self._inventoryTotals[id(inventoryComponent)] = inventoryTotals
+
+		return inventoryTotals
+
+	def _WatchObject (self, targetObject: script_object.ScriptObject) -> typing.Optional[int]:
+		statisticTracker = targetObject.get_tracker(self.StatisticType)  # type: typing.Optional[base_statistic_tracker.BaseStatisticTracker]
+
+		if statisticTracker is None:
+			return None
+
+		targetStatistic = statisticTracker.get_statistic(self.StatisticType, add = True)  # type: typing.Optional[base_statistic.BaseStatistic]
+
+		if targetStatistic is None:
+			return None
+
+		objectValue = int(targetStatistic.get_value())  # type: int
+
+		if targetObject.id not in self._objectWatcherHandles:
+			self._objectWatcherHandles[targetObject.id] = statisticTracker.add_watcher(self._CreateStatisticWatcher(targetObject.id))
+
+		self._objectValues[targetObject.id] = objectValue
+		self._objectReferences[targetObject.id] = weakref.ref(targetObject, self._CreateObjectCollectedCallback(targetObject.id))
+
+		return objectValue
+
+	def _CreateStatisticWatcher (self, objectID: int) -> typing.Callable:
+		# Without this, we only get the statistic type, old value, and new value; we wouldn't know which object the statistic belongs to.
+
+		# noinspection PyUnusedLocal
+		def _statisticWatcher (statisticType: typing.Type[base_statistic.BaseStatistic], oldValue: float, newValue: float) -> None:
+			if statisticType is self.StatisticType:
+				self._OnObjectValueChanged(objectID, int(newValue))
+
+		return _statisticWatcher
+
+	def _CreateObjectCollectedCallback (self, objectID: int) -> typing.Callable:
+		# Objects that are destroyed while the zone is still running would otherwise keep their entries until the zone is torn down.
+
+		def _objectCollectedCallback (objectReference: weakref.ReferenceType) -> None:
+			if self._objectReferences.get(objectID, None) is not objectReference:
+				# The index was cleared since this reference was made.
+				return
+
+			# The object's statistic tracker, along with our watcher, is collected with the object, so there is no watcher left to remove.
+			self._objectReferences.pop(objectID, None)
+			self._objectWatcherHandles.pop(objectID, None)
+			self._objectValues.pop(objectID, None)
+			self._objectTotals.pop(objectID, None)
+
+		return _objectCollectedCallback
+
+	def _OnObjectValueChanged (self, objectID: int, newValue: int) -> None:
+		oldValue = self._objectValues.get(objectID, None)  # type: typing.Optional[int]
+
+		if oldValue is None:
+			# The index was cleared since the watcher was added, the object's value will be read again when it is next looked at.
+			return
+
+		self._objectValues[objectID] = newValue
+
+		objectTotals = self._objectTotals.get(objectID, None)  # type: typing.Optional[_InventoryStatisticTotals]
+
+		if objectTotals is None:
+			return
+
+		objectTotals.TotalValue += max(newValue, 0) - max(oldValue, 0)
+		objectTotals.UsableObjects += int(newValue > 0) - int(oldValue > 0)
+
+def IndexingAvailable () -> bool:
+	"""
+	Whether or not inventories can be indexed. This will be false if we could not hook into the inventory component's add and remove methods, in which case
+	every query will scan the inventory.
+	"""
+
+	return _indexingAvailable
+
+def GetObjectsWithDefinition (inventoryComponent: ComponentsInventory.InventoryComponent, definitionID: int) -> typing.Tuple[script_object.ScriptObject, ...]:
+	"""
+	Get every object in this inventory that has the specified definition id. The inventory is scanned once, after which results come from an index that
+	is thrown out whenever an object is added to, removed from, or restacked in the inventory.
+	:param inventoryComponent: The inventory to search.
+	:type inventoryComponent: ComponentsInventory.InventoryComponent
+	:param definitionID: The id of the definition the objects need to have.
+	:type definitionID: int
+	:return: The matching objects, in the order the inventory gave them to us.
+	:rtype: typing.Tuple[script_object.ScriptObject, ...]
+	"""
+
+	if not isinstance(inventoryComponent, ComponentsInventory.InventoryComponent):
+		raise Exceptions.IncorrectTypeException(inventoryComponent, "inventoryComponent", (ComponentsInventory.InventoryComponent,))
+
+	if not isinstance(definitionID, int):
+		raise Exceptions.IncorrectTypeException(definitionID, "definitionID", (int,))
+
+	if not _indexingAvailable:
+		return tuple(inventoryObject for inventoryObject in inventoryComponent if inventoryObject.definition is not None and inventoryObject.definition.id == definitionID)
+
+	return _GetDefinitionIndex(inventoryComponent).Objects.get(definitionID, tuple())
+
+def GetStatisticIndex (definitionID: int, statisticType: typing.Type[base_statistic.BaseStatistic]) -> InventoryStatisticIndex:
+	"""
+	Get the shared statistic index for objects with this definition id and statistic type, it will be created if it does not exist yet.
+	"""
+
+	if not isinstance(definitionID, int):
+		raise Exceptions.IncorrectTypeException(definitionID, "definitionID", (int,))
+
+	statisticIndexKey = (definitionID, statisticType.guid64)  # type: typing.Tuple[int, int]
+	statisticIndex = _statisticIndexes.get(statisticIndexKey, None)  # type: typing.Optional[InventoryStatisticIndex]
+
+	if statisticIndex is None:
+		statisticIndex = InventoryStatisticIndex(definitionID, statisticType)
+		_statisticIndexes[statisticIndexKey] = statisticIndex
+
+	return statisticIndex
+
+def GetInventoryVersion (inventoryComponent: ComponentsInventory.InventoryComponent) -> typing.Optional[int]:
+	"""
+	Get a number that will change whenever an object is added to, removed from, or restacked in this inventory. This can be used to tell whether values
+	derived from an inventory's contents are out of date. This will return None if inventories cannot be indexed, as we will not know when the
+	inventory has changed.
+	"""
+
+	if not isinstance(inventoryComponent, ComponentsInventory.InventoryComponent):
+		raise Exceptions.IncorrectTypeException(inventoryComponent, "inventoryComponent", (ComponentsInventory.InventoryComponent,))
+
+	definitionIndex = _GetDefinitionIndex(inventoryComponent)  # type: typing.Optional[_DefinitionIndex]
+
+	if definitionIndex is None:
+		return None
+
+	return definitionIndex.Version
+
+def InvalidateInventory (inventoryComponent: ComponentsInventory.InventoryComponent) -> None:
+	"""
+	Throw out the index of this inventory, it will be rebuilt the next time it is queried.
+	"""
+
+	definitionIndex = _definitionIndexes.get(id(inventoryComponent), None)  # type: typing.Optional[_DefinitionIndex]
+
+	if definitionIndex is not None and definitionIndex.InventoryReference() is inventoryComponent:
+		del _definitionIndexes[id(inventoryComponent)]
+
+def ClearIndexes () -> None:
+	"""
+	Throw out the index of every inventory, as well as every statistic index's totals.
+	"""
+
+	_definitionIndexes.clear()
+
+	for statisticIndex in _statisticIndexes.values():  # type: InventoryStatisticIndex
+		statisticIndex.Clear()
+
+def _GetDefinitionIndex (inventoryComponent: ComponentsInventory.InventoryComponent) -> typing.Optional[_DefinitionIndex]:
+	if not _indexingAvailable:
+		return None
+
+	definitionIndex = _definitionIndexes.get(id(inventoryComponent), None)  # type: typing.Optional[_DefinitionIndex]
+
+	if definitionIndex is None or definitionIndex.InventoryReference() is not inventoryComponent:
+		definitionIndex = _DefinitionIndex(inventoryComponent)
+		_definitionIndexes[id(inventoryComponent)] = definitionIndex
+
+	return definitionIndex
+
+def _OnStart (cause: LoadingShared.LoadingCauses) -> None:
+	global _indexingAvailable
+
+	if cause == LoadingShared.LoadingCauses.Reloading:
+		return
+
+	for methodName in _inventoryChangeMethodNames:  # type: str
+		if not hasattr(ComponentsInventory.InventoryComponent, methodName):
+			Debug.Log("Could not find the inventory component method '%s', inventories will not be indexed." % methodName, This.Mod.Namespace, Debug.LogLevels.Warning, group = This.Mod.Namespace, owner = __name__)
+			return
+
+	for methodName in _inventoryChangeMethodNames:  # type: str
+		Patcher.Patch(ComponentsInventory.InventoryComponent, methodName, _InventoryChangedPatch, patchType = Patcher.PatchTypes.After)
+
+	for methodName in _inventoryStackChangeMethodNames:  # type: str
+		if hasattr(ComponentsInventory.InventoryComponent, methodName):
+			Patcher.Patch(ComponentsInventory.InventoryComponent, methodName, _InventoryChangedPatch, patchType = Patcher.PatchTypes.After)
+
+	_indexingAvailable = True
+
+# noinspection PyUnusedLocal
+def _OnStop (cause: LoadingShared.UnloadingCauses) -> None:
+	ClearIndexes()
+
+# noinspection PyUnusedLocal
+def _InventoryChangedPatch (self: ComponentsInventory.InventoryComponent, *args, **kwargs) -> None:
+	InvalidateInventory(self)
@@ -586,3 +586,38 @@ class TunableProbability(tunable.TunableSingletonFactory):
 			description = description,
 			options = tunable.TunableList(description = "The set of options for the probability object.", tunable = TunableOption()),
 			**kwargs)
+
+def ChooseWeightedIndex (weights: typing.Sequence[typing.Union[float, int]], seed: typing.Hashable = None) -> int:
+	"""
+	Randomly select an index from a sequence of weights. This makes the same choice a probability object would make for options with these weights in
+	this order and the same seed, without needing to create an option, with a unique string identifier, for every choice.
+	:param weights: The weight of each choice. The chance an index will be chosen is its weight divided by the sum of every weight. Weights less than 0
+	are treated as 0.
+	:type weights: typing.Sequence[float | int]
+	:param seed: The seed to be used to selected an index.
+	:type seed: typing.Hashable
+	"""
+
+	if len(weights) == 0:
+		raise Exception("Cannot choose an index when no weights are available.")
+
+	weightSum = 0  # type: float
+
+	for weight in weights:  # type: typing.Union[float, int]
+		weightSum += max(weight, 0.0)
+
+	random.seed(seed)
+	indexRoll = random.random()  # type: float
+
+	testedChance = 0  # type: float
+
+	selectedIndex = 0  # type: int
+	for selectedIndex in range(len(weights)):  # type: int
+		indexChance = max(weights[selectedIndex], 0.0) / weightSum  # type: float
+
+		if indexChance + testedChance >= indexRoll:
+			break
+
+		testedChance += indexChance
+
+	return selectedIndex
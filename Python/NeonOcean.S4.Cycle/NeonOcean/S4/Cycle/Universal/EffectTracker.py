@@ -4,10 +4,11 @@ import typing
 import textwrap
 
 from NeonOcean.S4.Cycle import Events as CycleEvents, ReproductionShared, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Effects import Base as EffectsBase, Types as EffectsTypes
 from NeonOcean.S4.Cycle.Universal import Shared as UniversalShared
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Types, Version
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Types, Version
 from sims import sim_info
 
 class EffectTracker(ReproductionShared.TrackerBase):
@@ -71,6 +72,16 @@ class EffectTracker(ReproductionShared.TrackerBase):
 
 		return list(self._activeEffects)
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return ReproductionShared.TrackerDependencies.Nothing
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -151,24 +162,10 @@ class EffectTracker(ReproductionShared.TrackerBase):
 		self._NotifyEffectRemoved(removingEffect)
 
 	def _NotifyEffectAdded (self, addedEffect: EffectsBase.EffectBase) -> None:
-		eventArguments = CycleEvents.EffectAddedArguments(addedEffect)  # type: CycleEvents.EffectAddedArguments
-
-		for effectAddedCallback in self.EffectAddedEvent:
-			try:
-				effectAddedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call effect added callback '" + Types.GetFullName(effectAddedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = effectAddedCallback)
+		EventsDispatch.DispatchLazily("EffectTracker.EffectAddedEvent", self.EffectAddedEvent, self, self.TrackingSystem, CycleEvents.EffectAddedArguments, addedEffect)
 
 	def _NotifyEffectRemoved (self, removedEffect: EffectsBase.EffectBase) -> None:
-		eventArguments = CycleEvents.EffectRemovedArguments(removedEffect)  # type: CycleEvents.EffectRemovedArguments
-
-		for effectRemovedCallback in self.EffectRemovedEvent:
-			try:
-				effectRemovedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call effect removed callback '" + Types.GetFullName(effectRemovedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = effectRemovedCallback)
+		EventsDispatch.DispatchLazily("EffectTracker.EffectRemovedEvent", self.EffectRemovedEvent, self, self.TrackingSystem, CycleEvents.EffectRemovedArguments, removedEffect)
 
 	def _AddMissingEffects (self) -> None:
 		activeTypeIdentifiers = set(effect.TypeIdentifier for effect in self.ActiveEffects)  # type: typing.Set[str]
@@ -225,8 +222,8 @@ class EffectTracker(ReproductionShared.TrackerBase):
 			ReproductionShared.SimulationPhase(-15, self._EffectSimulationPhase)
 		)
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return UniversalShared.GetEffectTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return UniversalShared.GetEffectTrackerReproductiveTimeMultiplier(multipliers)
 
 	def _LoadFromDictionaryInternal (self, data: dict, lastVersion: typing.Optional[Version.Version]) -> bool:
 		superOperationSuccessful = super()._LoadFromDictionaryInternal(data, lastVersion)  # type: bool
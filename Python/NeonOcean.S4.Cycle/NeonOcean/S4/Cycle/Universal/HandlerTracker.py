@@ -3,10 +3,11 @@ from __future__ import annotations
 import typing
 
 from NeonOcean.S4.Cycle import Events as CycleEvents, ReproductionShared, This
+from NeonOcean.S4.Cycle.Events import Dispatch as EventsDispatch
 from NeonOcean.S4.Cycle.Handlers import Base as HandlersBase, Types as HandlersTypes
 from NeonOcean.S4.Cycle.Universal import Shared as UniversalShared
 from NeonOcean.S4.Main import Debug
-from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Python, Savable, Types, Version
+from NeonOcean.S4.Main.Tools import Classes, Events, Exceptions, Savable, Types, Version
 from sims import sim_info
 
 class HandlerTracker(ReproductionShared.TrackerBase):
@@ -87,6 +88,16 @@ class HandlerTracker(ReproductionShared.TrackerBase):
 
 		return list(self._activeHandlers)
 
+	# noinspection PyMethodParameters
+	@Classes.ClassProperty
+	def ShouldHaveDependencies (cls) -> ReproductionShared.TrackerDependencies:
+		"""
+		The parts of the game's state that this tracker type's 'ShouldHave' method depends on. Reproductive systems will only ask whether they should have
+		this tracker again when one of these parts changes.
+		"""
+
+		return ReproductionShared.TrackerDependencies.Nothing
+
 	@classmethod
 	def ShouldHave (cls, targetSimInfo: sim_info.SimInfo, targetSystem: ReproductionShared.ReproductiveSystem) -> bool:
 		"""
@@ -151,24 +162,10 @@ class HandlerTracker(ReproductionShared.TrackerBase):
 		self._NotifyHandlerRemoved(removingHandler)
 
 	def _NotifyHandlerAdded (self, addedHandler: HandlersBase.HandlerBase) -> None:
-		eventArguments = CycleEvents.HandlerAddedArguments(addedHandler)  # type: CycleEvents.HandlerAddedArguments
-
-		for handlerAddedCallback in self.HandlerAddedEvent:
-			try:
-				handlerAddedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call handler added callback '" + Types.GetFullName(handlerAddedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = handlerAddedCallback)
+		EventsDispatch.DispatchLazily("HandlerTracker.HandlerAddedEvent", self.HandlerAddedEvent, self, self.TrackingSystem, CycleEvents.HandlerAddedArguments, addedHandler)
 
 	def _NotifyHandlerRemoved (self, removedHandler: HandlersBase.HandlerBase) -> None:
-		eventArguments = CycleEvents.HandlerRemovedArguments(removedHandler)  # type: CycleEvents.HandlerRemovedArguments
-
-		for handlerRemovedCallback in self.HandlerRemovedEvent:
-			try:
-				handlerRemovedCallback(self, eventArguments)
-			except:
-				Debug.Log("Failed to call handler removed callback '" + Types.GetFullName(handlerRemovedCallback) + "'.\n" + self.TrackingSystem.DebugInformation,
-						  This.Mod.Namespace, Debug.LogLevels.Exception, group = This.Mod.Namespace, owner = __name__, lockIdentifier = __name__ + ":" + str(Python.GetLineNumber()), lockReference = handlerRemovedCallback)
+		EventsDispatch.DispatchLazily("HandlerTracker.HandlerRemovedEvent", self.HandlerRemovedEvent, self, self.TrackingSystem, CycleEvents.HandlerRemovedArguments, removedHandler)
 
 	def _AddMissingHandlers (self) -> None:
 		activeTypeIdentifiers = set(handler.TypeIdentifier for handler in self.ActiveHandlers)  # type: typing.Set[str]
@@ -203,8 +200,8 @@ class HandlerTracker(ReproductionShared.TrackerBase):
 
 			activeHandlerIndex += 1
 
-	def _GetNextReproductiveTimeMultiplier (self) -> float:
-		return UniversalShared.GetHandlerTrackerReproductiveTimeMultiplier()
+	def _GetNextReproductiveTimeMultiplier (self, multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+		return UniversalShared.GetHandlerTrackerReproductiveTimeMultiplier(multipliers)
 
 	# noinspection PyUnusedLocal
 	def _HandlerSimulationPhase (self, simulation: ReproductionShared.Simulation, ticks: int) -> None:
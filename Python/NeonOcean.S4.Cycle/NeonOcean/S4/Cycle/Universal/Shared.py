@@ -1,11 +1,12 @@
+import typing
 
 from NeonOcean.S4.Cycle import ReproductionShared
 
 EffectTrackerIdentifier = "EffectTracker"  # type: str
 HandlerTrackerIdentifier = "HandlerTracker"  # type: str
 
-def GetEffectTrackerReproductiveTimeMultiplier () -> float:
-	return ReproductionShared.GetGeneralReproductiveTimeMultiplier()
+def GetEffectTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	return ReproductionShared.GetGeneralReproductiveTimeMultiplier(multipliers)
 
-def GetHandlerTrackerReproductiveTimeMultiplier () -> float:
-	return ReproductionShared.GetGeneralReproductiveTimeMultiplier()
\ No newline at end of file
+def GetHandlerTrackerReproductiveTimeMultiplier (multipliers: typing.Optional[ReproductionShared.ReproductiveTimeMultipliers] = None) -> float:
+	return ReproductionShared.GetGeneralReproductiveTimeMultiplier(multipliers)
\ No newline at end of file
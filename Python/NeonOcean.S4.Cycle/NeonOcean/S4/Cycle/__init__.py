@@ -1 +1,7 @@
-pass
+import os as _os
+
+# Import profiling is off unless this environment variable is set to 1 before the game starts, otherwise the modules are imported normally.
+if _os.environ.get("NEONOCEAN_S4_CYCLE_PROFILE_IMPORTS", "") == "1":
+	from NeonOcean.S4.Cycle.Tools import ImportProfiler as _ImportProfiler
+
+	_ImportProfiler.StartImportProfiling("NeonOcean.S4.Cycle")